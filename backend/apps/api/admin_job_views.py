@@ -0,0 +1,93 @@
+"""
+Admin views for background jobs (imports, exports, recomputes).
+
+GET  /api/admin/jobs/                 — list (filter by ?status= / ?kind=)
+POST /api/admin/jobs/                 — enqueue {kind, params[, file]}
+GET  /api/admin/jobs/{id}/            — status, progress and result
+POST /api/admin/jobs/{id}/cancel/     — cancel a job that has not started
+GET  /api/admin/jobs/{id}/download/   — the job's result file
+
+Jobs run on Celery when a broker is configured, otherwise on a
+`manage.py run_jobs` worker; see apps.core.services.jobs.
+"""
+
+import json
+
+from apps.api.admin_views import IsAdminUser
+from apps.api.utils.jobs import job_accepted, serialize_job
+from apps.api.utils.pagination import KeysetPaginator
+from apps.core.models import Job
+from apps.core.services import jobs
+from django.http import FileResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+
+class AdminJobViewSet(viewsets.ViewSet):
+    permission_classes = [IsAdminUser]
+    keyset_paginator = KeysetPaginator(ordering=("-created_at", "-id"))
+
+    def list(self, request):
+        qs = Job.objects.all()
+        if request.query_params.get("status"):
+            qs = qs.filter(status=request.query_params["status"])
+        if request.query_params.get("kind"):
+            qs = qs.filter(kind=request.query_params["kind"])
+        return self.keyset_paginator.get_response(
+            request, qs, lambda job: serialize_job(job, request)
+        )
+
+    def retrieve(self, request, pk=None):
+        job = get_object_or_404(Job, pk=pk)
+        return Response(serialize_job(job, request))
+
+    def create(self, request):
+        kind = request.data.get("kind")
+        if kind not in jobs.job_kinds():
+            return Response(
+                {"error": f"kind must be one of: {', '.join(jobs.job_kinds())}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        params = request.data.get("params") or {}
+        if isinstance(params, str):
+            # Multipart uploads carry params as a JSON-encoded form field.
+            try:
+                params = json.loads(params)
+            except ValueError:
+                params = None
+        if not isinstance(params, dict):
+            return Response(
+                {"error": "params must be a JSON object"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        job = jobs.enqueue(
+            kind, params, user=request.user, input_file=request.FILES.get("file")
+        )
+        return job_accepted(job, request)
+
+    @action(detail=True, methods=["post"])
+    def cancel(self, request, pk=None):
+        job = get_object_or_404(Job, pk=pk)
+        if not jobs.cancel(job):
+            return Response(
+                {"error": f"Job is {job.status} and can no longer be cancelled"},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(serialize_job(job, request))
+
+    @action(detail=True, methods=["get"])
+    def download(self, request, pk=None):
+        job = get_object_or_404(Job, pk=pk)
+        if not job.result_file:
+            return Response(
+                {"error": "Job has no result file"}, status=status.HTTP_404_NOT_FOUND
+            )
+        return FileResponse(
+            job.result_file.open("rb"),
+            as_attachment=True,
+            filename=job.result_file.name.rsplit("/", 1)[-1],
+        )
@@ -3,11 +3,16 @@ Admin monitoring views — Teacher Sessions, Teacher Tasks, Student Attendance.
 
 All endpoints require admin role.
 Supports filtering by school, teacher, status, and date range.
+List endpoints use keyset pagination: pass the previous page's `next_cursor`
+as `?cursor=`; add `?total=exact|estimate` to include a row count.
 """
 
 import calendar
 from datetime import date, timedelta
 
+from apps.api.utils.cache import swr_cache
+from apps.api.utils.export import ExportColumn, stream_export
+from apps.api.utils.pagination import KeysetPaginator
 from apps.core.models import Attendance, Learner, School, Session, TeacherTask
 from django.contrib.auth import get_user_model
 from django.db.models import Count, Q
@@ -78,86 +83,191 @@ def _serialize_attendance(a):
     }
 
 
+# Query params that shape each monitor's result set; summary caches key on
+# these only, so unrelated params (cursor, page_size) share one entry.
+SESSION_FILTER_PARAMS = ("school", "teacher", "status", "date_from", "date_to")
+TASK_FILTER_PARAMS = ("teacher", "status", "priority")
+ATTENDANCE_FILTER_PARAMS = (
+    "school", "teacher", "status", "date_from", "date_to", "learner",
+)
+
+
+def _summary_qs(qs):
+    """Strip list-only joins and ordering before aggregating."""
+    return qs.select_related(None).order_by()
+
+
+def _status_counts(values, field="status"):
+    """`Count(filter=...)` kwargs for each value, named `<field>_<value>`."""
+    return {
+        f"{field}_{value}": Count("id", filter=Q(**{field: value}))
+        for value in values
+    }
+
+
+def _pop_group(counts, field):
+    prefix = f"{field}_"
+    return {
+        key[len(prefix):]: n for key, n in counts.items() if key.startswith(prefix)
+    }
+
+
+SESSION_EXPORT_COLUMNS = [
+    ExportColumn("ID", "id"),
+    ExportColumn("Date", "date"),
+    ExportColumn("Start Time", "start_time"),
+    ExportColumn("End Time", "end_time"),
+    ExportColumn("School", "tenant__name", key="school"),
+    ExportColumn("Teacher", "teacher__username", key="teacher"),
+    ExportColumn("Module", "module__name", key="module"),
+    ExportColumn("Pathway", "module__course__name", key="pathway"),
+    ExportColumn("Status", "status"),
+    ExportColumn("Attendance Marked", "attendance_marked"),
+    ExportColumn("Created At", "created_at"),
+]
+
+ATTENDANCE_EXPORT_COLUMNS = [
+    ExportColumn("ID", "id"),
+    ExportColumn("Session Date", "session__date", key="session_date"),
+    ExportColumn("Session ID", "session_id"),
+    ExportColumn("Learner ID", "learner_id"),
+    ExportColumn("First Name", "learner__first_name", key="first_name"),
+    ExportColumn("Last Name", "learner__last_name", key="last_name"),
+    ExportColumn("School", "session__tenant__name", key="school"),
+    ExportColumn("Teacher", "session__teacher__username", key="teacher"),
+    ExportColumn("Module", "session__module__name", key="module"),
+    ExportColumn("Status", "status"),
+    ExportColumn("Marked At", "marked_at"),
+]
+
+
+def session_queryset(params):
+    qs = (
+        Session.objects
+        .select_related("module__course", "teacher", "tenant")
+        .order_by("-date", "-created_at")
+    )
+    school_id = params.get("school")
+    if school_id:
+        qs = qs.filter(tenant_id=school_id)
+
+    teacher_id = params.get("teacher")
+    if teacher_id:
+        qs = qs.filter(teacher_id=teacher_id)
+
+    status = params.get("status")
+    if status:
+        qs = qs.filter(status=status)
+
+    date_from = params.get("date_from")
+    if date_from:
+        qs = qs.filter(date__gte=date_from)
+
+    date_to = params.get("date_to")
+    if date_to:
+        qs = qs.filter(date__lte=date_to)
+
+    return qs
+
+
+def attendance_queryset(params):
+    qs = (
+        Attendance.objects
+        .select_related("learner", "session__module__course", "session__teacher", "session__tenant")
+        .order_by("-session__date")
+    )
+    school_id = params.get("school")
+    if school_id:
+        qs = qs.filter(session__tenant_id=school_id)
+
+    teacher_id = params.get("teacher")
+    if teacher_id:
+        qs = qs.filter(session__teacher_id=teacher_id)
+
+    status = params.get("status")
+    if status:
+        qs = qs.filter(status=status)
+
+    date_from = params.get("date_from")
+    if date_from:
+        qs = qs.filter(session__date__gte=date_from)
+
+    date_to = params.get("date_to")
+    if date_to:
+        qs = qs.filter(session__date__lte=date_to)
+
+    learner_id = params.get("learner")
+    if learner_id:
+        qs = qs.filter(learner_id=learner_id)
+
+    return qs
+
+
 # ─── ViewSets ─────────────────────────────────────────────────────────────────
 
 class AdminSessionMonitorViewSet(viewsets.ViewSet):
     """
     Admin monitoring of all teacher sessions across all schools.
 
-    GET /api/admin/monitor/sessions/        — list (filterable)
+    GET /api/admin/monitor/sessions/        — list (filterable, keyset-paginated)
     GET /api/admin/monitor/sessions/summary/ — headline stats
+    GET /api/admin/monitor/sessions/export/  — streamed CSV/NDJSON (same filters)
     """
 
     permission_classes = [IsAdminUser]
+    keyset_paginator = KeysetPaginator(ordering=("-date", "-created_at", "-id"))
 
     def _get_qs(self, request):
-        qs = (
-            Session.objects
-            .select_related("module__course", "teacher", "tenant")
-            .order_by("-date", "-created_at")
-        )
-        school_id = request.query_params.get("school")
-        if school_id:
-            qs = qs.filter(tenant_id=school_id)
-
-        teacher_id = request.query_params.get("teacher")
-        if teacher_id:
-            qs = qs.filter(teacher_id=teacher_id)
-
-        status = request.query_params.get("status")
-        if status:
-            qs = qs.filter(status=status)
-
-        date_from = request.query_params.get("date_from")
-        if date_from:
-            qs = qs.filter(date__gte=date_from)
-
-        date_to = request.query_params.get("date_to")
-        if date_to:
-            qs = qs.filter(date__lte=date_to)
-
-        return qs
+        return session_queryset(request.query_params)
 
     def list(self, request):
-        qs = self._get_qs(request)
-        page_size = int(request.query_params.get("page_size", 50))
-        offset = int(request.query_params.get("offset", 0))
-        total = qs.count()
-        sessions = qs[offset: offset + page_size]
-        return Response({
-            "total": total,
-            "results": [_serialize_session(s) for s in sessions],
-        })
+        return self.keyset_paginator.get_response(
+            request, self._get_qs(request), _serialize_session
+        )
 
     @action(detail=False, methods=["get"])
+    def export(self, request):
+        return stream_export(
+            request,
+            self._get_qs(request),
+            SESSION_EXPORT_COLUMNS,
+            "sessions",
+            dataset="sessions",
+        )
+
+    @action(detail=False, methods=["get"])
+    @swr_cache(soft_ttl=60, hard_ttl=900, params=SESSION_FILTER_PARAMS)
     def summary(self, request):
         today = date.today()
         week_start = today - timedelta(days=today.weekday())
+        week_end = week_start + timedelta(days=6)
         month_start = today.replace(day=1)
         month_last = calendar.monthrange(today.year, today.month)[1]
         month_end = today.replace(day=month_last)
 
-        qs = Session.objects.all()
-        school_id = request.query_params.get("school")
-        if school_id:
-            qs = qs.filter(tenant_id=school_id)
+        counts = _summary_qs(self._get_qs(request)).aggregate(
+            today=Count("id", filter=Q(date=today)),
+            this_week=Count("id", filter=Q(date__gte=week_start, date__lte=week_end)),
+            this_month=Count("id", filter=Q(date__gte=month_start, date__lte=month_end)),
+            total=Count("id"),
+            **_status_counts(("scheduled", "in_progress", "completed", "cancelled")),
+            attendance_pending=Count(
+                "id",
+                filter=Q(
+                    status__in=["in_progress", "completed"],
+                    attendance_marked=False,
+                    date__lte=today,
+                ),
+            ),
+        )
 
         return Response({
-            "today": qs.filter(date=today).count(),
-            "this_week": qs.filter(date__gte=week_start, date__lte=today + timedelta(days=6 - today.weekday())).count(),
-            "this_month": qs.filter(date__gte=month_start, date__lte=month_end).count(),
-            "total": qs.count(),
-            "by_status": {
-                "scheduled":   qs.filter(status="scheduled").count(),
-                "in_progress": qs.filter(status="in_progress").count(),
-                "completed":   qs.filter(status="completed").count(),
-                "cancelled":   qs.filter(status="cancelled").count(),
-            },
-            "attendance_pending": qs.filter(
-                status__in=["in_progress", "completed"],
-                attendance_marked=False,
-                date__lte=today,
-            ).count(),
+            "today": counts["today"],
+            "this_week": counts["this_week"],
+            "this_month": counts["this_month"],
+            "total": counts["total"],
+            "by_status": _pop_group(counts, "status"),
+            "attendance_pending": counts["attendance_pending"],
         })
 
 
@@ -165,11 +275,12 @@ class AdminTaskMonitorViewSet(viewsets.ViewSet):
     """
     Admin monitoring of all teacher tasks.
 
-    GET /api/admin/monitor/tasks/         — list (filterable)
+    GET /api/admin/monitor/tasks/         — list (filterable, keyset-paginated)
     GET /api/admin/monitor/tasks/summary/ — headline stats
     """
 
     permission_classes = [IsAdminUser]
+    keyset_paginator = KeysetPaginator(ordering=("-created_at", "-id"))
 
     def _get_qs(self, request):
         qs = TeacherTask.objects.select_related("teacher").order_by("-created_at")
@@ -189,40 +300,29 @@ class AdminTaskMonitorViewSet(viewsets.ViewSet):
         return qs
 
     def list(self, request):
-        qs = self._get_qs(request)
-        page_size = int(request.query_params.get("page_size", 50))
-        offset = int(request.query_params.get("offset", 0))
-        total = qs.count()
-        tasks = qs[offset: offset + page_size]
-        return Response({
-            "total": total,
-            "results": [_serialize_task(t) for t in tasks],
-        })
+        return self.keyset_paginator.get_response(
+            request, self._get_qs(request), _serialize_task
+        )
 
     @action(detail=False, methods=["get"])
+    @swr_cache(soft_ttl=60, hard_ttl=900, params=TASK_FILTER_PARAMS)
     def summary(self, request):
-        qs = TeacherTask.objects.all()
-        teacher_id = request.query_params.get("teacher")
-        if teacher_id:
-            qs = qs.filter(teacher_id=teacher_id)
-
         today = date.today()
-        overdue = qs.filter(due_date__lt=today, status__in=["todo", "in_progress"]).count()
+        counts = _summary_qs(self._get_qs(request)).aggregate(
+            total=Count("id"),
+            **_status_counts(("todo", "in_progress", "done")),
+            **_status_counts(("urgent", "high", "medium", "low"), field="priority"),
+            overdue=Count(
+                "id",
+                filter=Q(due_date__lt=today, status__in=["todo", "in_progress"]),
+            ),
+        )
 
         return Response({
-            "total": qs.count(),
-            "by_status": {
-                "todo":        qs.filter(status="todo").count(),
-                "in_progress": qs.filter(status="in_progress").count(),
-                "done":        qs.filter(status="done").count(),
-            },
-            "by_priority": {
-                "urgent": qs.filter(priority="urgent").count(),
-                "high":   qs.filter(priority="high").count(),
-                "medium": qs.filter(priority="medium").count(),
-                "low":    qs.filter(priority="low").count(),
-            },
-            "overdue": overdue,
+            "total": counts["total"],
+            "by_status": _pop_group(counts, "status"),
+            "by_priority": _pop_group(counts, "priority"),
+            "overdue": counts["overdue"],
         })
 
 
@@ -230,79 +330,49 @@ class AdminAttendanceMonitorViewSet(viewsets.ViewSet):
     """
     Admin monitoring of student attendance across all schools.
 
-    GET /api/admin/monitor/attendance/         — list (filterable)
+    GET /api/admin/monitor/attendance/         — list (filterable, keyset-paginated)
     GET /api/admin/monitor/attendance/summary/ — headline stats
+    GET /api/admin/monitor/attendance/export/  — streamed CSV/NDJSON (same filters)
     """
 
     permission_classes = [IsAdminUser]
+    keyset_paginator = KeysetPaginator(ordering=("-session__date", "-marked_at", "-id"))
 
     def _get_qs(self, request):
-        qs = (
-            Attendance.objects
-            .select_related("learner", "session__module__course", "session__teacher", "session__tenant")
-            .order_by("-session__date")
-        )
-        school_id = request.query_params.get("school")
-        if school_id:
-            qs = qs.filter(session__tenant_id=school_id)
-
-        teacher_id = request.query_params.get("teacher")
-        if teacher_id:
-            qs = qs.filter(session__teacher_id=teacher_id)
-
-        status = request.query_params.get("status")
-        if status:
-            qs = qs.filter(status=status)
-
-        date_from = request.query_params.get("date_from")
-        if date_from:
-            qs = qs.filter(session__date__gte=date_from)
-
-        date_to = request.query_params.get("date_to")
-        if date_to:
-            qs = qs.filter(session__date__lte=date_to)
-
-        learner_id = request.query_params.get("learner")
-        if learner_id:
-            qs = qs.filter(learner_id=learner_id)
-
-        return qs
+        return attendance_queryset(request.query_params)
 
     def list(self, request):
-        qs = self._get_qs(request)
-        page_size = int(request.query_params.get("page_size", 50))
-        offset = int(request.query_params.get("offset", 0))
-        total = qs.count()
-        records = qs[offset: offset + page_size]
-        return Response({
-            "total": total,
-            "results": [_serialize_attendance(a) for a in records],
-        })
+        return self.keyset_paginator.get_response(
+            request, self._get_qs(request), _serialize_attendance
+        )
 
     @action(detail=False, methods=["get"])
-    def summary(self, request):
-        qs = Attendance.objects.all()
-        school_id = request.query_params.get("school")
-        if school_id:
-            qs = qs.filter(session__tenant_id=school_id)
+    def export(self, request):
+        return stream_export(
+            request,
+            self._get_qs(request),
+            ATTENDANCE_EXPORT_COLUMNS,
+            "attendance",
+            dataset="attendance",
+        )
 
-        total = qs.count()
-        present = qs.filter(status="present").count()
-        absent  = qs.filter(status="absent").count()
-        late    = qs.filter(status="late").count()
+    @action(detail=False, methods=["get"])
+    @swr_cache(soft_ttl=60, hard_ttl=900, params=ATTENDANCE_FILTER_PARAMS)
+    def summary(self, request):
+        month_start = date.today().replace(day=1)
+        counts = _summary_qs(self._get_qs(request)).aggregate(
+            total=Count("id"),
+            this_month=Count("id", filter=Q(session__date__gte=month_start)),
+            **_status_counts(("present", "absent", "late")),
+        )
 
+        total = counts["total"]
+        present = counts["status_present"]
         rate = round(present / total * 100, 1) if total else 0
 
-        today = date.today()
-        month_start = today.replace(day=1)
-
         return Response({
             "total": total,
-            "this_month": qs.filter(session__date__gte=month_start).count(),
-            "by_status": {
-                "present": present,
-                "absent":  absent,
-                "late":    late,
-            },
+            "this_month": counts["this_month"],
+            "by_status": _pop_group(counts, "status"),
             "overall_attendance_rate": rate,
         })
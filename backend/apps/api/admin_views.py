@@ -9,8 +9,7 @@ Security:
 """
 
 import csv
-from datetime import datetime, timedelta
-from io import StringIO
+from datetime import timedelta
 
 from apps.api.permissions import IsLeader
 from apps.api.serializers import (
@@ -19,21 +18,21 @@ from apps.api.serializers import (
     TenantSerializer,
     UserSerializer,
 )
+from apps.api.utils.cache import swr_cache
+from apps.api.utils.export import ExportColumn, minutes, stream_export, yes_no
+from apps.api.utils.jobs import job_accepted, wants_async
 from apps.core.models import (
-    Activity,
     Artifact,
-    Attendance,
-    Course,
     Learner,
     LearnerCourseEnrollment,
-    Module,
     School,
     Session,
 )
+from apps.core.services import counters, jobs, rollups, user_import
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models import Avg, Count, DateField, Q
-from django.db.models.functions import TruncDate
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -50,6 +49,80 @@ class IsAdminUser(IsAuthenticated):
         return super().has_permission(request, view) and request.user.role == "admin"
 
 
+USER_EXPORT_COLUMNS = [
+    ExportColumn("ID", "id"),
+    ExportColumn("Username", "username"),
+    ExportColumn("Email", "email"),
+    ExportColumn("First Name", "first_name"),
+    ExportColumn("Last Name", "last_name"),
+    ExportColumn("Role", "role"),
+    ExportColumn("School", "tenant__name", key="school"),
+    ExportColumn("Active", "is_active", csv=yes_no),
+    ExportColumn("Date Joined", "date_joined", csv=minutes),
+    ExportColumn("Last Login", "last_login", csv=minutes),
+]
+
+ENROLLMENT_EXPORT_COLUMNS = [
+    ExportColumn("ID", "id"),
+    ExportColumn("Learner ID", "learner_id"),
+    ExportColumn("First Name", "learner__first_name", key="first_name"),
+    ExportColumn("Last Name", "learner__last_name", key="last_name"),
+    ExportColumn("School", "learner__tenant__name", key="school"),
+    ExportColumn("Course", "course__name", key="course"),
+    ExportColumn("Current Level", "current_level__name", key="current_level"),
+    ExportColumn("Active", "is_active", csv=yes_no),
+    ExportColumn("Enrolled At", "enrolled_at", csv=minutes),
+    ExportColumn("Completed At", "completed_at", csv=minutes),
+]
+
+ARTIFACT_EXPORT_COLUMNS = [
+    ExportColumn("ID", "id"),
+    ExportColumn("Title", "title"),
+    ExportColumn("Learner ID", "learner_id"),
+    ExportColumn("First Name", "learner__first_name", key="first_name"),
+    ExportColumn("Last Name", "learner__last_name", key="last_name"),
+    ExportColumn("School", "tenant__name", key="school"),
+    ExportColumn("Module", "module__name", key="module"),
+    ExportColumn("Status", "status"),
+    ExportColumn("Student Upload", "uploaded_by_student", csv=yes_no),
+    ExportColumn("Created By", "created_by__username", key="created_by"),
+    ExportColumn("Submitted At", "submitted_at", csv=minutes),
+    ExportColumn("Reviewed At", "reviewed_at", csv=minutes),
+]
+
+
+def filter_users(queryset, params):
+    """Apply the admin user-list filters in `params` (a query-param mapping)."""
+    # Filter by role
+    role = params.get("role")
+    if role:
+        queryset = queryset.filter(role=role)
+
+    # Filter by active status
+    is_active = params.get("is_active")
+    if is_active is not None:
+        queryset = queryset.filter(is_active=is_active.lower() == "true")
+
+    # Filter by school (legacy param name: tenant)
+    school_id = params.get("school") or params.get("tenant")
+    if school_id:
+        queryset = queryset.filter(
+            Q(tenant_id=school_id) | Q(teacher_schools__id=school_id)
+        ).distinct()
+
+    # Search
+    search = params.get("search")
+    if search:
+        queryset = queryset.filter(
+            Q(username__icontains=search)
+            | Q(email__icontains=search)
+            | Q(first_name__icontains=search)
+            | Q(last_name__icontains=search)
+        )
+
+    return queryset
+
+
 class AdminUserViewSet(viewsets.ModelViewSet):
     """
     Admin viewset for user management.
@@ -60,8 +133,8 @@ class AdminUserViewSet(viewsets.ModelViewSet):
     - GET /api/admin/users/{id}/ - Get user details
     - PUT /api/admin/users/{id}/ - Update user
     - DELETE /api/admin/users/{id}/ - Deactivate user
-    - POST /api/admin/users/bulk-import/ - Bulk import users
-    - GET /api/admin/users/export/ - Export users to CSV
+    - POST /api/admin/users/bulk-import/ - Bulk import users (dry_run, async)
+    - GET /api/admin/users/export/ - Export users (streamed CSV or NDJSON)
     """
 
     queryset = (
@@ -78,38 +151,7 @@ class AdminUserViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filter queryset based on query params."""
-        queryset = super().get_queryset()
-
-        # Filter by role
-        role = self.request.query_params.get("role")
-        if role:
-            queryset = queryset.filter(role=role)
-
-        # Filter by active status
-        is_active = self.request.query_params.get("is_active")
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == "true")
-
-        # Filter by school (legacy param name: tenant)
-        school_id = self.request.query_params.get(
-            "school"
-        ) or self.request.query_params.get("tenant")
-        if school_id:
-            queryset = queryset.filter(
-                Q(tenant_id=school_id) | Q(teacher_schools__id=school_id)
-            ).distinct()
-
-        # Search
-        search = self.request.query_params.get("search")
-        if search:
-            queryset = queryset.filter(
-                Q(username__icontains=search)
-                | Q(email__icontains=search)
-                | Q(first_name__icontains=search)
-                | Q(last_name__icontains=search)
-            )
-
-        return queryset
+        return filter_users(super().get_queryset(), self.request.query_params)
 
     @transaction.atomic
     def perform_create(self, serializer):
@@ -135,7 +177,7 @@ class AdminUserViewSet(viewsets.ModelViewSet):
             instance.save()
         # TODO: Add audit log
 
-    @action(detail=False, methods=["post"])
+    @action(detail=False, methods=["post"], url_path="bulk-import")
     def bulk_import(self, request):
         """
         Bulk import users from CSV.
@@ -143,6 +185,10 @@ class AdminUserViewSet(viewsets.ModelViewSet):
         Expected CSV format:
         username,email,first_name,last_name,role,school_id,password
         Legacy supported column: tenant_id
+
+        Pass dry_run=true (form field or query param) to validate the file
+        and report errors without creating anything. Pass async=true to run
+        the import as a background job (202 + job to poll).
         """
         csv_file = request.FILES.get("file")
         if not csv_file:
@@ -155,120 +201,43 @@ class AdminUserViewSet(viewsets.ModelViewSet):
                 {"error": "File must be CSV format"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            decoded_file = csv_file.read().decode("utf-8")
-            io_string = StringIO(decoded_file)
-            reader = csv.DictReader(io_string)
-
-            created_count = 0
-            errors = []
-
-            with transaction.atomic():
-                for row_num, row in enumerate(reader, start=2):
-                    try:
-                        # Validate required fields
-                        required_fields = ["username", "email", "role"]
-                        missing_fields = [f for f in required_fields if not row.get(f)]
-                        if missing_fields:
-                            errors.append(
-                                f"Row {row_num}: Missing fields {missing_fields}"
-                            )
-                            continue
-
-                        # Create user
-                        user_data = {
-                            "username": row["username"],
-                            "email": row["email"],
-                            "first_name": row.get("first_name", ""),
-                            "last_name": row.get("last_name", ""),
-                            "role": row["role"],
-                        }
-
-                        school_id = row.get("school_id") or row.get("tenant_id")
-                        if school_id:
-                            try:
-                                tenant = School.objects.get(id=school_id)
-                                user_data["tenant"] = tenant
-                            except School.DoesNotExist:
-                                errors.append(
-                                    f"Row {row_num}: School {school_id} not found"
-                                )
-                                continue
-
-                        user = User.objects.create_user(**user_data)
-
-                        # Set password if provided
-                        if row.get("password"):
-                            user.set_password(row["password"])
-                            user.save()
-
-                        created_count += 1
-
-                    except Exception as e:
-                        errors.append(f"Row {row_num}: {str(e)}")
+        dry_run = str(
+            request.data.get("dry_run", request.query_params.get("dry_run", ""))
+        ).lower() in ("1", "true", "yes")
 
-            return Response(
-                {"success": True, "created": created_count, "errors": errors}
+        if wants_async(request):
+            job = jobs.enqueue(
+                "users.import",
+                {"dry_run": dry_run},
+                user=request.user,
+                input_file=csv_file,
             )
+            return job_accepted(job, request)
 
-        except Exception as e:
+        try:
+            result = user_import.import_users(csv_file, dry_run=dry_run)
+        except (UnicodeDecodeError, csv.Error) as e:
             return Response(
                 {"error": f"Failed to process file: {str(e)}"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-    @action(detail=False, methods=["get"])
-    def export(self, request):
-        """Export users to CSV."""
-        users = self.get_queryset()
-
-        # Create CSV
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
-            [
-                "ID",
-                "Username",
-                "Email",
-                "First Name",
-                "Last Name",
-                "Role",
-                "School",
-                "Active",
-                "Date Joined",
-                "Last Login",
-            ]
+        return Response(
+            {
+                "success": True,
+                "dry_run": result.dry_run,
+                "created": result.created,
+                "valid": result.valid,
+                "errors": result.errors,
+            }
         )
 
-        # Write data
-        for user in users:
-            writer.writerow(
-                [
-                    str(user.id),
-                    user.username,
-                    user.email,
-                    user.first_name,
-                    user.last_name,
-                    user.role,
-                    user.tenant.name if user.tenant else "",
-                    "Yes" if user.is_active else "No",
-                    user.date_joined.strftime("%Y-%m-%d %H:%M"),
-                    (
-                        user.last_login.strftime("%Y-%m-%d %H:%M")
-                        if user.last_login
-                        else ""
-                    ),
-                ]
-            )
-
-        # Create response
-        response = Response(output.getvalue(), content_type="text/csv")
-        response["Content-Disposition"] = (
-            f'attachment; filename="users_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Stream users as CSV (default) or NDJSON (?export_format=ndjson)."""
+        return stream_export(
+            request, self.get_queryset(), USER_EXPORT_COLUMNS, "users", dataset="users"
         )
-        return response
 
     @action(detail=False, methods=["get"])
     def stats(self, request):
@@ -384,6 +353,20 @@ class AdminTenantViewSet(viewsets.ModelViewSet):
 
 from rest_framework.views import APIView
 
+OVERVIEW_RECENT_CACHE_KEY = "overview:recent"
+OVERVIEW_RECENT_TTL = 60
+
+
+def _overview_recent() -> dict:
+    """Short-window activity figures for the overview (cached briefly)."""
+    today = timezone.localdate()
+    last_week = rollups.totals(start=today - timedelta(days=7), end=today)
+    return {
+        "new_users_7d": last_week["new_users"],
+        "new_enrollments_7d": last_week["new_enrollments"],
+        "active_today": User.objects.filter(last_login__date=today).count(),
+    }
+
 
 class AdminAnalyticsView(APIView):
     """
@@ -395,40 +378,28 @@ class AdminAnalyticsView(APIView):
 
     def get(self, request):
         """Get system overview statistics."""
-        # User stats
-        total_users = User.objects.count()
-        active_users = User.objects.filter(is_active=True).count()
-        total_learners = Learner.objects.count()
-        total_teachers = User.objects.filter(role="teacher").count()
-        total_parents = User.objects.filter(role="parent").count()
-
-        # School stats
-        total_tenants = School.objects.count()
-
-        # Course stats
-        total_courses = Course.objects.count()
-        total_modules = Module.objects.count()
-
-        # Enrollment stats
-        total_enrollments = LearnerCourseEnrollment.objects.filter(
-            is_active=True
-        ).count()
-
-        # Activity stats
-        total_sessions = Session.objects.count()
-        total_artifacts = Artifact.objects.count()
-        total_activities = Activity.objects.count()
+        # Entity totals are cache-resident and kept current by model signals
+        # (see apps.core.services.counters); no table scans on page load.
+        totals = counters.get_all()
+        recent = cache.get_or_set(
+            OVERVIEW_RECENT_CACHE_KEY, _overview_recent, OVERVIEW_RECENT_TTL
+        )
 
-        # Recent activity (last 7 days)
-        seven_days_ago = timezone.now() - timedelta(days=7)
-        new_users_7d = User.objects.filter(date_joined__gte=seven_days_ago).count()
-        new_enrollments_7d = LearnerCourseEnrollment.objects.filter(
-            enrolled_at__gte=seven_days_ago
-        ).count()
-
-        # Active today
-        today = timezone.now().date()
-        active_today = User.objects.filter(last_login__date=today).count()
+        total_users = totals["users"]
+        active_users = totals["users_active"]
+        total_learners = totals["learners"]
+        total_teachers = totals["teachers"]
+        total_parents = totals["parents"]
+        total_tenants = totals["schools"]
+        total_courses = totals["courses"]
+        total_modules = totals["modules"]
+        total_enrollments = totals["enrollments_active"]
+        total_sessions = totals["sessions"]
+        total_artifacts = totals["artifacts"]
+        total_activities = totals["activities"]
+        new_users_7d = recent["new_users_7d"]
+        new_enrollments_7d = recent["new_enrollments_7d"]
+        active_today = recent["active_today"]
 
         return Response(
             {
@@ -456,6 +427,23 @@ class AdminAnalyticsView(APIView):
         )
 
 
+def _window_days(request, default: int = 30) -> int:
+    """Parse ``?days=`` for analytics windows, clamped to 1-365."""
+    try:
+        days = int(request.query_params.get("days", default))
+    except (ValueError, TypeError):
+        return default
+    return max(1, min(days, 365))
+
+
+def _daily_series(by_day: dict, start, end, field: str) -> list[dict]:
+    """Gap-filled ``[{"date", "count"}]`` series for one rollup counter."""
+    return [
+        {"date": day.isoformat(), "count": by_day.get(day, {}).get(field) or 0}
+        for day in rollups.iter_days(start, end)
+    ]
+
+
 class AdminAnalyticsViewSet(viewsets.ViewSet):
     """
     Admin analytics endpoints.
@@ -468,18 +456,10 @@ class AdminAnalyticsViewSet(viewsets.ViewSet):
     @action(detail=False, methods=["get"])
     def users(self, request):
         """Get user growth analytics."""
-        # Get date range from params
-        days = int(request.query_params.get("days", 30))
-        end_date = timezone.now()
-        start_date = end_date - timedelta(days=days)
-
-        # User registrations over time
-        registrations = []
-        current_date = start_date.date()
-        while current_date <= end_date.date():
-            count = User.objects.filter(date_joined__date=current_date).count()
-            registrations.append({"date": current_date.isoformat(), "count": count})
-            current_date += timedelta(days=1)
+        today = timezone.localdate()
+        start_date = today - timedelta(days=_window_days(request))
+        by_day = rollups.daily_totals(start_date, today)
+        registrations = _daily_series(by_day, start_date, today, "new_users")
 
         # Role distribution
         role_distribution = (
@@ -527,18 +507,13 @@ class AdminAnalyticsViewSet(viewsets.ViewSet):
 
         completion_rate = (completed / total * 100) if total > 0 else 0
 
-        # Enrollments over time (last 30 days)
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        enrollments_over_time = []
-        current_date = thirty_days_ago.date()
-        while current_date <= timezone.now().date():
-            count = LearnerCourseEnrollment.objects.filter(
-                enrolled_at__date=current_date
-            ).count()
-            enrollments_over_time.append(
-                {"date": current_date.isoformat(), "count": count}
-            )
-            current_date += timedelta(days=1)
+        # Enrollments over time (last 30 days unless ?days= is given)
+        today = timezone.localdate()
+        start_date = today - timedelta(days=_window_days(request))
+        by_day = rollups.daily_totals(start_date, today)
+        enrollments_over_time = _daily_series(
+            by_day, start_date, today, "new_enrollments"
+        )
 
         return Response(
             {
@@ -551,116 +526,117 @@ class AdminAnalyticsViewSet(viewsets.ViewSet):
         )
 
     @action(detail=False, methods=["get"], url_path="dashboard")
+    @swr_cache(soft_ttl=120, hard_ttl=3600)
     def dashboard(self, request):
         """
         Comprehensive analytics dashboard data.
         Returns all charts + KPIs in one request.
         Supports ?days=30|60|90 to change the time window.
         """
-        try:
-            days = int(request.query_params.get("days", 30))
-            days = max(1, min(days, 365))  # clamp: 1-365
-        except (ValueError, TypeError):
-            days = 30
+        days = _window_days(request)
 
         end_dt = timezone.now()
         start_dt = end_dt - timedelta(days=days)
-        today = end_dt.date()
-        start_date = start_dt.date()
-
-        # ── KPI snapshot (5 queries total) ────────────────────────────────────
-        total_users = User.objects.count()
+        today = timezone.localdate(end_dt)
+        start_date = timezone.localdate(start_dt)
+
+        # Day-bucketed counters come from the DailySchoolStats rollup table
+        # (one row per school per day), so cost tracks the window size rather
+        # than the size of users/sessions/attendance.
+        all_time = rollups.totals()
+        window = rollups.totals(start=start_date, end=today)
+        by_day = rollups.daily_totals(start_date, today)
+
+        # ── KPI snapshot ──────────────────────────────────────────────────────
+        total_users = all_time["new_users"]
         active_users = User.objects.filter(is_active=True).count()
-        new_users = User.objects.filter(date_joined__gte=start_dt).count()
+        new_users = window["new_users"]
         total_schools = School.objects.count()
 
-        total_sessions = Session.objects.count()
-        new_sessions = Session.objects.filter(created_at__gte=start_dt).count()
-        completed_sessions = Session.objects.filter(status="completed").count()
+        total_sessions = all_time["sessions_total"]
+        new_sessions = window["sessions_created"]
+        completed_sessions = all_time["sessions_completed"]
 
         total_enrollments = LearnerCourseEnrollment.objects.filter(
             is_active=True
         ).count()
-        new_enrollments = LearnerCourseEnrollment.objects.filter(
-            enrolled_at__gte=start_dt
-        ).count()
+        new_enrollments = window["new_enrollments"]
 
-        total_attendance = Attendance.objects.count()
-        present_attendance = Attendance.objects.filter(status="present").count()
+        total_attendance = all_time["attendance_total"]
+        present_attendance = all_time["attendance_present"]
         attendance_rate = (
             round(present_attendance / total_attendance * 100, 1)
             if total_attendance
             else 0
         )
 
-        # ── User growth — 1 query via GROUP BY date ───────────────────────────
-        _user_days = (
-            User.objects.filter(date_joined__date__gte=start_date)
-            .annotate(day=TruncDate("date_joined"))
-            .values("day")
-            .annotate(new_users=Count("id"))
-        )
-        _enroll_days = (
-            LearnerCourseEnrollment.objects.filter(enrolled_at__date__gte=start_date)
-            .annotate(day=TruncDate("enrolled_at"))
-            .values("day")
-            .annotate(new_enrollments=Count("id"))
-        )
-        user_by_day = {r["day"]: r["new_users"] for r in _user_days}
-        enroll_by_day = {r["day"]: r["new_enrollments"] for r in _enroll_days}
-        cur = start_date
+        # ── Daily series (user growth, sessions, attendance) ──────────────────
         user_growth = []
-        while cur <= today:
+        session_trend = []
+        att_by_day = []
+        empty = dict.fromkeys(rollups.ROLLUP_FIELDS, 0)
+        for cur in rollups.iter_days(start_date, today):
+            row = by_day.get(cur, empty)
             user_growth.append(
                 {
                     "date": cur.isoformat(),
-                    "new_users": user_by_day.get(cur, 0),
-                    "new_enrollments": enroll_by_day.get(cur, 0),
+                    "new_users": row["new_users"],
+                    "new_enrollments": row["new_enrollments"],
+                }
+            )
+            session_trend.append(
+                {
+                    "date": cur.isoformat(),
+                    "total": row["sessions_total"],
+                    "completed": row["sessions_completed"],
+                    "scheduled": row["sessions_scheduled"],
+                }
+            )
+            total_d = row["attendance_total"]
+            att_by_day.append(
+                {
+                    "date": cur.isoformat(),
+                    "rate": (
+                        round(row["attendance_present"] / total_d * 100, 1)
+                        if total_d
+                        else 0
+                    ),
+                    "present": row["attendance_present"],
+                    "absent": row["attendance_absent"],
+                    "late": row["attendance_late"],
                 }
             )
-            cur += timedelta(days=1)
-
-        # ── Session trends — 2 queries (total + status breakdown) ─────────────
-        _sess_days = (
-            Session.objects.filter(date__gte=start_date)
-            .annotate(day=TruncDate("date"))
-            .values("day", "status")
-            .annotate(cnt=Count("id"))
-        )
-        sess_map: dict = {}  # day -> {total, completed, scheduled}
-        for row in _sess_days:
-            d = row["day"]
-            if d not in sess_map:
-                sess_map[d] = {"total": 0, "completed": 0, "scheduled": 0}
-            sess_map[d]["total"] += row["cnt"]
-            if row["status"] == "completed":
-                sess_map[d]["completed"] = row["cnt"]
-            elif row["status"] == "scheduled":
-                sess_map[d]["scheduled"] = row["cnt"]
-        cur = start_date
-        session_trend = []
-        while cur <= today:
-            entry = sess_map.get(cur, {"total": 0, "completed": 0, "scheduled": 0})
-            session_trend.append({"date": cur.isoformat(), **entry})
-            cur += timedelta(days=1)
 
         # ── Role distribution (pie) — 1 query ─────────────────────────────────
         role_distribution = list(
             User.objects.values("role").annotate(count=Count("id")).order_by("-count")
         )
 
-        # ── School performance (bar) — 1 query ────────────────────────────────
-        school_perf_raw = School.objects.annotate(
-            learner_count=Count("learner", distinct=True),
-            session_count=Count("session", distinct=True),
-        ).order_by("-learner_count")[:10]
+        # ── School performance (bar) — 3 narrow grouped queries ───────────────
+        # Separate per-table counts instead of a School x Learner x Session join.
+        learners_by_school = dict(
+            Learner.objects.filter(tenant__isnull=False)
+            .values_list("tenant_id")
+            .annotate(n=Count("id"))
+        )
+        sessions_by_school = rollups.sessions_by_school()
+        top_school_ids = sorted(
+            learners_by_school.keys() | sessions_by_school.keys(),
+            key=lambda sid: (
+                -learners_by_school.get(sid, 0),
+                -sessions_by_school.get(sid, 0),
+            ),
+        )[:10]
+        school_names = dict(
+            School.objects.filter(id__in=top_school_ids).values_list("id", "name")
+        )
         school_performance = [
             {
-                "school": s.name,
-                "learners": s.learner_count,
-                "sessions": s.session_count,
+                "school": school_names.get(sid, ""),
+                "learners": learners_by_school.get(sid, 0),
+                "sessions": sessions_by_school.get(sid, 0),
             }
-            for s in school_perf_raw
+            for sid in top_school_ids
         ]
 
         # ── Top teachers (by sessions) — 1 query ──────────────────────────────
@@ -682,37 +658,6 @@ class AdminAnalyticsViewSet(viewsets.ViewSet):
                 t["teacher__username"],
             )
 
-        # ── Attendance breakdown — 1 query via GROUP BY date+status ───────────
-        _att_rows = (
-            Attendance.objects.filter(session__date__gte=start_date)
-            .values("session__date", "status")
-            .annotate(cnt=Count("id"))
-        )
-        att_map: dict = {}
-        for row in _att_rows:
-            d = row["session__date"]
-            if d not in att_map:
-                att_map[d] = {"present": 0, "absent": 0, "late": 0, "total": 0}
-            st = row["status"]
-            att_map[d]["total"] += row["cnt"]
-            if st in ("present", "absent", "late"):
-                att_map[d][st] += row["cnt"]
-        cur = start_date
-        att_by_day = []
-        while cur <= today:
-            a = att_map.get(cur, {"present": 0, "absent": 0, "late": 0, "total": 0})
-            total_d = a["total"]
-            att_by_day.append(
-                {
-                    "date": cur.isoformat(),
-                    "rate": round(a["present"] / total_d * 100, 1) if total_d else 0,
-                    "present": a["present"],
-                    "absent": a["absent"],
-                    "late": a["late"],
-                }
-            )
-            cur += timedelta(days=1)
-
         # ── Top pathways by enrollment — 1 query ──────────────────────────────
         top_courses = list(
             LearnerCourseEnrollment.objects.filter(is_active=True)
@@ -754,3 +699,62 @@ class AdminAnalyticsViewSet(viewsets.ViewSet):
                 "top_courses": top_courses,
             }
         )
+
+
+def enrollment_export_queryset(params):
+    qs = LearnerCourseEnrollment.objects.order_by("-enrolled_at", "-id")
+    if params.get("school"):
+        qs = qs.filter(learner__tenant_id=params["school"])
+    if params.get("course"):
+        qs = qs.filter(course_id=params["course"])
+    if params.get("is_active") is not None:
+        qs = qs.filter(is_active=params["is_active"].lower() == "true")
+    return qs
+
+
+def artifact_export_queryset(params):
+    qs = Artifact.objects.order_by("-submitted_at", "-id")
+    if params.get("school"):
+        qs = qs.filter(tenant_id=params["school"])
+    if params.get("status"):
+        qs = qs.filter(status=params["status"])
+    if params.get("date_from"):
+        qs = qs.filter(submitted_at__date__gte=params["date_from"])
+    if params.get("date_to"):
+        qs = qs.filter(submitted_at__date__lte=params["date_to"])
+    return qs
+
+
+class AdminExportViewSet(viewsets.ViewSet):
+    """
+    Streamed bulk exports for datasets without an admin list endpoint.
+    GET /api/admin/exports/enrollments/ - Course enrollments
+    GET /api/admin/exports/artifacts/   - Learner artifacts
+
+    Users, sessions and attendance export from their own endpoints
+    (`/admin/users/export/`, `/admin/monitor/{sessions,attendance}/export/`)
+    so they honour those list filters. All accept ?export_format=csv|ndjson,
+    and ?async=1 to run as a background job (202 + job to poll).
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @action(detail=False, methods=["get"])
+    def enrollments(self, request):
+        return stream_export(
+            request,
+            enrollment_export_queryset(request.query_params),
+            ENROLLMENT_EXPORT_COLUMNS,
+            "enrollments",
+            dataset="enrollments",
+        )
+
+    @action(detail=False, methods=["get"])
+    def artifacts(self, request):
+        return stream_export(
+            request,
+            artifact_export_queryset(request.query_params),
+            ARTIFACT_EXPORT_COLUMNS,
+            "artifacts",
+            dataset="artifacts",
+        )
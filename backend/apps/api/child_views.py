@@ -4,10 +4,10 @@ from datetime import date, datetime, time, timedelta
 
 from apps.core.models import (
     Activity,
-    Attendance,
     Learner,
     Session,
 )
+from apps.core.services import module_badges
 from django.db.models import Q
 from rest_framework import permissions, viewsets
 from rest_framework.decorators import action
@@ -140,26 +140,19 @@ class ChildViewSet(viewsets.ModelViewSet):
                 }
             )
 
-        # 3. Badges (Derived from completed sessions where module has badge_name)
-        # Find sessions attended by child that are completed
-
-        # We assume if they attended a completed session, they completed the module.
-        # Ideally we should check if they were 'present'.
-        completed_attendances = Attendance.objects.filter(
-            learner=child, status="present", session__status="completed"
-        ).select_related("session__module")
-
+        # 3. Badges: modules with a badge the child has earned by attending a
+        # completed session (maintained by apps.core.services.module_badges).
         badges = []
         seen_badges = set()
-        for att in completed_attendances:
-            module = att.session.module
-            if module.badge_name and module.badge_name not in seen_badges:
+        for earned in module_badges.for_learner(child).exclude(module__badge_name=""):
+            module = earned.module
+            if module.badge_name not in seen_badges:
                 badges.append(
                     {
                         "id": str(module.id),
                         "name": module.badge_name,
                         "module_name": module.name,
-                        "earned_at": att.session.date,
+                        "earned_at": earned.earned_on,
                         "icon": "award",  # Placeholder for UI mapping
                     }
                 )
@@ -28,6 +28,7 @@ from apps.core.models import (
     LearnerLevelProgress,
     Module,
 )
+from apps.core.services import progress_updates
 from django.db.models import Q
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
@@ -417,12 +418,10 @@ class LearnerProgressViewSet(viewsets.ModelViewSet):
         if user.role == "admin":
             return queryset
 
-        # Teachers can only access learners enrolled in their assigned courses
+        # Teachers can only access learners enrolled in their assigned courses,
+        # as recorded in the maintained access table (one indexed probe).
         if user.role == "teacher":
-            learner_ids = LearnerCourseEnrollment.objects.filter(
-                course__teachers=user, is_active=True
-            ).values_list("learner_id", flat=True)
-            return queryset.filter(enrollment__learner_id__in=learner_ids)
+            return queryset.filter(enrollment__learner__teacher_access__teacher=user)
 
         # Parents can only access their children's progress
         if user.role == "parent":
@@ -441,6 +440,7 @@ class LearnerProgressViewSet(viewsets.ModelViewSet):
             "partial_update",
             "destroy",
             "update_progress",
+            "bulk_update_progress",
             "confirm_completion",
         ]:
             return [IsTeacher()]
@@ -528,6 +528,81 @@ class LearnerProgressViewSet(viewsets.ModelViewSet):
             }
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk-update")
+    def bulk_update_progress(self, request):
+        """Update progress for a whole class in one request.
+
+        Expected payload:
+        {
+            "updates": [
+                {"id": "<progress id>", "completed_module_ids": [...],
+                 "artifacts_submitted": 2, "assessment_score": 75, ...},
+                ...
+            ]
+        }
+
+        Each item takes the fields `update_progress` accepts. The batch is
+        validated as a whole; if any item is invalid nothing is saved and
+        the errors are returned. Auto-promotion runs for every enrollment
+        touched.
+        """
+        updates = request.data.get("updates")
+        if not isinstance(updates, list) or not updates:
+            return Response(
+                {"error": "updates must be a non-empty list."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(updates) > progress_updates.MAX_UPDATES:
+            return Response(
+                {
+                    "error": f"At most {progress_updates.MAX_UPDATES} updates "
+                    "per request."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result = progress_updates.apply_updates(self.get_queryset(), updates)
+        if result.errors:
+            return Response(
+                {"error": "No progress was updated.", "errors": result.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        progress = LearnerLevelProgress.objects.filter(
+            pk__in=[row.pk for row in result.rows]
+        ).values(
+            "id",
+            "enrollment",
+            "level",
+            "modules_completed",
+            "completed_module_ids",
+            "artifacts_submitted",
+            "assessment_score",
+            "teacher_confirmed",
+            "completed",
+        )
+        promoted = [
+            {
+                "enrollment": p.enrollment_id,
+                "from_level": p.from_level,
+                "to_level": p.to_level,
+                "course_completed": p.course_completed,
+            }
+            for p in result.promotions
+        ]
+        return Response(
+            {
+                "updated": len(result.rows),
+                "progress": list(progress),
+                "promoted": promoted,
+                "message": (
+                    f"Progress updated; {len(promoted)} learner(s) promoted"
+                    if promoted
+                    else "Progress updated"
+                ),
+            }
+        )
+
     @action(detail=True, methods=["post"])
     def confirm_completion(self, request, pk=None):
         """Teacher confirms level completion."""
@@ -0,0 +1,78 @@
+"""Background-job handlers for the admin API (see `settings.JOB_HANDLERS`)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from apps.api.admin_monitor_views import (
+    ATTENDANCE_EXPORT_COLUMNS,
+    SESSION_EXPORT_COLUMNS,
+    attendance_queryset,
+    session_queryset,
+)
+from apps.api.admin_views import (
+    ARTIFACT_EXPORT_COLUMNS,
+    ENROLLMENT_EXPORT_COLUMNS,
+    USER_EXPORT_COLUMNS,
+    AdminUserViewSet,
+    artifact_export_queryset,
+    enrollment_export_queryset,
+    filter_users,
+)
+from apps.api.utils.export import (
+    CHUNK_SIZE,
+    FORMATS,
+    export_filename,
+    export_rows,
+    render_chunks,
+)
+from apps.core.services.jobs import JobContext
+
+# dataset -> (queryset from filter params, columns, file basename)
+EXPORT_DATASETS = {
+    "users": (
+        lambda params: filter_users(AdminUserViewSet.queryset.all(), params),
+        USER_EXPORT_COLUMNS,
+        "users",
+    ),
+    "enrollments": (
+        enrollment_export_queryset,
+        ENROLLMENT_EXPORT_COLUMNS,
+        "enrollments",
+    ),
+    "artifacts": (artifact_export_queryset, ARTIFACT_EXPORT_COLUMNS, "artifacts"),
+    "sessions": (session_queryset, SESSION_EXPORT_COLUMNS, "sessions"),
+    "attendance": (attendance_queryset, ATTENDANCE_EXPORT_COLUMNS, "attendance"),
+}
+
+
+def _counted(rows: Iterable[tuple], ctx: JobContext, total: int) -> Iterator[tuple]:
+    n = 0
+    for n, row in enumerate(rows, 1):
+        if n % CHUNK_SIZE == 0:
+            ctx.progress(n, total, "rows exported")
+        yield row
+    ctx.progress(n, total, "rows exported", force=True)
+
+
+def run_export(ctx: JobContext) -> dict:
+    """Write an admin export to the job's result file.
+
+    Params: ``dataset`` (a key of EXPORT_DATASETS), ``export_format``
+    (csv | ndjson) and ``filters`` (the list endpoint's query params).
+    """
+    dataset = ctx.params.get("dataset")
+    if dataset not in EXPORT_DATASETS:
+        raise ValueError(f"Unknown export dataset '{dataset}'")
+    fmt = ctx.params.get("export_format", "csv")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export_format '{fmt}'")
+
+    build_queryset, columns, basename = EXPORT_DATASETS[dataset]
+    queryset = build_queryset(ctx.params.get("filters") or {})
+    total = queryset.count()
+    rows = _counted(export_rows(queryset, columns), ctx, total)
+    ctx.save_result_file(
+        export_filename(basename, fmt), render_chunks(rows, columns, fmt)
+    )
+    return {"dataset": dataset, "export_format": fmt, "rows": ctx.job.progress_done}
@@ -0,0 +1,214 @@
+"""Quiz authoring, delivery and auto-grading endpoints.
+
+- Teachers (``/teacher/quizzes/``) author multiple-choice quizzes for the
+  selected school, list attempts, re-grade them after editing a quiz and
+  read per-question item statistics.
+- Learners (``/student/quizzes/``) list their school's active quizzes
+  (answer keys stripped), start an attempt and submit answers for
+  immediate grading (apps.core.services.quiz_grading).
+
+Completed attempts feed level progress through the evidence signals.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from apps.core.models import Learner, Quiz, QuizAttempt
+from apps.core.services import quiz_grading, quiz_item_stats
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.response import Response
+
+from .serializers import QuizAttemptSerializer, QuizSerializer, StudentQuizSerializer
+from .student_views import IsLearner
+from .teacher_views import IsTeacher, TeacherSchoolContextMixin
+
+# Submissions this long after a timed attempt's limit are still accepted.
+TIME_LIMIT_GRACE = timedelta(minutes=1)
+
+
+def _expired(quiz, attempt, now) -> bool:
+    return bool(quiz.time_limit_minutes) and now > (
+        attempt.started_at
+        + timedelta(minutes=quiz.time_limit_minutes)
+        + TIME_LIMIT_GRACE
+    )
+
+
+def _close(attempt, now) -> None:
+    """Close a timed-out attempt as completed with a score of 0."""
+    attempt.answers, attempt.score, attempt.passed = [], 0, False
+    attempt.completed_at = now
+    attempt.save()
+
+
+class TeacherQuizViewSet(TeacherSchoolContextMixin, viewsets.ModelViewSet):
+    """Quizzes of the selected school.
+
+    Editing a quiz's questions or pass mark re-grades its completed attempts.
+    """
+
+    permission_classes = [IsTeacher]
+    serializer_class = QuizSerializer
+
+    def get_queryset(self):
+        school = self._resolve_school_context(self.request)
+        return (
+            Quiz.objects.for_school(school.id if school else None)
+            .select_related("module")
+            .order_by("-created_at")
+        )
+
+    def perform_create(self, serializer):
+        school = self._resolve_school_context(self.request)
+        if school is None:
+            raise PermissionDenied("Please select a school context to create quizzes.")
+        serializer.save(tenant=school, created_by=self.request.user)
+
+    def perform_update(self, serializer):
+        quiz = serializer.save()
+        if {"questions", "passing_score"}.intersection(serializer.validated_data):
+            quiz_grading.regrade_quiz(quiz)
+
+    @action(detail=True, methods=["get"])
+    def attempts(self, request, pk=None):
+        """Attempts at this quiz, newest first (paginated)."""
+        quiz = self.get_object()
+        qs = quiz.attempts.select_related("learner").order_by("-started_at", "-id")
+        page = self.paginate_queryset(qs)
+        return self.get_paginated_response(QuizAttemptSerializer(page, many=True).data)
+
+    @action(detail=True, methods=["post"])
+    def regrade(self, request, pk=None):
+        """Re-grade every completed attempt against the current answer key."""
+        quiz = self.get_object()
+        changed = quiz_grading.regrade_quiz(quiz)
+        return Response({"regraded": changed})
+
+    @action(detail=True, methods=["get"], url_path="item-stats")
+    def item_stats(self, request, pk=None):
+        """Per-question difficulty, discrimination and option counts."""
+        return Response(quiz_item_stats.summary(self.get_object()))
+
+
+class StudentQuizViewSet(viewsets.ReadOnlyModelViewSet):
+    """Active quizzes of the learner's school; take and submit attempts."""
+
+    permission_classes = [IsLearner]
+    serializer_class = StudentQuizSerializer
+
+    def _learner(self) -> Learner:
+        learner = Learner.objects.filter(user=self.request.user).first()
+        if learner is None:
+            raise NotFound("Learner profile not found")
+        return learner
+
+    def get_queryset(self):
+        learner = self._learner()
+        return (
+            Quiz.objects.for_school(learner.tenant_id)
+            .filter(is_active=True)
+            .select_related("module")
+            .order_by("-created_at")
+        )
+
+    @action(detail=False, methods=["get"], url_path="attempts")
+    def my_attempts(self, request):
+        """The learner's own attempts, newest first (paginated)."""
+        qs = (
+            QuizAttempt.objects.filter(learner=self._learner())
+            .select_related("learner")
+            .order_by("-started_at", "-id")
+        )
+        page = self.paginate_queryset(qs)
+        return self.get_paginated_response(QuizAttemptSerializer(page, many=True).data)
+
+    @action(detail=True, methods=["post"])
+    def start(self, request, pk=None):
+        """Open an attempt (or return the one already open).
+
+        Open attempts past a timed quiz's limit are closed with a score of 0
+        and a new attempt is opened in their place.
+        """
+        quiz = self.get_object()
+        learner = self._learner()
+        now = timezone.now()
+        with transaction.atomic():
+            open_attempts = QuizAttempt.objects.select_for_update().filter(
+                quiz=quiz, learner=learner, completed_at__isnull=True
+            )
+            for attempt in open_attempts.order_by("-started_at"):
+                if not _expired(quiz, attempt, now):
+                    return Response(QuizAttemptSerializer(attempt).data)
+                _close(attempt, now)
+            attempt = QuizAttempt.objects.create(
+                quiz=quiz, learner=learner, score=0, tenant_id=quiz.tenant_id
+            )
+        return Response(
+            QuizAttemptSerializer(attempt).data, status=status.HTTP_201_CREATED
+        )
+
+    @action(detail=True, methods=["post"])
+    def submit(self, request, pk=None):
+        """Submit answers and grade them immediately.
+
+        Expected payload:
+        {
+            "answers": [0, 2, 1, ...]  (selected option index per question)
+        }
+
+        Completes the learner's open attempt, or a new one when none is open.
+        Timed quizzes need an attempt opened with `start`; one submitted past
+        the limit is closed with a score of 0 and the submission rejected.
+        """
+        quiz = self.get_object()
+        learner = self._learner()
+        answers = request.data.get("answers")
+        if not isinstance(answers, list) or len(answers) > len(quiz.questions):
+            return Response(
+                {"error": "answers must be a list with at most one per question."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        now = timezone.now()
+        with transaction.atomic():
+            attempt = (
+                QuizAttempt.objects.select_for_update()
+                .filter(quiz=quiz, learner=learner, completed_at__isnull=True)
+                .order_by("-started_at")
+                .first()
+            )
+            if attempt is None:
+                if quiz.time_limit_minutes:
+                    return Response(
+                        {"error": "Start this timed quiz before submitting."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                attempt = QuizAttempt(
+                    quiz=quiz, learner=learner, score=0, tenant_id=quiz.tenant_id
+                )
+            elif _expired(quiz, attempt, now):
+                _close(attempt, now)
+                return Response(
+                    {"error": "Time limit exceeded. Start a new attempt."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            result = quiz_grading.grade(quiz, answers)
+            attempt.answers = answers
+            attempt.score, attempt.passed = result.score, result.passed
+            attempt.completed_at = now
+            attempt.save()
+            quiz_item_stats.record(quiz, answers)
+
+        return Response(
+            {
+                "attempt": QuizAttemptSerializer(attempt).data,
+                "correct": result.correct,
+                "total": result.total,
+            }
+        )
@@ -1,3 +1,5 @@
+from datetime import date, timedelta
+
 from apps.api.serializers import (
     PathwaySerializer,
     PodClassSerializer,
@@ -6,7 +8,13 @@ from apps.api.serializers import (
     SchoolStudentDetailSerializer,
     UserSerializer,
 )
+from apps.api.utils.cache import swr_cache
+from apps.api.utils.export import ExportColumn, minutes, stream_export
+from apps.api.utils.fields import apply_plan, requested_fields
+from apps.api.utils.history import STUDENT_HISTORY_FEEDS
+from apps.api.utils.pagination import KeysetPaginator
 from apps.core.models import (
+    SESSION_START_SORT,
     Achievement,
     Artifact,
     Course,
@@ -16,8 +24,10 @@ from apps.core.models import (
     PodClass,
     Session,
 )
+from apps.core.services import completion, learner_history
 from django.contrib.auth import get_user_model
-from django.db.models import Avg, Count, Q, Sum
+from django.db.models import Avg, Count, Prefetch, Q, Value
+from django.db.models.functions import Concat
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -25,10 +35,148 @@ from rest_framework.response import Response
 from .permissions import IsSchoolAdmin
 
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 
 User = get_user_model()
 
+
+def _serialize_progress(e):
+    return {
+        "id": str(e.learner_id),
+        "enrollment_id": str(e.id),
+        "student_name": e.learner.full_name,
+        "student_email": e.learner.user.email if e.learner.user else "",
+        "course_name": e.course.name,
+        "current_level": (
+            f"Level {e.current_level.level_number}"
+            if e.current_level
+            else "Not Started"
+        ),
+        "completion_percentage": e.completion_percentage,
+        "modules_completed": e.modules_completed,
+        "total_modules": e.total_modules or 1,
+        "artifacts_submitted": e.artifacts_submitted,
+        "assessment_score": e.average_score,
+        "status": e.progress_status,
+    }
+
+
+# ?ordering= value -> paginator over the matching (field, id) index
+PROGRESS_ORDERINGS = {
+    f"{prefix}{field}": KeysetPaginator(ordering=(f"{prefix}{field}", f"{prefix}id"))
+    for field in ("enrolled_at", "completion_percentage", "average_score")
+    for prefix in ("", "-")
+}
+
+
+# Placeholder values until badges record their awarder and artifacts link to
+# a course and file type.
+BADGE_AWARDED_BY = "System"
+ARTIFACT_COURSE_NAME = "General"
+ARTIFACT_FILE_TYPE = "FILE"
+
+
+def _serialize_badge(b):
+    return {
+        "id": str(b.id),
+        "student_name": b.learner.full_name,
+        "badge_name": b.name,
+        "description": b.description or "",
+        "awarded_date": b.earned_at,
+        "awarded_by": BADGE_AWARDED_BY,
+    }
+
+
+def _serialize_artifact(a):
+    return {
+        "id": str(a.id),
+        "student_name": a.learner.full_name,
+        "title": a.title,
+        "description": a.reflection or "",
+        "course_name": ARTIFACT_COURSE_NAME,
+        "submitted_date": a.submitted_at,
+        "file_type": ARTIFACT_FILE_TYPE,
+    }
+
+
+BADGE_FEED = KeysetPaginator(ordering=("-earned_at", "-id"))
+ARTIFACT_FEED = KeysetPaginator(ordering=("-submitted_at", "-id"))
+
+# NDJSON/CSV rows carry the same keys as the paginated JSON objects.
+STUDENT_NAME = Concat("learner__first_name", Value(" "), "learner__last_name")
+BADGE_EXPORT_COLUMNS = [
+    ExportColumn("ID", "id"),
+    ExportColumn("Student", "student_name"),
+    ExportColumn("Badge", "name", key="badge_name"),
+    ExportColumn("Description", "description"),
+    ExportColumn("Awarded", "earned_at", key="awarded_date", csv=minutes),
+    ExportColumn("Awarded By", "awarded_by"),
+]
+ARTIFACT_EXPORT_COLUMNS = [
+    ExportColumn("ID", "id"),
+    ExportColumn("Student", "student_name"),
+    ExportColumn("Title", "title"),
+    ExportColumn("Description", "reflection", key="description"),
+    ExportColumn("Course", "course_name"),
+    ExportColumn("Submitted", "submitted_at", key="submitted_date", csv=minutes),
+    ExportColumn("File Type", "file_type"),
+]
+
+# Default session feed window around today, and the widest window allowed.
+SESSION_WINDOW_PAST_DAYS = 7
+SESSION_WINDOW_FUTURE_DAYS = 30
+SESSION_WINDOW_MAX_DAYS = 366
+SESSION_FEED = KeysetPaginator(ordering=("date", "start_sort", "id"))
+
+
+def _session_window(params) -> tuple[date, date]:
+    today = timezone.localdate()
+    bounds = []
+    for key, default in (
+        ("date_from", today - timedelta(days=SESSION_WINDOW_PAST_DAYS)),
+        ("date_to", today + timedelta(days=SESSION_WINDOW_FUTURE_DAYS)),
+    ):
+        raw = params.get(key)
+        value = parse_date(raw) if raw else default
+        if value is None:
+            raise ValueError(f"{key} must be a date (YYYY-MM-DD)")
+        bounds.append(value)
+    start, end = bounds
+    if start > end:
+        raise ValueError("date_from must not be after date_to")
+    if (end - start).days >= SESSION_WINDOW_MAX_DAYS:
+        raise ValueError(f"Date window is limited to {SESSION_WINDOW_MAX_DAYS} days")
+    return start, end
+
+
+def _serialize_school_session(s):
+    microcredential = s.module.name if s.module else "General Session"
+    pathway = (
+        s.module.course.name
+        if s.module and getattr(s.module, "course", None)
+        else "General Pathway"
+    )
+    teacher_name = (
+        f"{s.teacher.first_name} {s.teacher.last_name}".strip()
+        if s.teacher
+        else "Unknown Teacher"
+    )
+    return {
+        "id": str(s.id),
+        "microcredential": microcredential,
+        "pathway": pathway,
+        "teacher_name": teacher_name,
+        "date": s.date.isoformat(),
+        "fullDate": s.date.strftime("%B %d, %Y"),
+        "startTime": s.start_time.strftime("%I:%M %p") if s.start_time else "TBD",
+        "endTime": s.end_time.strftime("%I:%M %p") if s.end_time else "TBD",
+        "status": s.status,
+        "learner_count": s.learner_count,
+        "notes": s.notes or "",
+    }
+
+
 class SchoolDashboardViewSet(viewsets.ViewSet):
     permission_classes = [IsSchoolAdmin]
 
@@ -56,12 +204,11 @@ class SchoolDashboardViewSet(viewsets.ViewSet):
         total_badges = Achievement.objects.filter(learner__tenant=school).count()
         total_artifacts = Artifact.objects.filter(learner__tenant=school).count()
 
-        # Average Completion Rate (simplified)
-        avg_completion = (
-            LearnerLevelProgress.objects.filter(
-                enrollment__learner__tenant=school
-            ).aggregate(avg=Avg("modules_completed"))["avg"]
-            or 0
+        # Average Completion Rate (completed level slots across enrollments)
+        avg_completion = completion.overall_completion(
+            completion.course_completion(
+                LearnerCourseEnrollment.objects.filter(learner__tenant=school)
+            )
         )
 
         return Response(
@@ -80,6 +227,7 @@ class SchoolDashboardViewSet(viewsets.ViewSet):
         )
 
     @action(detail=False, methods=["get"])
+    @swr_cache(soft_ttl=120, hard_ttl=3600)
     def analytics(self, request):
         """Detailed analytics for the analytics page."""
         school = request.user.tenant
@@ -101,91 +249,70 @@ class SchoolDashboardViewSet(viewsets.ViewSet):
         ).distinct().count()
         total_courses = Course.objects.filter(Q(tenant=None) | Q(tenant=school)).count()
 
-        # Performance
-        avg_completion = (
-            LearnerLevelProgress.objects.filter(
-                enrollment__learner__tenant=school
-            ).aggregate(avg=Avg("modules_completed"))["avg"]
-            or 0
-        )
-        avg_score = (
-            LearnerLevelProgress.objects.filter(
-                enrollment__learner__tenant=school
-            ).aggregate(avg=Avg("assessment_score"))["avg"]
-            or 0
-        )
-        total_badges = Achievement.objects.filter(learner__tenant=school).count()
-        total_artifacts = Artifact.objects.filter(learner__tenant=school).count()
-
         # Trends (This Month)
         now = timezone.now()
         start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
+        # Performance: score average and this month's level completions in one
+        # aggregate; completion rates are completed level slots per course.
+        progress = LearnerLevelProgress.objects.filter(
+            enrollment__learner__tenant=school
+        ).aggregate(
+            avg_score=Avg("assessment_score"),
+            # Simplified completion trend: progress records completed and
+            # updated this month.
+            completion_month=Count(
+                "id", filter=Q(updated_at__gte=start_of_month, completed=True)
+            ),
+        )
+        avg_score = progress["avg_score"] or 0
+        completion_month = progress["completion_month"]
+        total_badges = Achievement.objects.filter(learner__tenant=school).count()
+        total_artifacts = Artifact.objects.filter(learner__tenant=school).count()
+
         enrollments_month = LearnerCourseEnrollment.objects.filter(
             learner__tenant=school, enrolled_at__gte=start_of_month
         ).count()
         badges_month = Achievement.objects.filter(
             learner__tenant=school, earned_at__gte=start_of_month
         ).count()
-        # Simplified Completion Trend (just counting updated progress records this month for now)
-        completion_month = LearnerLevelProgress.objects.filter(
-            enrollment__learner__tenant=school,
-            updated_at__gte=start_of_month,
-            completed=True,
-        ).count()
+
+        # Course Stats (one grouped query over the school's enrollments)
+        levels = completion.level_counts()
+        course_rows = completion.course_completion(
+            LearnerCourseEnrollment.objects.filter(learner__tenant=school).filter(
+                Q(course__tenant=None) | Q(course__tenant=school)
+            ),
+            levels,
+        )
+        course_stats = [
+            {
+                "course_name": row["course_name"],
+                "enrolled_students": row["enrolled"],
+                "completion_rate": int(row["completion_rate"]),
+            }
+            for row in course_rows
+        ]
+        avg_completion = completion.overall_completion(course_rows)
 
         # Top Performers Query
-        top_performers_qs = (
+        top_performers_qs = list(
             Learner.objects.filter(tenant=school)
-            .annotate(
-                badges_count=Count("achievements"),
-                completed_modules=Sum(
-                    "course_enrollments__level_progress__modules_completed"
-                ),
-            )
+            .annotate(badges_count=Count("achievements"))
             .order_by("-badges_count")[:5]
         )
+        learner_rates = completion.learner_completion(
+            [s.id for s in top_performers_qs], levels
+        )
         top_performers = [
             {
                 "student_name": s.full_name,
                 "badges_count": s.badges_count,
-                # Mock calculation for completion rate for demo purposes if no modules data
-                "completion_rate": min(100, (s.completed_modules or 0) * 5),
+                "completion_rate": int(learner_rates.get(s.id, 0)),
             }
             for s in top_performers_qs
         ]
 
-        # Course Stats
-        courses = Course.objects.filter(Q(tenant=None) | Q(tenant=school))
-        course_stats = []
-        for course in courses:
-            enrolled = LearnerCourseEnrollment.objects.filter(
-                learner__tenant=school, course=course
-            ).count()
-            if enrolled > 0:
-                # Simplified completion rate
-                completed_levels = LearnerLevelProgress.objects.filter(
-                    enrollment__learner__tenant=school,
-                    enrollment__course=course,
-                    completed=True,
-                ).count()
-                # Rough estimate: completed levels / (enrolled students * total levels)
-                # For now just using completed_levels / enrolled * 10 or similar logic
-                # Better: Avg percentage
-                avg_prog = 0
-                if enrolled > 0:
-                    avg_prog = min(
-                        100, (completed_levels / enrolled) * 20
-                    )  # Mock logic for realism
-
-                course_stats.append(
-                    {
-                        "course_name": course.name,
-                        "enrolled_students": enrolled,
-                        "completion_rate": int(avg_prog),
-                    }
-                )
-
         return Response(
             {
                 "overview": {
@@ -212,169 +339,155 @@ class SchoolDashboardViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=["get"])
     def badges(self, request):
+        """Badges earned by the school's learners, newest first.
+
+        Cursor-paginated (?cursor=, ?page_size=); ``?export_format=ndjson``
+        streams every badge instead, for bulk consumers.
+        """
         school = request.user.tenant
         if not school:
             return Response([], status=400)
 
-        badges = Achievement.objects.filter(learner__tenant=school).select_related(
-            "learner"
+        badges = Achievement.objects.filter(learner__tenant=school)
+        if "export_format" in request.query_params:
+            return stream_export(
+                request,
+                badges.annotate(
+                    student_name=STUDENT_NAME, awarded_by=Value(BADGE_AWARDED_BY)
+                ),
+                BADGE_EXPORT_COLUMNS,
+                "badges",
+            )
+        return BADGE_FEED.get_response(
+            request, badges.select_related("learner"), _serialize_badge
         )
-        data = [
-            {
-                "id": str(b.id),
-                "student_name": b.learner.full_name,
-                "badge_name": b.name,
-                "description": b.description or "",
-                "awarded_date": b.earned_at,
-                "awarded_by": "System",
-            }
-            for b in badges
-        ]
-        return Response(data)
 
     @action(detail=False, methods=["get"])
     def artifacts(self, request):
+        """Artifacts submitted by the school's learners, newest first.
+
+        Paginated and streamable like `badges`.
+        """
         school = request.user.tenant
         if not school:
             return Response([], status=400)
 
-        artifacts = Artifact.objects.filter(learner__tenant=school).select_related(
-            "learner"
+        artifacts = Artifact.objects.filter(learner__tenant=school)
+        if "export_format" in request.query_params:
+            return stream_export(
+                request,
+                artifacts.annotate(
+                    student_name=STUDENT_NAME,
+                    course_name=Value(ARTIFACT_COURSE_NAME),
+                    file_type=Value(ARTIFACT_FILE_TYPE),
+                ),
+                ARTIFACT_EXPORT_COLUMNS,
+                "artifacts",
+            )
+        return ARTIFACT_FEED.get_response(
+            request, artifacts.select_related("learner"), _serialize_artifact
         )
-        data = [
-            {
-                "id": str(a.id),
-                "student_name": a.learner.full_name,
-                "title": a.title,
-                "description": a.reflection or "",
-                "course_name": "General",  # Artifact model doesn't link to course yet
-                "submitted_date": a.submitted_at,  # Note: using submitted_at instead of created_at if available, dependent on model
-                "file_type": "FILE",  # Simplification
-            }
-            for a in artifacts
-        ]
-        return Response(data)
 
     @action(detail=False, methods=["get"])
     def progress(self, request):
+        """
+        Per-enrollment progress for the school's active enrollments.
+
+        Keyset-paginated (see apps.api.utils.pagination) over the denormalized
+        enrollment aggregates. Query params:
+        - ordering: one of PROGRESS_ORDERINGS (default -enrolled_at)
+        - status: on_track | needs_attention | completed
+        - course: course id
+        - search: student or course name
+        """
         school = request.user.tenant
         if not school:
             return Response([], status=400)
 
-        # Get all active enrollments with necessary relations
-        enrollments = (
-            LearnerCourseEnrollment.objects.filter(
-                learner__tenant=school, is_active=True
-            )
-            .select_related("learner", "course", "current_level", "learner__user")
-            .prefetch_related("course__levels", "level_progress")
-        )
-
-        data = []
-        for e in enrollments:
-            # Calculate total modules required for the course
-            # Use list comprehension since we prefetched levels
-            total_modules = (
-                sum(level.required_modules_count for level in e.course.levels.all())
-                or 1
+        ordering = request.query_params.get("ordering", "-enrolled_at")
+        paginator = PROGRESS_ORDERINGS.get(ordering)
+        if paginator is None:
+            choices = ", ".join(PROGRESS_ORDERINGS)
+            return Response(
+                {"error": f"ordering must be one of: {choices}"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-            # Calculate completed modules from progress records
-            # Use list comprehension since we prefetched level_progress
-            modules_completed = sum(p.modules_completed for p in e.level_progress.all())
-
-            # Artifacts count from progress or Artifact model?
-            # Artifact is per learner, but theoretically linked to enrollment?
-            # We don't have direct link in Artifact model yet, so relying on level_progress artifacts count
-            artifacts_count = sum(p.artifacts_submitted for p in e.level_progress.all())
-
-            # Average score
-            progress_list = list(e.level_progress.all())
-            if progress_list:
-                avg_score = sum(p.assessment_score for p in progress_list) / len(
-                    progress_list
-                )
-            else:
-                avg_score = 0
-
-            # Completion Percentage
-            completion_pct = 0
-            if total_modules > 0:
-                completion_pct = min(
-                    100, int((modules_completed / total_modules) * 100)
-                )
-
-            # Status Logic
-            status_val = "on_track"
-            if avg_score > 0 and avg_score < 50:
-                status_val = "needs_attention"
-            elif e.completed_at or completion_pct >= 100:
-                status_val = "completed"
-
-            data.append(
-                {
-                    "id": str(e.learner.id),
-                    "student_name": e.learner.full_name,
-                    "student_email": e.learner.user.email if e.learner.user else "",
-                    "course_name": e.course.name,
-                    "current_level": (
-                        f"Level {e.current_level.level_number}"
-                        if e.current_level
-                        else "Not Started"
-                    ),
-                    "completion_percentage": completion_pct,
-                    "modules_completed": modules_completed,
-                    "total_modules": total_modules,
-                    "artifacts_submitted": artifacts_count,
-                    "assessment_score": round(avg_score, 1),
-                    "status": status_val,
-                }
+        qs = LearnerCourseEnrollment.objects.filter(
+            school=school, is_active=True
+        ).select_related("learner__user", "course", "current_level")
+
+        params = request.query_params
+        if params.get("status"):
+            qs = qs.filter(progress_status=params["status"])
+        if params.get("course"):
+            qs = qs.filter(course_id=params["course"])
+        if params.get("search"):
+            term = params["search"]
+            qs = qs.filter(
+                Q(learner__first_name__icontains=term)
+                | Q(learner__last_name__icontains=term)
+                | Q(course__name__icontains=term)
             )
 
-        return Response(data)
+        return paginator.get_response(request, qs, _serialize_progress)
 
     @action(detail=False, methods=["get"])
     def sessions(self, request):
-        """Return upcoming and recent sessions for the school."""
+        """
+        Sessions for the school within a date window, oldest first.
+
+        Defaults to SESSION_WINDOW_PAST_DAYS before through
+        SESSION_WINDOW_FUTURE_DAYS after today; override with ?date_from= /
+        ?date_to= (YYYY-MM-DD, at most SESSION_WINDOW_MAX_DAYS apart).
+        Keyset-paginated via ?cursor=; also filters on ?status= and ?teacher=.
+        """
         school = request.user.tenant
         if not school:
             return Response([], status=400)
 
-        now = timezone.now()
-        today = now.date()
+        try:
+            start, end = _session_window(request.query_params)
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
         qs = (
-            Session.objects.filter(tenant=school)
-            .select_related("teacher", "module", "module__course")
-            .prefetch_related("learners")
-            .order_by("date", "start_time")
+            Session.objects.filter(tenant=school, date__gte=start, date__lte=end)
+            .select_related("teacher", "module__course")
+            .annotate(learner_count=Count("learners"), start_sort=SESSION_START_SORT)
         )
+        if request.query_params.get("status"):
+            qs = qs.filter(status=request.query_params["status"])
+        if request.query_params.get("teacher"):
+            qs = qs.filter(teacher_id=request.query_params["teacher"])
+
+        response = SESSION_FEED.get_response(request, qs, _serialize_school_session)
+        if response.status_code == 200:
+            response.data["window"] = {
+                "date_from": start.isoformat(),
+                "date_to": end.isoformat(),
+            }
+        return response
 
-        data = []
-        for s in qs:
-            microcredential = s.module.name if s.module else "General Session"
-            pathway = s.module.course.name if s.module and getattr(s.module, "course", None) else "General Pathway"
-            teacher_name = (
-                f"{s.teacher.first_name} {s.teacher.last_name}".strip()
-                if s.teacher
-                else "Unknown Teacher"
-            )
-            data.append({
-                "id": str(s.id),
-                "microcredential": microcredential,
-                "pathway": pathway,
-                "teacher_name": teacher_name,
-                "date": s.date.isoformat(),
-                "fullDate": s.date.strftime("%B %d, %Y"),
-                "startTime": s.start_time.strftime("%I:%M %p") if s.start_time else "TBD",
-                "endTime": s.end_time.strftime("%I:%M %p") if s.end_time else "TBD",
-                "status": s.status,
-                "learner_count": s.learners.count(),
-                "notes": s.notes or "",
-            })
-
-        return Response(data)
 
+# Related rows each SchoolLearnerSerializer field needs, per action. The detail
+# serializer's progress/badges/artifacts/attendance run their own queries.
+_ACTIVE_ENROLLMENTS = Prefetch(
+    "course_enrollments",
+    queryset=LearnerCourseEnrollment.objects.filter(is_active=True).select_related(
+        "course"
+    ),
+    to_attr="active_enrollments",
+)
+_STUDENT_FIELD_LOADS = {
+    "username": ["user"],
+    "parent_name": ["parent"],
+    "pathways": [_ACTIVE_ENROLLMENTS],
+}
+STUDENT_PREFETCH_PLANS = {
+    "list": _STUDENT_FIELD_LOADS,
+    "retrieve": _STUDENT_FIELD_LOADS,
+}
 
 
 class SchoolStudentViewSet(viewsets.ModelViewSet):
@@ -384,30 +497,53 @@ class SchoolStudentViewSet(viewsets.ModelViewSet):
         tenant = self.request.user.tenant
         if not tenant:
             return Learner.objects.none()
-        return (
-            Learner.objects.filter(tenant=tenant)
-            .select_related("user", "parent")
-            .prefetch_related(
-                "course_enrollments__course",
-                "course_enrollments__course__levels",
-                "course_enrollments__level_progress",
-                "artifacts",
-                "achievements",
-                "attendance_records__session",
-                "attendance_records__session__module",
-            )
-        )
+        queryset = Learner.objects.filter(tenant=tenant)
+        plan = STUDENT_PREFETCH_PLANS.get(self.action)
+        if plan is None:
+            return queryset
+        return apply_plan(queryset, plan, requested_fields(self.request))
 
     def get_serializer_class(self):
         if self.action == "create":
             return SchoolStudentCreateSerializer
         return SchoolLearnerSerializer
 
+    def get_serializer(self, *args, **kwargs):
+        if self.action == "list":
+            kwargs.setdefault("fields", requested_fields(self.request))
+        return super().get_serializer(*args, **kwargs)
+
     def retrieve(self, request, *args, **kwargs):
         learner = self.get_object()
-        serializer = SchoolStudentDetailSerializer(learner, context={"request": request})
+        serializer = SchoolStudentDetailSerializer(
+            learner, context={"request": request}, fields=requested_fields(request)
+        )
         return Response(serializer.data)
 
+    def _history(self, request, name, render):
+        learner = self.get_object()
+        serializer = SchoolStudentDetailSerializer(context={"request": request})
+        return STUDENT_HISTORY_FEEDS[name].get_response(
+            request,
+            learner_history.COLLECTIONS[name](learner),
+            getattr(serializer, render),
+        )
+
+    @action(detail=True, methods=["get"])
+    def badges(self, request, pk=None):
+        """Full badge history, newest first, cursor-paginated."""
+        return self._history(request, "badges", "badge_data")
+
+    @action(detail=True, methods=["get"])
+    def artifacts(self, request, pk=None):
+        """Full artifact history, newest first, cursor-paginated."""
+        return self._history(request, "artifacts", "artifact_data")
+
+    @action(detail=True, methods=["get"])
+    def attendance(self, request, pk=None):
+        """Full attendance history, newest first, cursor-paginated."""
+        return self._history(request, "attendance", "attendance_data")
+
 
 class SchoolTeacherViewSet(viewsets.ModelViewSet):
     permission_classes = [IsSchoolAdmin]
@@ -17,12 +17,16 @@ from apps.core.models import (
     Module,
     PathwayInputs,
     PodClass,
+    Quiz,
+    QuizAttempt,
     School,
     Session,
     TeacherTask,
     WeeklyPulse,
 )
 from apps.core.roles import UserRole
+from apps.core.services import learner_history, quiz_grading
+from apps.users.serializers import UniqueLoginMixin
 from django.contrib.auth import get_user_model
 from django.conf import settings
 from rest_framework import serializers
@@ -33,6 +37,7 @@ from rest_framework.validators import UniqueTogetherValidator
 # However, let's keep it clean.
 # Actually, the exception handler we added earlier will catch ValidationError and format it.
 # So we just need to ensure we raise serializers.ValidationError.
+from .utils.fields import SparseFieldsMixin
 from .utils.validators import validate_password_strength
 
 User = get_user_model()
@@ -51,7 +56,7 @@ class TenantSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(UniqueLoginMixin, serializers.ModelSerializer):
     """Serializer for User model."""
 
     tenant = TenantSerializer(read_only=True)
@@ -295,8 +300,11 @@ class LearnerSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "parent"]
 
 
-class SchoolLearnerSerializer(serializers.ModelSerializer):
-    """Extended learner serializer for school dashboard — includes username and enrolled pathways."""
+class SchoolLearnerSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """Extended learner serializer for school dashboard — includes username and enrolled pathways.
+
+    Accepts ``fields=`` to render a subset of its fields (see utils.fields).
+    """
 
     full_name = serializers.ReadOnlyField()
     age = serializers.ReadOnlyField()
@@ -330,9 +338,12 @@ class SchoolLearnerSerializer(serializers.ModelSerializer):
         return None
 
     def get_pathways(self, obj):
-        enrollments = obj.course_enrollments.filter(is_active=True).select_related(
-            "course"
-        )
+        # Views prefetch these into `active_enrollments`; fall back to a query.
+        enrollments = getattr(obj, "active_enrollments", None)
+        if enrollments is None:
+            enrollments = obj.course_enrollments.filter(is_active=True).select_related(
+                "course"
+            )
         return [
             {"id": str(e.course.id), "name": e.course.name}
             for e in enrollments
@@ -341,12 +352,18 @@ class SchoolLearnerSerializer(serializers.ModelSerializer):
 
 
 class SchoolStudentDetailSerializer(SchoolLearnerSerializer):
-    """Detailed learner profile for school admins with progress artifacts and history."""
+    """Detailed learner profile for school admins with progress artifacts and history.
+
+    badges/artifacts/attendance hold only the most recent rows; `totals` gives
+    the full counts and the student's sub-resource endpoints page through
+    the rest.
+    """
 
     progress = serializers.SerializerMethodField()
     badges = serializers.SerializerMethodField()
     artifacts = serializers.SerializerMethodField()
     attendance = serializers.SerializerMethodField()
+    totals = serializers.SerializerMethodField()
 
     class Meta(SchoolLearnerSerializer.Meta):
         fields = SchoolLearnerSerializer.Meta.fields + [
@@ -354,6 +371,7 @@ class SchoolStudentDetailSerializer(SchoolLearnerSerializer):
             "badges",
             "artifacts",
             "attendance",
+            "totals",
         ]
 
     def _resolve_media_url(self, media_obj):
@@ -443,81 +461,77 @@ class SchoolStudentDetailSerializer(SchoolLearnerSerializer):
         return progress_data
 
     def get_badges(self, obj):
-        badges = (
-            Badge.objects.filter(learner=obj)
-            .select_related("module", "awarded_by")
-            .order_by("-awarded_at")
-        )
         return [
-            {
-                "id": str(badge.id),
-                "name": badge.badge_name,
-                "description": badge.description or "",
-                "module_name": badge.module.name if badge.module else None,
-                "awarded_at": badge.awarded_at,
-                "awarded_by": badge.awarded_by.get_full_name()
-                if badge.awarded_by
-                else None,
-            }
-            for badge in badges
+            self.badge_data(b) for b in learner_history.recent("badges", obj)
         ]
 
     def get_artifacts(self, obj):
-        artifacts = (
-            Artifact.objects.filter(learner=obj)
-            .select_related("module")
-            .order_by("-submitted_at")
-        )
         return [
-            {
-                "id": str(artifact.id),
-                "title": artifact.title,
-                "reflection": artifact.reflection,
-                "submitted_at": artifact.submitted_at,
-                "module_name": artifact.module.name if artifact.module else None,
-                "status": artifact.status,
-                "uploaded_by_student": artifact.uploaded_by_student,
-                "rejection_reason": artifact.rejection_reason,
-                "media": [
-                    {
-                        "type": media.get("type", "file"),
-                        "url": self._resolve_media_url(media),
-                        "file_url": self._resolve_media_url(media),
-                        "filename": media.get("filename"),
-                        "thumbnail_url": self._resolve_media_url(
-                            {"url": media.get("thumbnail_url")}
-                        ),
-                        "size": media.get("size"),
-                    }
-                    for media in (artifact.media_refs or [])
-                    if isinstance(media, dict)
-                ],
-            }
-            for artifact in artifacts
+            self.artifact_data(a) for a in learner_history.recent("artifacts", obj)
         ]
 
     def get_attendance(self, obj):
-        records = (
-            Attendance.objects.filter(learner=obj)
-            .select_related("session", "session__module")
-            .order_by("-marked_at")
-        )
         return [
-            {
-                "id": str(record.id),
-                "status": record.status,
-                "notes": record.notes,
-                "marked_at": record.marked_at,
-                "session": {
-                    "id": str(record.session.id),
-                    "date": record.session.date,
-                    "module_name": record.session.module.name if record.session.module else None,
-                    "status": record.session.status,
-                },
-            }
-            for record in records
+            self.attendance_data(r)
+            for r in learner_history.recent("attendance", obj)
         ]
 
+    def get_totals(self, obj):
+        return learner_history.totals(obj)
+
+    # Row renderers, shared with the paginated sub-resource endpoints.
+    def badge_data(self, badge):
+        return {
+            "id": str(badge.id),
+            "name": badge.badge_name,
+            "description": badge.description or "",
+            "module_name": badge.module.name if badge.module else None,
+            "awarded_at": badge.awarded_at,
+            "awarded_by": badge.awarded_by.get_full_name()
+            if badge.awarded_by
+            else None,
+        }
+
+    def artifact_data(self, artifact):
+        return {
+            "id": str(artifact.id),
+            "title": artifact.title,
+            "reflection": artifact.reflection,
+            "submitted_at": artifact.submitted_at,
+            "module_name": artifact.module.name if artifact.module else None,
+            "status": artifact.status,
+            "uploaded_by_student": artifact.uploaded_by_student,
+            "rejection_reason": artifact.rejection_reason,
+            "media": [
+                {
+                    "type": media.get("type", "file"),
+                    "url": self._resolve_media_url(media),
+                    "file_url": self._resolve_media_url(media),
+                    "filename": media.get("filename"),
+                    "thumbnail_url": self._resolve_media_url(
+                        {"url": media.get("thumbnail_url")}
+                    ),
+                    "size": media.get("size"),
+                }
+                for media in (artifact.media_refs or [])
+                if isinstance(media, dict)
+            ],
+        }
+
+    def attendance_data(self, record):
+        return {
+            "id": str(record.id),
+            "status": record.status,
+            "notes": record.notes,
+            "marked_at": record.marked_at,
+            "session": {
+                "id": str(record.session.id),
+                "date": record.session.date,
+                "module_name": record.session.module.name if record.session.module else None,
+                "status": record.session.status,
+            },
+        }
+
 
 class ChildCreateSerializer(serializers.ModelSerializer):
     """Serializer for parents to create/add children with login credentials."""
@@ -554,9 +568,9 @@ class ChildCreateSerializer(serializers.ModelSerializer):
         validate_password_strength(attrs["password"])
 
         # Check if username already exists
-        from apps.users.models import User
+        from apps.users.models import User, username_iexact
 
-        if User.objects.filter(username=attrs["username"]).exists():
+        if User.objects.filter(username_iexact(attrs["username"])).exists():
             raise serializers.ValidationError(
                 {"username": "This username is already taken."}
             )
@@ -1637,9 +1651,9 @@ class SchoolStudentCreateSerializer(serializers.ModelSerializer):
         ]
 
     def validate_username(self, value):
-        from apps.users.models import User
+        from apps.users.models import User, username_iexact
 
-        if User.objects.filter(username=value).exists():
+        if User.objects.filter(username_iexact(value)).exists():
             raise serializers.ValidationError("This username is already taken.")
         return value
 
@@ -1807,3 +1821,98 @@ class SchoolStudentCreateSerializer(serializers.ModelSerializer):
                 continue
 
         return learner
+
+
+# =============================================================================
+# QUIZZES
+# =============================================================================
+
+
+class QuizSerializer(serializers.ModelSerializer):
+    """Teacher view of a quiz, answer key included."""
+
+    module_name = serializers.CharField(
+        source="module.name", read_only=True, allow_null=True
+    )
+    question_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Quiz
+        fields = [
+            "id",
+            "title",
+            "description",
+            "module",
+            "module_name",
+            "questions",
+            "question_count",
+            "passing_score",
+            "time_limit_minutes",
+            "is_active",
+            "created_by",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = ["id", "created_by", "created_at", "updated_at"]
+
+    def get_question_count(self, obj):
+        return len(obj.questions or [])
+
+    def validate_questions(self, value):
+        errors = quiz_grading.validate_questions(value)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return value
+
+    def validate_passing_score(self, value):
+        if not 0 <= value <= 100:
+            raise serializers.ValidationError("Must be between 0 and 100.")
+        return value
+
+
+class StudentQuizSerializer(serializers.ModelSerializer):
+    """Learner view of a quiz: questions and options, no answer key."""
+
+    module_name = serializers.CharField(
+        source="module.name", read_only=True, allow_null=True
+    )
+    questions = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Quiz
+        fields = [
+            "id",
+            "title",
+            "description",
+            "module",
+            "module_name",
+            "questions",
+            "passing_score",
+            "time_limit_minutes",
+        ]
+
+    def get_questions(self, obj):
+        return [
+            {"question": q.get("question", ""), "options": q.get("options", [])}
+            for q in obj.questions or []
+        ]
+
+
+class QuizAttemptSerializer(serializers.ModelSerializer):
+    learner_name = serializers.CharField(source="learner.full_name", read_only=True)
+
+    class Meta:
+        model = QuizAttempt
+        fields = [
+            "id",
+            "quiz",
+            "learner",
+            "learner_name",
+            "answers",
+            "score",
+            "passed",
+            "feedback",
+            "started_at",
+            "completed_at",
+        ]
+        read_only_fields = fields
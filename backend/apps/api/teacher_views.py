@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
+from apps.api.utils.history import STUDENT_HISTORY_FEEDS
 from apps.core.models import Artifact, Attendance, Learner, School, Session
 from apps.core.scope import get_user_allowed_school_ids
+from apps.core.services import learner_history, progress_events
 from django.db.models import Count, Prefetch, Q
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
@@ -276,31 +278,33 @@ class TeacherSessionViewSet(TeacherSchoolContextMixin, viewsets.ModelViewSet):
         created_records = []
         updated_records = []
 
-        for record in attendance_data:
-            learner_id = record.get("learner_id")
-            attendance_status = record.get("status", "present")
-            notes = record.get("notes", "")
+        # One transaction, so progress counters are re-derived in one batch.
+        with progress_events.collect():
+            for record in attendance_data:
+                learner_id = record.get("learner_id")
+                attendance_status = record.get("status", "present")
+                notes = record.get("notes", "")
 
-            if not learner_id:
-                continue
-
-            try:
-                learner = Learner.objects.get(id=learner_id)
-                if session.tenant_id and learner.tenant_id != session.tenant_id:
+                if not learner_id:
                     continue
-                attendance, created = Attendance.objects.update_or_create(
-                    session=session,
-                    learner=learner,
-                    defaults={"status": attendance_status, "notes": notes},
-                )
-
-                if created:
-                    created_records.append(attendance)
-                else:
-                    updated_records.append(attendance)
 
-            except Learner.DoesNotExist:
-                continue
+                try:
+                    learner = Learner.objects.get(id=learner_id)
+                    if session.tenant_id and learner.tenant_id != session.tenant_id:
+                        continue
+                    attendance, created = Attendance.objects.update_or_create(
+                        session=session,
+                        learner=learner,
+                        defaults={"status": attendance_status, "notes": notes},
+                    )
+
+                    if created:
+                        created_records.append(attendance)
+                    else:
+                        updated_records.append(attendance)
+
+                except Learner.DoesNotExist:
+                    continue
 
         # Mark session as having attendance marked
         session.attendance_marked = True
@@ -976,8 +980,13 @@ class StudentManagementViewSet(TeacherSchoolContextMixin, viewsets.ViewSet):
         )
 
     def retrieve(self, request, pk=None):
-        """Get detailed information about a specific student."""
-        from apps.core.models import Artifact, Badge, Credential
+        """Get detailed information about a specific student.
+
+        Badges and artifacts are the most recent `RECENT_LIMIT` of each;
+        `totals` has the full counts and the badges/artifacts sub-resources
+        page through the rest.
+        """
+        from apps.core.models import Credential
 
         from .serializers import (
             ArtifactSerializer,
@@ -993,13 +1002,6 @@ class StudentManagementViewSet(TeacherSchoolContextMixin, viewsets.ViewSet):
                 {"detail": "Student not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        # Get student's badges
-        badges = (
-            Badge.objects.filter(learner=learner)
-            .select_related("module", "awarded_by")
-            .order_by("-awarded_at")
-        )
-
         # Get student's credentials
         credentials = Credential.objects.filter(learner=learner).order_by("-issued_at")
 
@@ -1012,22 +1014,48 @@ class StudentManagementViewSet(TeacherSchoolContextMixin, viewsets.ViewSet):
             learner=learner, is_active=True
         ).select_related("course", "current_level")
 
-        artifacts = (
-            Artifact.objects.filter(learner=learner)
-            .select_related("module")
-            .order_by("-submitted_at")
-        )
-
         return Response(
             {
                 "student": TeacherStudentSerializer(learner).data,
-                "badges": BadgeSerializer(badges, many=True).data,
+                "badges": BadgeSerializer(
+                    learner_history.recent("badges", learner), many=True
+                ).data,
                 "credentials": CredentialSerializer(credentials, many=True).data,
                 "enrollments": StudentEnrollmentSerializer(enrollments, many=True).data,
-                "artifacts": ArtifactSerializer(artifacts, many=True).data,
+                "artifacts": ArtifactSerializer(
+                    learner_history.recent("artifacts", learner), many=True
+                ).data,
+                "totals": learner_history.totals(learner, ("badges", "artifacts")),
             }
         )
 
+    def _history(self, request, pk, name, serializer_class):
+        try:
+            learner = self._teacher_learners_queryset().get(id=pk)
+        except Learner.DoesNotExist:
+            return Response(
+                {"detail": "Student not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        return STUDENT_HISTORY_FEEDS[name].get_response(
+            request,
+            learner_history.COLLECTIONS[name](learner),
+            lambda row: serializer_class(row).data,
+        )
+
+    @action(detail=True, methods=["get"])
+    def badges(self, request, pk=None):
+        """Full badge history, newest first, cursor-paginated."""
+        from .serializers import BadgeSerializer
+
+        return self._history(request, pk, "badges", BadgeSerializer)
+
+    @action(detail=True, methods=["get"])
+    def artifacts(self, request, pk=None):
+        """Full artifact history, newest first, cursor-paginated."""
+        from .serializers import ArtifactSerializer
+
+        return self._history(request, pk, "artifacts", ArtifactSerializer)
+
     @action(detail=False, methods=["post"], url_path="enroll")
     def enroll_student(self, request):
         """Enroll a student in a course.
@@ -1,6 +1,7 @@
 from django.urls import include, path
 from rest_framework import routers
 
+from .admin_job_views import AdminJobViewSet
 from .admin_monitor_views import (
     AdminAttendanceMonitorViewSet,
     AdminSessionMonitorViewSet,
@@ -9,6 +10,7 @@ from .admin_monitor_views import (
 from .admin_views import (
     AdminAnalyticsView,
     AdminAnalyticsViewSet,
+    AdminExportViewSet,
     AdminTenantViewSet,
     AdminUserViewSet,
 )
@@ -24,6 +26,7 @@ from .course_views import (
     ModuleViewSet,
 )
 from .pathway_learning_views import PathwayLearningViewSet
+from .quiz_views import StudentQuizViewSet, TeacherQuizViewSet
 from .school_views import (
     SchoolDashboardViewSet,
     SchoolPathwayViewSet,
@@ -53,6 +56,9 @@ router.register(r"artifacts", ArtifactViewSet, basename="artifacts")
 router.register(
     r"children", ChildViewSet, basename="children"
 )  # Parent's children management
+router.register(
+    r"student/quizzes", StudentQuizViewSet, basename="student-quizzes"
+)  # Quiz taking
 router.register(
     r"student", StudentDashboardViewSet, basename="student"
 )  # Student dashboard
@@ -82,12 +88,15 @@ router.register(
     r"teacher/credentials", CredentialManagementViewSet, basename="teacher-credentials"
 )
 router.register(r"teacher/tasks", TeacherTaskViewSet, basename="teacher-tasks")
+router.register(r"teacher/quizzes", TeacherQuizViewSet, basename="teacher-quizzes")
 
 # Admin endpoints
 router.register(r"admin/users", AdminUserViewSet, basename="admin-users")
 router.register(r"admin/tenants", AdminTenantViewSet, basename="admin-tenants")
 router.register(r"admin/schools", AdminTenantViewSet, basename="admin-schools")
 router.register(r"admin/analytics", AdminAnalyticsViewSet, basename="admin-analytics")
+router.register(r"admin/exports", AdminExportViewSet, basename="admin-exports")
+router.register(r"admin/jobs", AdminJobViewSet, basename="admin-jobs")
 # Admin monitoring
 router.register(
     r"admin/monitor/sessions",
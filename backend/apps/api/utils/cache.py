@@ -0,0 +1,123 @@
+"""Stale-while-revalidate response caching for expensive read-only actions.
+
+Usage on a ViewSet action::
+
+    @action(detail=False, methods=["get"])
+    @swr_cache(soft_ttl=120, hard_ttl=3600)
+    def dashboard(self, request):
+        ...
+
+Entries are keyed by view, action, the caller's data scope (role + school by
+default) and the sorted query string (optionally only the listed `params`).
+Within `soft_ttl` a cached response is served as-is. Between `soft_ttl` and
+`hard_ttl` the stale response is still served immediately, and one background
+refresh is started; a cache lock makes concurrent stale hits skip the refresh
+instead of stampeding. Past `hard_ttl` the entry is gone and the next request
+recomputes inline.
+
+Responses carry ``X-Cache`` (HIT / STALE / MISS) and ``X-Cache-Age`` (seconds
+since the payload was computed).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from functools import wraps
+
+from django.core.cache import cache
+from django.db import connections
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "swr:"
+LOCK_TIMEOUT = 120
+
+
+def user_scope(request) -> str:
+    """Data scope shared by every user who would see the same payload."""
+    user = request.user
+    return f"{getattr(user, 'role', '')}:{getattr(user, 'tenant_id', '') or ''}"
+
+
+def _cache_key(view, func_name: str, scope: str, request, names=None) -> str:
+    params = sorted(
+        (k, v)
+        for k in request.query_params
+        if names is None or k in names
+        for v in request.query_params.getlist(k)
+    )
+    digest = hashlib.md5(repr(params).encode(), usedforsecurity=False).hexdigest()
+    return f"{KEY_PREFIX}{type(view).__name__}.{func_name}:{scope}:{digest}"
+
+
+def _store(key: str, response: Response, hard_ttl: int) -> None:
+    if response.status_code == 200:
+        entry = {"data": response.data, "created": time.time()}
+        cache.set(key, entry, hard_ttl)
+
+
+def _run_in_background(fn: Callable[[], None]) -> None:
+    threading.Thread(target=fn, daemon=True).start()
+
+
+def _respond(data, state: str, age: float) -> Response:
+    response = Response(data)
+    response["X-Cache"] = state
+    response["X-Cache-Age"] = str(int(age))
+    return response
+
+
+def swr_cache(
+    soft_ttl: int = 120,
+    hard_ttl: int = 3600,
+    scope: Callable = user_scope,
+    params: Sequence[str] | None = None,
+):
+    """Cache a GET action's 200 responses with stale-while-revalidate semantics.
+
+    `params` restricts the key to the named query params (e.g. an endpoint's
+    filter set); by default every query param is part of the key.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, request, *args, **kwargs):
+            key = _cache_key(self, func.__name__, scope(request), request, params)
+            entry = cache.get(key)
+
+            if entry is None:
+                response = func(self, request, *args, **kwargs)
+                _store(key, response, hard_ttl)
+                if response.status_code == 200:
+                    response["X-Cache"] = "MISS"
+                    response["X-Cache-Age"] = "0"
+                return response
+
+            age = time.time() - entry["created"]
+            if age < soft_ttl:
+                return _respond(entry["data"], "HIT", age)
+
+            lock_key = f"{key}:lock"
+            if cache.add(lock_key, 1, LOCK_TIMEOUT):
+
+                def refresh():
+                    try:
+                        _store(key, func(self, request, *args, **kwargs), hard_ttl)
+                    except Exception:
+                        logger.exception("Background refresh failed for %s", key)
+                    finally:
+                        cache.delete(lock_key)
+                        connections.close_all()
+
+                _run_in_background(refresh)
+
+            return _respond(entry["data"], "STALE", age)
+
+        return wrapper
+
+    return decorator
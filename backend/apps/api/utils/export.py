@@ -0,0 +1,177 @@
+"""Streaming CSV / NDJSON exports for large admin datasets.
+
+Rows are read with `values_list(...).iterator(chunk_size=...)`, so only one
+chunk of tuples is held in memory at a time and no model instances are built,
+and are written straight into a `StreamingHttpResponse`. Memory stays flat no
+matter how many rows an export covers.
+
+Usage::
+
+    USER_EXPORT = [
+        ExportColumn("ID", "id"),
+        ExportColumn("School", "tenant__name", key="school"),
+        ExportColumn("Active", "is_active", csv=yes_no),
+    ]
+
+    return stream_export(request, queryset, USER_EXPORT, "users")
+
+The format is chosen with ``?export_format=csv`` (default) or
+``?export_format=ndjson``. (``?format=`` is reserved by DRF for renderer
+negotiation.)
+
+Passing `dataset` as well lets callers add ``?async=1``: the export is then
+written to a file by an ``export`` background job (see `apps.api.jobs`) and
+the response is ``202`` with the job to poll.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from io import StringIO
+
+from apps.api.utils.jobs import job_accepted, wants_async
+from apps.core.services import jobs
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+CHUNK_SIZE = 2000
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    """One exported column.
+
+    `source` is a `values_list` path; `key` names the field in NDJSON output
+    (defaults to `source`); `csv` optionally formats the value for CSV cells.
+    """
+
+    header: str
+    source: str
+    key: str | None = None
+    csv: Callable | None = None
+
+    @property
+    def json_key(self) -> str:
+        return self.key or self.source
+
+
+def yes_no(value) -> str:
+    return "Yes" if value else "No"
+
+
+def minutes(value) -> str:
+    return value.strftime("%Y-%m-%d %H:%M") if value else ""
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_chunks(
+    rows: Iterable[tuple], columns: Sequence[ExportColumn]
+) -> Iterator[str]:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([c.header for c in columns])
+    formatters = [c.csv for c in columns]
+    for i, row in enumerate(rows, 1):
+        writer.writerow(
+            [
+                fmt(v) if fmt else ("" if v is None else v)
+                for fmt, v in zip(formatters, row)
+            ]
+        )
+        if i % CHUNK_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(
+    rows: Iterable[tuple], columns: Sequence[ExportColumn]
+) -> Iterator[str]:
+    keys = [c.json_key for c in columns]
+    lines: list[str] = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(keys, row)), default=_json_default))
+        if len(lines) == CHUNK_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_rows(queryset: QuerySet, columns: Sequence[ExportColumn]) -> Iterator[tuple]:
+    """Stream the `columns` of `queryset` as tuples, one chunk at a time."""
+    return (
+        queryset.select_related(None)
+        .prefetch_related(None)
+        .values_list(*[c.source for c in columns])
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+
+
+def render_chunks(
+    rows: Iterable[tuple], columns: Sequence[ExportColumn], fmt: str
+) -> Iterator[str]:
+    return (_csv_chunks if fmt == "csv" else _ndjson_chunks)(rows, columns)
+
+
+def export_filename(basename: str, fmt: str) -> str:
+    stamp = timezone.localtime().strftime("%Y%m%d_%H%M%S")
+    return f"{basename}_{stamp}.{fmt}"
+
+
+def stream_export(
+    request,
+    queryset: QuerySet,
+    columns: Sequence[ExportColumn],
+    basename: str,
+    dataset: str | None = None,
+):
+    """Stream `queryset` as CSV or NDJSON, projected onto `columns`.
+
+    With `dataset` set and ``?async=1``, enqueue an export job instead.
+    """
+    fmt = request.query_params.get("export_format", "csv").lower()
+    if fmt not in FORMATS:
+        return Response(
+            {"error": f"Unsupported export_format. Use one of: {', '.join(FORMATS)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if dataset and wants_async(request):
+        filters = {
+            k: v
+            for k, v in request.query_params.dict().items()
+            if k not in ("async", "export_format")
+        }
+        job = jobs.enqueue(
+            "export",
+            {"dataset": dataset, "export_format": fmt, "filters": filters},
+            user=request.user,
+        )
+        return job_accepted(job, request)
+
+    response = StreamingHttpResponse(
+        render_chunks(export_rows(queryset, columns), columns, fmt),
+        content_type=FORMATS[fmt],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{export_filename(basename, fmt)}"'
+    )
+    return response
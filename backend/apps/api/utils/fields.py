@@ -0,0 +1,67 @@
+"""Sparse fieldsets (``?fields=``) and the query plans that go with them.
+
+A client that only renders a few columns can ask for just those::
+
+    GET /api/school/students/?fields=id,full_name,pathways
+
+Serializers opt in with `SparseFieldsMixin`; views read the parameter with
+`requested_fields` and pass the result both to the serializer (``fields=``)
+and to `apply_plan`, so related rows are only loaded for fields that will
+actually be rendered.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+from django.db.models import Prefetch, QuerySet
+from rest_framework import serializers
+
+
+def requested_fields(request) -> set[str] | None:
+    """Field names from ``?fields=``, or None when every field is wanted."""
+    raw = request.query_params.get("fields") if request else None
+    if not raw:
+        return None
+    return {name.strip() for name in raw.split(",") if name.strip()} or None
+
+
+class SparseFieldsMixin:
+    """Serializer mixin that keeps only the field names passed as ``fields=``.
+
+    Unknown names are rejected with a validation error (HTTP 400).
+    """
+
+    def __init__(self, *args, fields: Iterable[str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None:
+            return
+        wanted = set(fields)
+        unknown = wanted - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": f"Unknown field(s): {', '.join(sorted(unknown))}"}
+            )
+        for name in set(self.fields) - wanted:
+            self.fields.pop(name)
+
+
+def apply_plan(
+    queryset: QuerySet, plan: Mapping[str, Iterable], fields: set[str] | None
+) -> QuerySet:
+    """Add the related loads `plan` lists for each of `fields` (None = all).
+
+    Plan values are lookups: strings are joined with `select_related`,
+    `Prefetch` objects go to `prefetch_related`.
+    """
+    selects, prefetches = [], []
+    for name, lookups in plan.items():
+        if fields is not None and name not in fields:
+            continue
+        for lookup in lookups:
+            (prefetches if isinstance(lookup, Prefetch) else selects).append(lookup)
+    if selects:
+        queryset = queryset.select_related(*selects)
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    return queryset
@@ -0,0 +1,17 @@
+"""Cursor paginators for the learner history sub-resource endpoints.
+
+Shared by the school and teacher student views; one `KeysetPaginator` per
+`apps.core.services.learner_history` collection, in that collection's
+newest-first ordering.
+"""
+
+from __future__ import annotations
+
+from apps.core.services import learner_history
+
+from .pagination import KeysetPaginator
+
+STUDENT_HISTORY_FEEDS = {
+    name: KeysetPaginator(ordering=ordering)
+    for name, ordering in learner_history.ORDERINGS.items()
+}
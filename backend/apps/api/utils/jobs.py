@@ -0,0 +1,51 @@
+"""Helpers for endpoints that hand long operations to a background job.
+
+Heavy endpoints accept ``?async=1`` (or an ``async`` form field). They then
+enqueue a `Job` and answer ``202 Accepted`` with the job payload, and the
+client polls ``/api/admin/jobs/{id}/`` instead of holding the request open.
+"""
+
+from __future__ import annotations
+
+from apps.core.models import Job
+from rest_framework import status
+from rest_framework.response import Response
+
+TRUE_VALUES = ("1", "true", "yes")
+
+
+def wants_async(request) -> bool:
+    value = request.query_params.get("async")
+    if value is None and hasattr(request, "data"):
+        value = request.data.get("async")
+    return str(value or "").lower() in TRUE_VALUES
+
+
+def serialize_job(job: Job, request=None) -> dict:
+    download_url = None
+    if job.result_file:
+        download_url = f"/api/admin/jobs/{job.id}/download/"
+        if request is not None:
+            download_url = request.build_absolute_uri(download_url)
+    return {
+        "id": str(job.id),
+        "kind": job.kind,
+        "status": job.status,
+        "params": job.params,
+        "progress": {
+            "done": job.progress_done,
+            "total": job.progress_total,
+            "message": job.progress_message,
+        },
+        "result": job.result,
+        "error": job.error,
+        "download_url": download_url,
+        "created_by": job.created_by_id,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+def job_accepted(job: Job, request) -> Response:
+    return Response(serialize_job(job, request), status=status.HTTP_202_ACCEPTED)
@@ -0,0 +1,175 @@
+"""Keyset (seek) pagination for list endpoints over large, append-heavy tables.
+
+Offset pagination makes the database walk and discard every skipped row, so
+page N costs O(N * page_size). A keyset page instead resumes strictly after
+the last row of the previous page using the ordering columns as a composite
+key, so every page costs one index range scan regardless of depth.
+
+Cursors are opaque, URL-safe base64 tokens encoding the ordering values of the
+last row served. Totals are opt-in via ``?total=exact`` or ``?total=estimate``
+(planner row estimate on PostgreSQL, exact count elsewhere).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, time
+from uuid import UUID
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import Q, QuerySet
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _encode_value(value):
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, width: int) -> list:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != width:
+        raise InvalidCursor("Invalid cursor")
+    return values
+
+
+def estimated_count(qs: QuerySet) -> int:
+    """Planner row estimate on PostgreSQL; exact COUNT(*) on other backends."""
+    qs = qs.order_by()
+    connection = connections[qs.db]
+    if connection.vendor != "postgresql":
+        return qs.count()
+    sql, params = qs.values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPaginator:
+    """Seek pagination over a fixed, unique ordering.
+
+    `ordering` uses Django ``order_by`` syntax and must end in a unique column
+    (normally ``"-id"``) so that the composite key totally orders the rows.
+    """
+
+    def __init__(
+        self,
+        ordering: Sequence[str],
+        default_page_size: int = 50,
+        max_page_size: int = 200,
+    ):
+        self.ordering = tuple(ordering)
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+
+    def _fields(self) -> list[tuple[str, bool]]:
+        return [(f.lstrip("-"), f.startswith("-")) for f in self.ordering]
+
+    def _after(self, values: Sequence) -> Q:
+        """Rows strictly after `values` in the paginator's ordering."""
+        condition = Q()
+        equal = Q()
+        for (field, descending), value in zip(self._fields(), values):
+            lookup = "lt" if descending else "gt"
+            condition |= equal & Q(**{f"{field}__{lookup}": value})
+            equal &= Q(**{field: value})
+        return condition
+
+    def _coerce(self, qs: QuerySet, values: Sequence) -> list:
+        """Cursor `values` as the ordering columns' Python types.
+
+        Well-formed JSON can still carry values the columns reject (a bad
+        date or UUID); those would otherwise fail when the query is built.
+        """
+        out = []
+        for (path, _), value in zip(self._fields(), values):
+            field, model = None, qs.model
+            if path in qs.query.annotations:
+                field = qs.query.annotations[path].output_field
+            else:
+                try:
+                    for part in path.split("__"):
+                        field = model._meta.get_field(part)
+                        model = field.related_model
+                except (AttributeError, FieldDoesNotExist):
+                    field = None
+            try:
+                out.append(value if field is None else field.to_python(value))
+            except (ValidationError, ValueError, TypeError) as exc:
+                raise InvalidCursor("Invalid cursor") from exc
+        return out
+
+    def _key_of(self, obj) -> list:
+        out = []
+        for field, _ in self._fields():
+            value = obj
+            for part in field.split("__"):
+                value = getattr(value, part)
+            out.append(value)
+        return out
+
+    def page_size(self, request) -> int:
+        try:
+            size = int(request.query_params.get("page_size", self.default_page_size))
+        except (TypeError, ValueError):
+            size = self.default_page_size
+        return max(1, min(size, self.max_page_size))
+
+    def paginate(self, request, qs: QuerySet) -> tuple[list, str | None]:
+        """Return (rows, next_cursor) for the page requested by ``?cursor=``."""
+        size = self.page_size(request)
+        page_qs = qs.order_by(*self.ordering)
+        token = request.query_params.get("cursor")
+        if token:
+            values = self._coerce(qs, decode_cursor(token, len(self.ordering)))
+            page_qs = page_qs.filter(self._after(values))
+        rows = list(page_qs[: size + 1])
+        has_more = len(rows) > size
+        rows = rows[:size]
+        next_cursor = encode_cursor(self._key_of(rows[-1])) if has_more else None
+        return rows, next_cursor
+
+    def get_response(
+        self, request, qs: QuerySet, serialize: Callable[[object], dict]
+    ) -> Response:
+        try:
+            rows, next_cursor = self.paginate(request, qs)
+        except InvalidCursor as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        payload = {
+            "results": [serialize(row) for row in rows],
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
+        mode = request.query_params.get("total")
+        if mode == "exact":
+            payload["total"] = qs.count()
+            payload["total_is_estimate"] = False
+        elif mode == "estimate":
+            payload["total"] = estimated_count(qs)
+            payload["total_is_estimate"] = connections[qs.db].vendor == "postgresql"
+        return Response(payload)
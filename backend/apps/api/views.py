@@ -156,7 +156,7 @@ class LearnerViewSet(viewsets.ModelViewSet):
         learner = self.get_object()
         from datetime import date
 
-        from apps.core.models import Activity, Session
+        from apps.core.models import Activity, LearnerLevelProgress, Session
         from django.db.models import Q
 
         # 1. Pathways (Enrollments)
@@ -235,7 +235,9 @@ class LearnerViewSet(viewsets.ModelViewSet):
         # For now, simplistic approach: recently updated progress that isn't complete
         active_projects = []
         progress_records = (
-            learner.level_progress.filter(completed=False)
+            LearnerLevelProgress.objects.filter(
+                enrollment__learner=learner, completed=False
+            )
             .select_related("level", "level__course")
             .order_by("-updated_at")[:3]
         )
@@ -255,23 +257,19 @@ class LearnerViewSet(viewsets.ModelViewSet):
                 }
             )
 
-        # 4. Badges (Achievements)
-        # Using Achievement model if populated, otherwise mock/derived logic
-        # For now, let's look at completed levels as badges
-        completed_levels = learner.level_progress.filter(completed=True).select_related(
-            "level", "level__course"
-        )
-        badges = []
-        for p in completed_levels:
-            badges.append(
-                {
-                    "id": str(p.id),
-                    "name": p.level.name,
-                    "course": p.level.course.name,
-                    "icon": "award",
-                    "earned_at": p.completed_at,
-                }
+        # 4. Badges (Achievements, awarded on level and course completion)
+        badges = [
+            {
+                "id": str(a.id),
+                "name": a.name,
+                "course": a.course.name if a.course else "",
+                "icon": a.icon or "award",
+                "earned_at": a.earned_at,
+            }
+            for a in learner.achievements.select_related("course").order_by(
+                "-earned_at"
             )
+        ]
 
         return Response(
             {
@@ -5,3 +5,5 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
 
+    def ready(self):
+        from . import signals  # noqa: F401
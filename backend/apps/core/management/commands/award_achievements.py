@@ -0,0 +1,35 @@
+"""Award achievements for levels and courses completed before awards were
+automatic.
+
+Promotion records new completions as they happen; run this once after
+deploying, and after completions written by raw SQL or bulk updates.
+"""
+
+from __future__ import annotations
+
+from apps.core.services import achievements, promotion
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Backfill level and course completion achievements."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course",
+            help="Only backfill enrollments in this course (id).",
+        )
+        parser.add_argument(
+            "--school",
+            help="Only backfill enrollments of this school's learners (id).",
+        )
+
+    def handle(self, *args, **options):
+        considered = achievements.backfill_queryset(
+            promotion.cohort(options["course"], options["school"])
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {considered} completion(s); missing achievements awarded."
+            )
+        )
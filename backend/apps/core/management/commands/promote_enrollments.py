@@ -0,0 +1,36 @@
+"""Promote enrollments through every level whose criteria are already met.
+
+Promotion normally runs after each progress update; use this after bulk
+progress changes, raw SQL, or edits to level requirements, to bring a whole
+cohort up to date.
+"""
+
+from __future__ import annotations
+
+from apps.core.services import promotion
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Run level promotion for active enrollments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course",
+            help="Only promote enrollments in this course (id).",
+        )
+        parser.add_argument(
+            "--school",
+            help="Only promote enrollments of this school's learners (id).",
+        )
+
+    def handle(self, *args, **options):
+        promotions = promotion.promote_queryset(
+            promotion.cohort(options["course"], options["school"])
+        )
+        levels = sum(p.levels_completed for p in promotions)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Promoted {len(promotions)} enrollment(s) through {levels} level(s)."
+            )
+        )
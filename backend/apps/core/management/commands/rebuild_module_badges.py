@@ -0,0 +1,21 @@
+"""Recompute the earned module badge set of every learner.
+
+Signals keep `EarnedModuleBadge` current when attendance is marked and
+sessions complete; run this after bulk writes or raw SQL that bypass model
+signals (e.g. ``QuerySet.update`` on sessions or attendance).
+"""
+
+from __future__ import annotations
+
+from apps.core.services import module_badges
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recompute earned module badges from attendance."
+
+    def handle(self, *args, **options):
+        changed = module_badges.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt module badges ({changed} row(s) changed).")
+        )
@@ -0,0 +1,43 @@
+"""Re-derive level progress counters from artifacts, quizzes and attendance.
+
+Signals keep counters current as evidence is recorded; run this once after
+deploying to backfill existing progress rows, and after bulk writes or raw
+SQL that bypass model signals. Enrollments whose criteria become satisfied
+are promoted.
+"""
+
+from __future__ import annotations
+
+from apps.core.models import LearnerLevelProgress
+from apps.core.services import progress_events
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Re-derive level progress counters from recorded evidence."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course",
+            help="Only rebuild progress in this course (id).",
+        )
+        parser.add_argument(
+            "--school",
+            help="Only rebuild progress of this school's learners (id).",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Set counters from evidence alone, discarding manual entries.",
+        )
+
+    def handle(self, *args, **options):
+        qs = LearnerLevelProgress.objects.filter(enrollment__is_active=True)
+        if options["course"]:
+            qs = qs.filter(level__course_id=options["course"])
+        if options["school"]:
+            qs = qs.filter(enrollment__learner__tenant_id=options["school"])
+        changed = progress_events.rebuild_queryset(qs, reset=options["reset"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated counters on {changed} progress row(s).")
+        )
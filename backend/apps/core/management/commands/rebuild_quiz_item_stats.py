@@ -0,0 +1,31 @@
+"""Recompute quiz item statistics from completed attempts.
+
+Submissions through the API keep `QuizItemStatistics` current and a quiz's
+row is rebuilt on next use after the quiz is edited; run this after
+attempts are imported, deleted or rewritten outside the submit endpoint.
+"""
+
+from __future__ import annotations
+
+from apps.core.models import Quiz
+from apps.core.services import quiz_item_stats
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recompute per-question statistics of quiz attempts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--quiz", help="Only rebuild this quiz (id).")
+
+    def handle(self, *args, **options):
+        quizzes = Quiz.objects.order_by("pk")
+        if options["quiz"]:
+            quizzes = quizzes.filter(pk=options["quiz"])
+        count = 0
+        for quiz in quizzes.iterator():
+            quiz_item_stats.rebuild(quiz)
+            count += 1
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt item statistics for {count} quiz(zes).")
+        )
@@ -0,0 +1,21 @@
+"""Recompute the teacher → learner access table.
+
+Signals keep `TeacherLearnerAccess` current for ordinary saves and course
+assignment changes; run this after bulk writes or raw SQL that bypass model
+signals (e.g. ``QuerySet.update`` on enrollments).
+"""
+
+from __future__ import annotations
+
+from apps.core.services import teacher_access
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recompute which learners each teacher may access."
+
+    def handle(self, *args, **options):
+        changed = teacher_access.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt teacher access ({changed} row(s) changed).")
+        )
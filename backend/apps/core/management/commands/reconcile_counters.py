@@ -0,0 +1,21 @@
+"""Recompute the cached admin overview counters from the database.
+
+Counters already self-heal when their cache keys expire; schedule this
+(e.g. hourly) to bound drift more tightly, or run it after bulk imports
+and raw SQL that bypass model signals.
+"""
+
+from __future__ import annotations
+
+from apps.core.services import counters
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Reconcile cached platform overview counters against the database."
+
+    def handle(self, *args, **options):
+        values = counters.reconcile()
+        for name, n in values.items():
+            self.stdout.write(f"{name}: {n}")
+        self.stdout.write(self.style.SUCCESS(f"Reconciled {len(values)} counters."))
@@ -0,0 +1,59 @@
+"""Rebuild `DailySchoolStats` rollups from the raw tables.
+
+Intended to run nightly (e.g. a cron job calling
+``python manage.py reconcile_daily_stats``) to repair drift from writes that
+bypass model signals. Use ``--all`` once after deploying to backfill history.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from apps.core.services import rollups
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = "Recompute daily per-school analytics rollups."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Rebuild this many trailing days, including today (default: 7).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild every day that has any source data.",
+        )
+        parser.add_argument(
+            "--chunk-days",
+            type=int,
+            default=31,
+            help="Days rebuilt per transaction (default: 31).",
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        if options["all"]:
+            bounds = rollups.data_date_range()
+            if bounds is None:
+                self.stdout.write("No source data; nothing to rebuild.")
+                return
+            start, end = bounds
+            end = max(end, today)
+        else:
+            start = today - timedelta(days=max(options["days"], 1) - 1)
+            end = today
+
+        written = rollups.rebuild_range(start, end, options["chunk_days"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt daily stats for {start.isoformat()}..{end.isoformat()} "
+                f"({written} rows)."
+            )
+        )
@@ -0,0 +1,31 @@
+"""Recompute denormalized progress aggregates on course enrollments.
+
+Signals keep the columns current for ordinary saves; run this once after
+deploying to backfill existing enrollments, and after bulk writes or raw SQL
+that bypass model signals.
+"""
+
+from __future__ import annotations
+
+from apps.core.models import LearnerCourseEnrollment
+from apps.core.services import enrollment_progress
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recompute enrollment progress aggregates from level progress."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course",
+            help="Only refresh enrollments in this course (id).",
+        )
+
+    def handle(self, *args, **options):
+        qs = LearnerCourseEnrollment.objects.all()
+        if options["course"]:
+            qs = qs.filter(course_id=options["course"])
+        changed = enrollment_progress.refresh_queryset(qs)
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed progress for {changed} enrollment(s).")
+        )
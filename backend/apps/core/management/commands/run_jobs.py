@@ -0,0 +1,58 @@
+"""Database-backed background job worker.
+
+Used when no Celery broker is configured (``JOBS_BACKEND=db``): polls for
+queued `Job` rows and runs them one at a time. Run it as its own process,
+e.g. a ``worker: python manage.py run_jobs`` Procfile entry; several
+workers may run side by side, since each job is claimed atomically.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import time
+
+from apps.core.services import jobs
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs from the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to sleep when the queue is empty (default: 2).",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=0,
+            help="Exit after running this many jobs (default: no limit).",
+        )
+
+    def handle(self, *args, **options):
+        worker = f"db:{socket.gethostname()}:{os.getpid()}"
+        ran = 0
+        try:
+            while not options["max_jobs"] or ran < options["max_jobs"]:
+                close_old_connections()
+                job = jobs.run_next(worker)
+                if job is None:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+                ran += 1
+                self.stdout.write(f"{job.kind} {job.pk}: {job.status}")
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Ran {ran} job(s)."))
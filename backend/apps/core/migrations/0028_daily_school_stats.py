@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:32
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0027_artifact_optional_tenant"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailySchoolStats",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("date", models.DateField(db_index=True)),
+                ("new_users", models.PositiveIntegerField(default=0)),
+                ("new_enrollments", models.PositiveIntegerField(default=0)),
+                ("sessions_created", models.PositiveIntegerField(default=0)),
+                ("sessions_total", models.PositiveIntegerField(default=0)),
+                ("sessions_completed", models.PositiveIntegerField(default=0)),
+                ("sessions_scheduled", models.PositiveIntegerField(default=0)),
+                ("attendance_total", models.PositiveIntegerField(default=0)),
+                ("attendance_present", models.PositiveIntegerField(default=0)),
+                ("attendance_absent", models.PositiveIntegerField(default=0)),
+                ("attendance_late", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "school",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="core.school",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily School Stats",
+                "verbose_name_plural": "Daily School Stats",
+                "db_table": "core_daily_school_stats",
+                "ordering": ["date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("school__isnull", False)),
+                        fields=("school", "date"),
+                        name="uniq_daily_stats_school_date",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("school__isnull", True)),
+                        fields=("date",),
+                        name="uniq_daily_stats_unassigned_date",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0028_daily_school_stats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["session", "marked_at", "id"],
+                name="core_attend_session_44eb40_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(
+                fields=["date", "created_at", "id"], name="core_sessio_date_f752fd_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="teachertask",
+            index=models.Index(
+                fields=["created_at", "id"], name="core_teache_created_e69d27_idx"
+            ),
+        ),
+    ]
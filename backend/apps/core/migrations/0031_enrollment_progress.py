@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0030_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="learnercourseenrollment",
+            name="artifacts_submitted",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="learnercourseenrollment",
+            name="average_score",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name="learnercourseenrollment",
+            name="completion_percentage",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="learnercourseenrollment",
+            name="modules_completed",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="learnercourseenrollment",
+            name="progress_status",
+            field=models.CharField(
+                choices=[
+                    ("on_track", "On Track"),
+                    ("needs_attention", "Needs Attention"),
+                    ("completed", "Completed"),
+                ],
+                default="on_track",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="learnercourseenrollment",
+            name="progress_updated_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="learnercourseenrollment",
+            name="total_modules",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Sum of required modules over the course's levels"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="learnercourseenrollment",
+            index=models.Index(
+                fields=["enrolled_at", "id"], name="enroll_enrolled_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="learnercourseenrollment",
+            index=models.Index(
+                fields=["completion_percentage", "id"], name="enroll_completion_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="learnercourseenrollment",
+            index=models.Index(
+                fields=["average_score", "id"], name="enroll_score_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="learnercourseenrollment",
+            index=models.Index(
+                fields=["progress_status", "id"], name="enroll_status_id_idx"
+            ),
+        ),
+    ]
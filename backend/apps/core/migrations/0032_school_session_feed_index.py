@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0031_enrollment_progress"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(
+                fields=["tenant", "date", "created_at", "id"],
+                name="core_sessio_tenant__d34461_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0032_school_session_feed_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="achievement",
+            index=models.Index(
+                fields=["earned_at", "id"], name="core_achiev_earned__7d2abf_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artifact",
+            index=models.Index(
+                fields=["submitted_at", "id"], name="core_artifa_submitt_625169_idx"
+            ),
+        ),
+    ]
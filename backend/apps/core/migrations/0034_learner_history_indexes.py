@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0033_badge_artifact_feed_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="artifact",
+            index=models.Index(
+                fields=["learner", "submitted_at", "id"],
+                name="core_artifa_learner_55d20e_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["learner", "marked_at", "id"],
+                name="core_attend_learner_0da12f_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:52
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    """Seed access pairs from active enrollments and course teachers."""
+    Enrollment = apps.get_model("core", "LearnerCourseEnrollment")
+    Access = apps.get_model("core", "TeacherLearnerAccess")
+    pairs = (
+        Enrollment.objects.filter(is_active=True, course__teachers__isnull=False)
+        .values_list("course__teachers", "learner_id")
+        .distinct()
+    )
+    Access.objects.bulk_create(
+        [Access(teacher_id=t, learner_id=lr) for t, lr in pairs.iterator()],
+        ignore_conflicts=True,
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0034_learner_history_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TeacherLearnerAccess",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "learner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="teacher_access",
+                        to="core.learner",
+                    ),
+                ),
+                (
+                    "teacher",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="learner_access",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Teacher Learner Access",
+                "verbose_name_plural": "Teacher Learner Access",
+                "db_table": "core_teacher_learner_access",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("teacher", "learner"),
+                        name="uniq_teacher_learner_access",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:58
+
+import django.utils.timezone
+from django.db import migrations, models
+
+# Auto-awarded achievement type -> the field it is unique on per learner.
+AWARD_KEYS = {"level_complete": "level", "course_complete": "course"}
+
+
+def merge_duplicates(apps, schema_editor):
+    """Keep the earliest of each learner's duplicate level/course awards.
+
+    Before the constraints, racing promotions could award the same
+    completion twice. Nothing references achievements, so the later copies
+    are simply deleted.
+    """
+    Achievement = apps.get_model("core", "Achievement")
+    for achievement_type, field in AWARD_KEYS.items():
+        awards = Achievement.objects.filter(
+            achievement_type=achievement_type, **{f"{field}__isnull": False}
+        )
+        clashes = (
+            awards.order_by()
+            .values("learner_id", f"{field}_id")
+            .annotate(n=models.Count("id"))
+            .filter(n__gt=1)
+            .values_list("learner_id", f"{field}_id")
+        )
+        for learner_id, key in list(clashes):
+            copies = awards.filter(learner_id=learner_id, **{f"{field}_id": key})
+            earliest = copies.order_by("earned_at", "id").first()
+            copies.exclude(pk=earliest.pk).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0035_teacher_learner_access"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="achievement",
+            name="earned_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name="achievement",
+            index=models.Index(
+                fields=["learner", "-earned_at"], name="core_achiev_learner_94e3a4_idx"
+            ),
+        ),
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="achievement",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("achievement_type", "level_complete")),
+                fields=("learner", "level"),
+                name="uniq_achievement_level_complete",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="achievement",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("achievement_type", "course_complete")),
+                fields=("learner", "course"),
+                name="uniq_achievement_course_complete",
+            ),
+        ),
+    ]
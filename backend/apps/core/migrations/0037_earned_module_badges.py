@@ -0,0 +1,81 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:03
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    """Seed earned badges from present attendance at completed sessions."""
+    Attendance = apps.get_model("core", "Attendance")
+    Badge = apps.get_model("core", "EarnedModuleBadge")
+    rows = (
+        Attendance.objects.filter(status="present", session__status="completed")
+        .order_by()
+        .values_list("learner_id", "session__module_id")
+        .annotate(earned_on=models.Min("session__date"))
+    )
+    Badge.objects.bulk_create(
+        [
+            Badge(learner_id=learner_id, module_id=module_id, earned_on=day)
+            for learner_id, module_id, day in rows.iterator()
+        ],
+        ignore_conflicts=True,
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0036_achievement_awards"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EarnedModuleBadge",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "earned_on",
+                    models.DateField(help_text="Date of the first qualifying session"),
+                ),
+                (
+                    "learner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="module_badges",
+                        to="core.learner",
+                    ),
+                ),
+                (
+                    "module",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="earned_badges",
+                        to="core.module",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Earned Module Badge",
+                "verbose_name_plural": "Earned Module Badges",
+                "db_table": "core_earned_module_badge",
+                "ordering": ["earned_on"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("learner", "module"), name="uniq_earned_module_badge"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:17
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0037_earned_module_badges"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuizItemStatistics",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "revision",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Quiz updated_at the counts were built for",
+                        null=True,
+                    ),
+                ),
+                ("attempt_count", models.PositiveIntegerField(default=0)),
+                ("total_sum", models.BigIntegerField(default=0)),
+                ("total_sq_sum", models.BigIntegerField(default=0)),
+                ("correct_counts", models.JSONField(default=list)),
+                (
+                    "correct_total_sums",
+                    models.JSONField(
+                        default=list,
+                        help_text="Sum of attempt totals among correct answers",
+                    ),
+                ),
+                (
+                    "option_counts",
+                    models.JSONField(
+                        default=list, help_text="Times each option was chosen"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "quiz",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="item_statistics",
+                        to="core.quiz",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Quiz Item Statistics",
+                "verbose_name_plural": "Quiz Item Statistics",
+                "db_table": "core_quiz_item_statistics",
+            },
+        ),
+    ]
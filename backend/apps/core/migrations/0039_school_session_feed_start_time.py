@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:49
+
+import datetime
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0038_quiz_item_statistics"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="session",
+            name="core_sessio_tenant__d34461_idx",
+        ),
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(
+                models.F("tenant"),
+                models.F("date"),
+                django.db.models.functions.comparison.Coalesce(
+                    "start_time", models.Value(datetime.time(0, 0))
+                ),
+                models.F("id"),
+                name="core_session_feed_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill(apps, schema_editor):
+    """Copy each enrollment's learner tenant onto the enrollment."""
+    Enrollment = apps.get_model("core", "LearnerCourseEnrollment")
+    Learner = apps.get_model("core", "Learner")
+    Enrollment.objects.update(
+        school_id=models.Subquery(
+            Learner.objects.filter(pk=models.OuterRef("learner_id")).values(
+                "tenant_id"
+            )[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0039_school_session_feed_start_time"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="learnercourseenrollment",
+            name="enroll_enrolled_id_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="learnercourseenrollment",
+            name="enroll_completion_id_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="learnercourseenrollment",
+            name="enroll_score_id_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="learnercourseenrollment",
+            name="enroll_status_id_idx",
+        ),
+        migrations.AddField(
+            model_name="learnercourseenrollment",
+            name="school",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="core.school",
+            ),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="learnercourseenrollment",
+            index=models.Index(
+                fields=["school", "enrolled_at", "id"], name="enroll_enrolled_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="learnercourseenrollment",
+            index=models.Index(
+                fields=["school", "completion_percentage", "id"],
+                name="enroll_completion_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="learnercourseenrollment",
+            index=models.Index(
+                fields=["school", "average_score", "id"], name="enroll_score_id_idx"
+            ),
+        ),
+    ]
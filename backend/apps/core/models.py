@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import uuid
+from datetime import time
 
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from .managers import TenantManager
 
@@ -249,6 +252,14 @@ class Artifact(TenantModel):
         help_text="Optional reason provided when rejecting a student artifact",
     )
 
+    class Meta:
+        indexes = [
+            # Keyset pagination of the school artifacts feed.
+            models.Index(fields=["submitted_at", "id"]),
+            # A learner's artifact history (apps.core.services.learner_history).
+            models.Index(fields=["learner", "submitted_at", "id"]),
+        ]
+
 
 class Module(BaseUUIDModel):
     """Curriculum module catalog - Global content shared across all schools."""
@@ -443,11 +454,20 @@ class TeacherTask(BaseUUIDModel):
         verbose_name = "Teacher Task"
         verbose_name_plural = "Teacher Tasks"
         ordering = ["due_date", "-priority"]
+        indexes = [
+            # Keyset pagination for the admin task monitor.
+            models.Index(fields=["created_at", "id"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.teacher.get_full_name()})"
 
 
+# Sort key for a session's time of day; sessions without a start time sort
+# first within their date.
+SESSION_START_SORT = Coalesce("start_time", models.Value(time.min))
+
+
 class Session(TenantModel):
     """Learning session delivered by a teacher.
 
@@ -500,6 +520,16 @@ class Session(TenantModel):
         indexes = [
             models.Index(fields=["teacher", "date"]),
             models.Index(fields=["status", "date"]),
+            # Keyset pagination for the admin session monitor.
+            models.Index(fields=["date", "created_at", "id"]),
+            # Windowed, keyset-paginated school session feed.
+            models.Index(
+                models.F("tenant"),
+                models.F("date"),
+                SESSION_START_SORT,
+                models.F("id"),
+                name="core_session_feed_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -534,6 +564,13 @@ class Attendance(BaseUUIDModel):
         verbose_name_plural = "Attendance Records"
         unique_together = [["session", "learner"]]
         ordering = ["-marked_at"]
+        indexes = [
+            # Keyset pagination for the admin attendance monitor: the planner
+            # walks sessions by date and seeks into each session's rows here.
+            models.Index(fields=["session", "marked_at", "id"]),
+            # A learner's attendance history (apps.core.services.learner_history).
+            models.Index(fields=["learner", "marked_at", "id"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.learner.full_name} - {self.session} ({self.status})"
@@ -666,6 +703,16 @@ class LearnerCourseEnrollment(BaseUUIDModel):
     course = models.ForeignKey(
         Course, on_delete=models.CASCADE, related_name="enrollments"
     )
+    # Copy of `learner.tenant` so the school progress list can filter and
+    # sort on one table; kept in sync by `save` and apps.core.signals.
+    school = models.ForeignKey(
+        School,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
     current_level = models.ForeignKey(
         CourseLevel,
         on_delete=models.SET_NULL,
@@ -680,12 +727,44 @@ class LearnerCourseEnrollment(BaseUUIDModel):
     )
     is_active = models.BooleanField(default=True, db_index=True)
 
+    # Denormalized aggregates over `level_progress`, refreshed by
+    # apps.core.signals via apps.core.services.enrollment_progress.
+    PROGRESS_STATUS_CHOICES = [
+        ("on_track", "On Track"),
+        ("needs_attention", "Needs Attention"),
+        ("completed", "Completed"),
+    ]
+    modules_completed = models.PositiveIntegerField(default=0)
+    total_modules = models.PositiveIntegerField(
+        default=0, help_text="Sum of required modules over the course's levels"
+    )
+    artifacts_submitted = models.PositiveIntegerField(default=0)
+    average_score = models.FloatField(default=0)
+    completion_percentage = models.PositiveSmallIntegerField(default=0)
+    progress_status = models.CharField(
+        max_length=20, choices=PROGRESS_STATUS_CHOICES, default="on_track"
+    )
+    progress_updated_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         db_table = "core_learner_course_enrollment"
         verbose_name = "Course Enrollment"
         verbose_name_plural = "Course Enrollments"
         unique_together = [["learner", "course"]]
         ordering = ["-enrolled_at"]
+        indexes = [
+            # Keyset sort keys for the school progress list.
+            models.Index(
+                fields=["school", "enrolled_at", "id"], name="enroll_enrolled_id_idx"
+            ),
+            models.Index(
+                fields=["school", "completion_percentage", "id"],
+                name="enroll_completion_id_idx",
+            ),
+            models.Index(
+                fields=["school", "average_score", "id"], name="enroll_score_id_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         level_info = (
@@ -695,6 +774,14 @@ class LearnerCourseEnrollment(BaseUUIDModel):
         )
         return f"{self.learner.full_name} in {self.course.name} ({level_info})"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "learner" in update_fields:
+            self.school_id = self.learner.tenant_id
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "school"}
+        super().save(*args, **kwargs)
+
     def get_completed_levels(self):
         """Get all completed levels for this enrollment."""
         return self.level_progress.filter(completed=True).order_by(
@@ -702,55 +789,15 @@ class LearnerCourseEnrollment(BaseUUIDModel):
         )
 
     def check_and_promote(self):
-        """Check if learner can be promoted to next level and do so if eligible.
+        """Promote the learner through every level whose criteria are met.
 
-        Returns True if promotion occurred, False otherwise.
+        Locks the enrollment for the duration (see
+        apps.core.services.promotion). Returns True if promotion occurred,
+        False otherwise.
         """
-        if not self.current_level:
-            return False
-
-        # Get progress for current level
-        try:
-            progress = self.level_progress.get(level=self.current_level)
-        except LearnerLevelProgress.DoesNotExist:
-            return False
-
-        # Check if all criteria are met
-        if not progress.is_complete():
-            return False
-
-        # Mark current level as completed
-        if not progress.completed:
-            progress.completed = True
-            from django.utils import timezone
-
-            progress.completed_at = timezone.now()
-            progress.save()
-
-        # Find next level
-        next_level = CourseLevel.objects.filter(
-            course=self.course, level_number=self.current_level.level_number + 1
-        ).first()
-
-        if next_level:
-            # Promote to next level
-            self.current_level = next_level
-            self.save()
+        from apps.core.services import promotion
 
-            # Create progress record for new level
-            LearnerLevelProgress.objects.get_or_create(
-                enrollment=self, level=next_level
-            )
-            return True
-        else:
-            # Course completed!
-            from django.utils import timezone
-
-            self.completed_at = timezone.now()
-            self.save()
-            return True
-
-        return False
+        return promotion.promote(self) is not None
 
 
 class LearnerLevelProgress(BaseUUIDModel):
@@ -849,7 +896,15 @@ class LearnerLevelProgress(BaseUUIDModel):
         if score is not None and score > self.assessment_score:
             self.assessment_score = score
 
-        self.save()
+        # Leave `completed` to the promotion engine, which may be setting it.
+        self.save(
+            update_fields=[
+                "modules_completed",
+                "artifacts_submitted",
+                "assessment_score",
+                "updated_at",
+            ]
+        )
 
         # Check for auto-promotion
         self.enrollment.check_and_promote()
@@ -885,13 +940,33 @@ class Achievement(BaseUUIDModel):
         CourseLevel, on_delete=models.SET_NULL, null=True, blank=True
     )
 
-    earned_at = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: backfilled awards carry the original completion time.
+    earned_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = "core_achievement"
         verbose_name = "Achievement"
         verbose_name_plural = "Achievements"
         ordering = ["-earned_at"]
+        indexes = [
+            # Keyset pagination of the school badges feed.
+            models.Index(fields=["earned_at", "id"]),
+            # A learner's badges, newest first (dashboards).
+            models.Index(fields=["learner", "-earned_at"]),
+        ]
+        constraints = [
+            # Automatic awards are written at most once per level / course.
+            models.UniqueConstraint(
+                fields=["learner", "level"],
+                condition=models.Q(achievement_type="level_complete"),
+                name="uniq_achievement_level_complete",
+            ),
+            models.UniqueConstraint(
+                fields=["learner", "course"],
+                condition=models.Q(achievement_type="course_complete"),
+                name="uniq_achievement_course_complete",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.learner.full_name} - {self.name}"
@@ -1117,3 +1192,241 @@ class QuizAttempt(BaseUUIDModel):
 
     def __str__(self) -> str:
         return f"{self.learner.full_name} - {self.quiz.title} ({self.score}%)"
+
+
+class QuizItemStatistics(BaseUUIDModel):
+    """Running per-question statistics over a quiz's completed attempts.
+
+    Holds sufficient statistics (counts and sums) rather than derived
+    figures, so each submitted attempt is folded in without re-reading
+    earlier answers; difficulty and point-biserial discrimination are
+    derived on read (see `apps.core.services.quiz_item_stats`). The row
+    is only valid for the quiz revision in `revision`: editing the quiz
+    makes it stale and it is recomputed on next use.
+    ``rebuild_quiz_item_stats`` recomputes rows after bulk writes.
+    """
+
+    quiz = models.OneToOneField(
+        Quiz, on_delete=models.CASCADE, related_name="item_statistics"
+    )
+    revision = models.DateTimeField(
+        null=True, blank=True, help_text="Quiz updated_at the counts were built for"
+    )
+    attempt_count = models.PositiveIntegerField(default=0)
+    # Attempt total = number of questions answered correctly.
+    total_sum = models.BigIntegerField(default=0)
+    total_sq_sum = models.BigIntegerField(default=0)
+    # Per question, in question order.
+    correct_counts = models.JSONField(default=list)
+    correct_total_sums = models.JSONField(
+        default=list, help_text="Sum of attempt totals among correct answers"
+    )
+    option_counts = models.JSONField(
+        default=list, help_text="Times each option was chosen"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "core_quiz_item_statistics"
+        verbose_name = "Quiz Item Statistics"
+        verbose_name_plural = "Quiz Item Statistics"
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"Item statistics for {self.quiz_id} ({self.attempt_count} attempts)"
+
+
+# =============================================================================
+# ANALYTICS ROLLUPS
+# =============================================================================
+
+
+class DailySchoolStats(BaseUUIDModel):
+    """Per-school, per-day counters backing the admin analytics dashboard.
+
+    Rows are adjusted incrementally by signals (see `apps.core.signals`) and
+    rebuilt nightly by the `reconcile_daily_stats` management command, so
+    dashboard reads scan one row per school per day instead of the raw tables.
+
+    `school` is null for activity not tied to a school (e.g. platform admins,
+    parents, independent learners).
+    """
+
+    school = models.ForeignKey(
+        School,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="daily_stats",
+    )
+    date = models.DateField(db_index=True)
+
+    # Keyed on User.date_joined
+    new_users = models.PositiveIntegerField(default=0)
+    # Keyed on LearnerCourseEnrollment.enrolled_at
+    new_enrollments = models.PositiveIntegerField(default=0)
+    # Keyed on Session.created_at
+    sessions_created = models.PositiveIntegerField(default=0)
+    # Keyed on Session.date
+    sessions_total = models.PositiveIntegerField(default=0)
+    sessions_completed = models.PositiveIntegerField(default=0)
+    sessions_scheduled = models.PositiveIntegerField(default=0)
+    # Keyed on the attended Session.date
+    attendance_total = models.PositiveIntegerField(default=0)
+    attendance_present = models.PositiveIntegerField(default=0)
+    attendance_absent = models.PositiveIntegerField(default=0)
+    attendance_late = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "core_daily_school_stats"
+        verbose_name = "Daily School Stats"
+        verbose_name_plural = "Daily School Stats"
+        ordering = ["date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["school", "date"],
+                condition=models.Q(school__isnull=False),
+                name="uniq_daily_stats_school_date",
+            ),
+            models.UniqueConstraint(
+                fields=["date"],
+                condition=models.Q(school__isnull=True),
+                name="uniq_daily_stats_unassigned_date",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.school_id or 'unassigned'} @ {self.date}"
+
+
+class TeacherLearnerAccess(BaseUUIDModel):
+    """A teacher may access a learner: the learner has an active enrollment
+    in a course the teacher is assigned to.
+
+    Maintained by signals on `Course.teachers` and enrollment writes (see
+    `apps.core.services.teacher_access`), so permission checks are a single
+    probe on the (teacher, learner) unique index instead of a join through
+    enrollments and course teachers. ``rebuild_teacher_access`` repairs
+    drift from writes that bypass signals.
+    """
+
+    teacher = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="learner_access",
+    )
+    learner = models.ForeignKey(
+        Learner, on_delete=models.CASCADE, related_name="teacher_access"
+    )
+
+    class Meta:
+        db_table = "core_teacher_learner_access"
+        verbose_name = "Teacher Learner Access"
+        verbose_name_plural = "Teacher Learner Access"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["teacher", "learner"], name="uniq_teacher_learner_access"
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.teacher_id} -> {self.learner_id}"
+
+
+class EarnedModuleBadge(BaseUUIDModel):
+    """A module a learner has earned the badge for: they were present at a
+    completed session of the module.
+
+    Maintained by signals on attendance and session writes (see
+    `apps.core.services.module_badges`) so parent dashboards read a
+    learner's badges from one indexed row set instead of scanning their
+    attendance history. ``rebuild_module_badges`` backfills and repairs
+    drift.
+    """
+
+    learner = models.ForeignKey(
+        Learner, on_delete=models.CASCADE, related_name="module_badges"
+    )
+    module = models.ForeignKey(
+        Module, on_delete=models.CASCADE, related_name="earned_badges"
+    )
+    earned_on = models.DateField(help_text="Date of the first qualifying session")
+
+    class Meta:
+        db_table = "core_earned_module_badge"
+        verbose_name = "Earned Module Badge"
+        verbose_name_plural = "Earned Module Badges"
+        ordering = ["earned_on"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["learner", "module"], name="uniq_earned_module_badge"
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.learner_id} earned {self.module_id} on {self.earned_on}"
+
+
+class Job(BaseUUIDModel):
+    """A unit of background work (import, export, recompute).
+
+    Created by `apps.core.services.jobs.enqueue` and executed either by a
+    Celery worker or by the `run_jobs` management command. Handlers report
+    progress through `progress_done` / `progress_total` and may attach a
+    downloadable `result_file` alongside the JSON `result`.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+        CANCELLED = "cancelled", "Cancelled"
+
+    kind = models.CharField(max_length=64, db_index=True)
+    status = models.CharField(
+        max_length=16, choices=Status.choices, default=Status.QUEUED
+    )
+    params = models.JSONField(default=dict, blank=True)
+    input_file = models.FileField(upload_to="jobs/input/%Y/%m/", null=True, blank=True)
+
+    progress_done = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(null=True, blank=True)
+    progress_message = models.CharField(max_length=255, blank=True)
+
+    result = models.JSONField(null=True, blank=True)
+    result_file = models.FileField(
+        upload_to="jobs/result/%Y/%m/", null=True, blank=True
+    )
+    error = models.TextField(blank=True)
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="jobs",
+    )
+    worker = models.CharField(max_length=128, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "core_job"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="core_job_status_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.kind} [{self.status}]"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (
+            self.Status.SUCCEEDED,
+            self.Status.FAILED,
+            self.Status.CANCELLED,
+        )
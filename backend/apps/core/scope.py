@@ -13,6 +13,11 @@ def get_user_allowed_school_ids(user) -> set[str]:
     if not user or not getattr(user, "is_authenticated", False):
         return set()
 
+    # Principal-backed users (apps.core.services.principals) carry the set.
+    cached = getattr(user, "cached_school_ids", None)
+    if cached is not None:
+        return set(cached)
+
     school_ids: set[str] = set()
     tenant_id = get_school_id(user)
     if tenant_id:
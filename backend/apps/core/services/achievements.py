@@ -0,0 +1,87 @@
+"""Automatic `Achievement` awards for level and course completion.
+
+Promotion (`apps.core.services.promotion`) calls `award` inside its
+transaction with the levels it just completed, so each completed level and
+each completed course is recorded once as a ``level_complete`` /
+``course_complete`` achievement. Unique constraints on those types make
+awarding idempotent; duplicates are skipped with ``ignore_conflicts``.
+
+`backfill_queryset` awards everything already completed before awards were
+automatic, in bulk (``python manage.py award_achievements``). Dashboards read
+badges straight from the achievements table.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from apps.core.models import Achievement, LearnerCourseEnrollment, LearnerLevelProgress
+
+CHUNK_SIZE = 500
+
+
+def for_level(learner_id, level, earned_at) -> Achievement:
+    """The ``level_complete`` award for `level` (course loaded on the level)."""
+    return Achievement(
+        learner_id=learner_id,
+        name=level.name,
+        description=f"Completed {level.name} in {level.course.name}.",
+        achievement_type="level_complete",
+        icon="award",
+        course_id=level.course_id,
+        level_id=level.pk,
+        earned_at=earned_at,
+    )
+
+
+def for_course(learner_id, course, earned_at) -> Achievement:
+    return Achievement(
+        learner_id=learner_id,
+        name=course.name,
+        description=f"Completed every level of {course.name}.",
+        achievement_type="course_complete",
+        icon="trophy",
+        course_id=course.pk,
+        earned_at=earned_at,
+    )
+
+
+def award(achievements: Iterable[Achievement]) -> None:
+    """Insert `achievements`, skipping any the learner already holds."""
+    Achievement.objects.bulk_create(
+        list(achievements), ignore_conflicts=True, batch_size=CHUNK_SIZE
+    )
+
+
+def backfill_queryset(queryset, progress=None) -> int:
+    """Award achievements for completions already recorded on `queryset`.
+
+    Works a chunk of enrollments at a time; `progress` is called with
+    (enrollments processed, total) after each chunk. Returns the number of
+    awards considered (existing ones are skipped by the constraints).
+    """
+    ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+    considered = 0
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start : start + CHUNK_SIZE]
+        awards = [
+            for_level(
+                row.enrollment.learner_id, row.level, row.completed_at or row.updated_at
+            )
+            for row in LearnerLevelProgress.objects.filter(
+                enrollment_id__in=chunk, completed=True
+            ).select_related("enrollment", "level__course")
+        ]
+        awards += [
+            for_course(
+                enrollment.learner_id, enrollment.course, enrollment.completed_at
+            )
+            for enrollment in LearnerCourseEnrollment.objects.filter(
+                pk__in=chunk, completed_at__isnull=False
+            ).select_related("course")
+        ]
+        award(awards)
+        considered += len(awards)
+        if progress:
+            progress(start + len(chunk), len(ids))
+    return considered
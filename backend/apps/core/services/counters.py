@@ -0,0 +1,124 @@
+"""Cached platform-wide entity counters for the admin overview.
+
+Each counter is a single cache key holding an exact row count. Model signals
+nudge the value with `cache.incr` as rows are created, deleted or move in and
+out of a counter's filter; keys carry a TTL so the next read after expiry
+recomputes them from the database. `reconcile()` does the same on demand
+(see the `reconcile_counters` management command).
+
+Reads never touch the database while the keys are warm.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+KEY_PREFIX = "overview:counter:"
+
+# Upper bound on how long delta-maintained values may drift before the next
+# read recomputes them from the database.
+RECONCILE_SECONDS = 60 * 60
+
+
+@dataclass(frozen=True)
+class CounterSpec:
+    """A named COUNT(*) over `model`, optionally restricted by equality filters."""
+
+    name: str
+    model: str
+    filters: dict = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{KEY_PREFIX}{self.name}"
+
+    def matches(self, instance) -> bool:
+        return all(getattr(instance, f) == v for f, v in self.filters.items())
+
+
+COUNTERS: tuple[CounterSpec, ...] = (
+    CounterSpec("users", settings.AUTH_USER_MODEL),
+    CounterSpec("users_active", settings.AUTH_USER_MODEL, {"is_active": True}),
+    CounterSpec("teachers", settings.AUTH_USER_MODEL, {"role": "teacher"}),
+    CounterSpec("parents", settings.AUTH_USER_MODEL, {"role": "parent"}),
+    CounterSpec("learners", "core.Learner"),
+    CounterSpec("schools", "core.School"),
+    CounterSpec("courses", "core.Course"),
+    CounterSpec("modules", "core.Module"),
+    CounterSpec(
+        "enrollments_active", "core.LearnerCourseEnrollment", {"is_active": True}
+    ),
+    CounterSpec("sessions", "core.Session"),
+    CounterSpec("artifacts", "core.Artifact"),
+    CounterSpec("activities", "core.Activity"),
+)
+
+
+def specs_for(model_label: str) -> list[CounterSpec]:
+    return [spec for spec in COUNTERS if spec.model.lower() == model_label.lower()]
+
+
+def tracked_fields(model_label: str) -> set[str]:
+    """Fields whose change can move a row of this model between counters."""
+    return {f for spec in specs_for(model_label) for f in spec.filters}
+
+
+def membership(instance, model_label: str) -> set[str]:
+    """Names of the counters `instance` currently contributes to."""
+    return {spec.name for spec in specs_for(model_label) if spec.matches(instance)}
+
+
+def compute() -> dict[str, int]:
+    """Exact counts from the database, one aggregate query per model."""
+    by_model: dict[str, list[CounterSpec]] = {}
+    for spec in COUNTERS:
+        by_model.setdefault(spec.model, []).append(spec)
+
+    out: dict[str, int] = {}
+    for label, specs in by_model.items():
+        model = apps.get_model(label)
+        agg = model._base_manager.aggregate(
+            **{
+                spec.name: Count(
+                    "pk", filter=Q(**spec.filters) if spec.filters else None
+                )
+                for spec in specs
+            }
+        )
+        out.update(agg)
+    return out
+
+
+def reconcile() -> dict[str, int]:
+    """Recompute every counter from the database and overwrite the cache."""
+    values = compute()
+    cache.set_many(
+        {f"{KEY_PREFIX}{name}": n for name, n in values.items()},
+        timeout=RECONCILE_SECONDS,
+    )
+    return values
+
+
+def get_all() -> dict[str, int]:
+    """Current counter values; recomputes everything if any key is cold."""
+    cached = cache.get_many([spec.key for spec in COUNTERS])
+    if len(cached) < len(COUNTERS):
+        return reconcile()
+    return {spec.name: max(cached[spec.key], 0) for spec in COUNTERS}
+
+
+def apply_deltas(deltas: dict[str, int]) -> None:
+    """Add signed deltas to warm counters. Cold keys are left for `get_all`."""
+    for name, n in deltas.items():
+        if not n:
+            continue
+        try:
+            cache.incr(f"{KEY_PREFIX}{name}", n)
+        except ValueError:
+            # Key expired or never populated; the next read recomputes it.
+            pass
@@ -0,0 +1,121 @@
+"""Denormalized progress aggregates on `LearnerCourseEnrollment`.
+
+Each enrollment stores the totals the school progress page sorts and filters
+on: modules completed (vs. required across the course's levels), artifacts
+submitted, average assessment score, completion percentage and a status.
+`refresh` recomputes them for a set of enrollments with two grouped queries
+and one bulk update; model signals call it after level progress, enrollment
+or course-level changes commit (see apps.core.signals).
+
+Backfill or repair with ``python manage.py refresh_enrollment_progress``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from apps.core.models import CourseLevel, LearnerCourseEnrollment, LearnerLevelProgress
+from django.db.models import Avg, Sum
+from django.utils import timezone
+
+PROGRESS_FIELDS = (
+    "modules_completed",
+    "total_modules",
+    "artifacts_submitted",
+    "average_score",
+    "completion_percentage",
+    "progress_status",
+)
+CHUNK_SIZE = 500
+
+
+def progress_status(average_score: float, completion: int, completed_at) -> str:
+    if 0 < average_score < 50:
+        return "needs_attention"
+    if completed_at or completion >= 100:
+        return "completed"
+    return "on_track"
+
+
+def compute(enrollment, totals: dict, total_modules: int) -> dict:
+    """Aggregate values for one enrollment from its grouped progress totals."""
+    modules = totals.get("modules") or 0
+    score = totals.get("score") or 0
+    completion = min(100, int(modules * 100 / (total_modules or 1)))
+    return {
+        "modules_completed": modules,
+        "total_modules": total_modules,
+        "artifacts_submitted": totals.get("artifacts") or 0,
+        "average_score": round(score, 1),
+        "completion_percentage": completion,
+        "progress_status": progress_status(score, completion, enrollment.completed_at),
+    }
+
+
+def refresh(enrollment_ids: Iterable) -> int:
+    """Recompute the aggregates for `enrollment_ids`; returns rows changed."""
+    ids = list(enrollment_ids)
+    if not ids:
+        return 0
+    enrollments = list(
+        LearnerCourseEnrollment.objects.filter(pk__in=ids).only(
+            "id", "course_id", "completed_at", *PROGRESS_FIELDS
+        )
+    )
+    progress = {
+        row.pop("enrollment_id"): row
+        for row in LearnerLevelProgress.objects.filter(enrollment_id__in=ids)
+        .order_by()
+        .values("enrollment_id")
+        .annotate(
+            modules=Sum("modules_completed"),
+            artifacts=Sum("artifacts_submitted"),
+            score=Avg("assessment_score"),
+        )
+    }
+    module_totals = dict(
+        CourseLevel.objects.filter(course_id__in={e.course_id for e in enrollments})
+        .order_by()
+        .values("course_id")
+        .annotate(n=Sum("required_modules_count"))
+        .values_list("course_id", "n")
+    )
+
+    now = timezone.now()
+    changed = []
+    for enrollment in enrollments:
+        values = compute(
+            enrollment,
+            progress.get(enrollment.pk, {}),
+            module_totals.get(enrollment.course_id) or 0,
+        )
+        if any(getattr(enrollment, f) != v for f, v in values.items()):
+            for field, value in values.items():
+                setattr(enrollment, field, value)
+            enrollment.progress_updated_at = now
+            changed.append(enrollment)
+    LearnerCourseEnrollment.objects.bulk_update(
+        changed, [*PROGRESS_FIELDS, "progress_updated_at"], batch_size=CHUNK_SIZE
+    )
+    return len(changed)
+
+
+def _chunks(ids: Iterator, size: int = CHUNK_SIZE) -> Iterator[list]:
+    chunk = []
+    for pk in ids:
+        chunk.append(pk)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def refresh_queryset(queryset) -> int:
+    """`refresh` every enrollment in `queryset`, a chunk at a time."""
+    ids = queryset.order_by().values_list("pk", flat=True).iterator(CHUNK_SIZE)
+    return sum(refresh(chunk) for chunk in _chunks(ids))
+
+
+def refresh_course(course_id) -> int:
+    return refresh_queryset(LearnerCourseEnrollment.objects.filter(course_id=course_id))
@@ -0,0 +1,70 @@
+"""Job handlers for core background work (see `settings.JOB_HANDLERS`)."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import timedelta
+
+from apps.core.services import counters, promotion, rollups, user_import
+from apps.core.services.jobs import JobContext
+from django.utils import timezone
+
+
+def import_users(ctx: JobContext) -> dict:
+    """Run a CSV user import from the job's input file.
+
+    Params: ``dry_run`` (bool).
+    """
+    if not ctx.job.input_file:
+        raise ValueError("Job has no input file")
+    with ctx.job.input_file.open("rb") as f:
+        result = user_import.import_users(
+            f,
+            dry_run=bool(ctx.params.get("dry_run")),
+            progress=lambda n: ctx.progress(n, message=f"{n} rows processed"),
+        )
+    return asdict(result)
+
+
+def rebuild_stats(ctx: JobContext) -> dict:
+    """Rebuild daily rollups and reconcile the overview counters.
+
+    Params: ``days`` (trailing days, default 7) or ``all`` (bool) for the
+    full history, plus optional ``chunk_days``.
+    """
+    today = timezone.localdate()
+    if ctx.params.get("all"):
+        bounds = rollups.data_date_range()
+        start, end = (bounds[0], max(bounds[1], today)) if bounds else (today, today)
+    else:
+        days = max(int(ctx.params.get("days", 7)), 1)
+        start, end = today - timedelta(days=days - 1), today
+
+    written = rollups.rebuild_range(
+        start,
+        end,
+        int(ctx.params.get("chunk_days", 31)),
+        progress=lambda done, total: ctx.progress(done, total, "days rebuilt"),
+    )
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "rows_written": written,
+        "counters": counters.reconcile(),
+    }
+
+
+def promote_enrollments(ctx: JobContext) -> dict:
+    """Run level promotion for a cohort of enrollments.
+
+    Params: optional ``course`` and ``school`` ids to narrow the cohort.
+    """
+    promotions = promotion.promote_queryset(
+        promotion.cohort(ctx.params.get("course"), ctx.params.get("school")),
+        progress=lambda done, total: ctx.progress(done, total, "enrollments checked"),
+    )
+    return {
+        "promoted": len(promotions),
+        "levels_completed": sum(p.levels_completed for p in promotions),
+        "courses_completed": sum(p.course_completed for p in promotions),
+    }
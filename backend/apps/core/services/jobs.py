@@ -0,0 +1,197 @@
+"""Background jobs: enqueue, claim and run `Job` rows.
+
+Handlers are plain functions taking a `JobContext` and returning a
+JSON-serialisable result. They are looked up by kind in
+``settings.JOB_HANDLERS`` (dotted paths, imported lazily), so any app can
+contribute job kinds without import-order concerns.
+
+How a queued job gets executed depends on ``settings.JOBS_BACKEND``:
+
+- ``"celery"`` - a `core.run_job` task is sent once the enqueuing
+  transaction commits (the default when ``CELERY_BROKER_URL`` is set);
+- ``"db"`` - the job stays queued until a ``manage.py run_jobs`` worker
+  claims it (the default with no broker);
+- ``"eager"`` - the job runs inline after commit (development only).
+
+Claiming is a conditional ``UPDATE ... WHERE status = 'queued'``, so a job
+runs at most once even when a Celery task and a DB worker race for it.
+A job left running for longer than ``settings.JOB_TIMEOUT`` seconds (its
+worker was killed mid-run) is marked failed by `fail_stale`, which workers
+call before picking up work, so it does not show as running forever.
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+
+from apps.core.models import Job
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between progress writes while a job is running.
+PROGRESS_INTERVAL = 1.0
+# Default for settings.JOB_TIMEOUT: seconds a job may stay running.
+JOB_TIMEOUT = 60 * 60
+
+
+class UnknownJobKind(ValueError):
+    pass
+
+
+def handler_for(kind: str) -> Callable[[JobContext], dict | None]:
+    path = getattr(settings, "JOB_HANDLERS", {}).get(kind)
+    if not path:
+        raise UnknownJobKind(f"Unknown job kind '{kind}'")
+    return import_string(path)
+
+
+def job_kinds() -> list[str]:
+    return sorted(getattr(settings, "JOB_HANDLERS", {}))
+
+
+def backend() -> str:
+    return getattr(settings, "JOBS_BACKEND", "db")
+
+
+class JobContext:
+    """What a handler sees of its job: params, input, progress and output."""
+
+    def __init__(self, job: Job):
+        self.job = job
+        self._last_progress = 0.0
+
+    @property
+    def params(self) -> dict:
+        return self.job.params or {}
+
+    def progress(
+        self, done: int, total: int | None = None, message: str = "", force=False
+    ) -> None:
+        """Record progress; writes are throttled to one per PROGRESS_INTERVAL."""
+        job = self.job
+        job.progress_done = done
+        if total is not None:
+            job.progress_total = total
+        if message:
+            job.progress_message = message[:255]
+        now = time.monotonic()
+        if not force and now - self._last_progress < PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        Job.objects.filter(pk=job.pk).update(
+            progress_done=job.progress_done,
+            progress_total=job.progress_total,
+            progress_message=job.progress_message,
+        )
+
+    def save_result_file(self, name: str, chunks: Iterable[str | bytes]) -> None:
+        """Write `chunks` to the job's downloadable result file."""
+        with tempfile.TemporaryFile() as tmp:
+            for chunk in chunks:
+                tmp.write(chunk.encode() if isinstance(chunk, str) else chunk)
+            tmp.seek(0)
+            self.job.result_file.save(name, File(tmp), save=False)
+
+
+def enqueue(
+    kind: str, params: dict | None = None, *, user=None, input_file=None
+) -> Job:
+    """Create a queued job and hand it to the configured backend on commit."""
+    handler_for(kind)  # fail fast on unknown kinds
+    job = Job.objects.create(
+        kind=kind,
+        params=params or {},
+        input_file=input_file,
+        created_by=user if getattr(user, "is_authenticated", False) else None,
+    )
+    transaction.on_commit(lambda: _dispatch(job.pk))
+    return job
+
+
+def _dispatch(job_id) -> None:
+    mode = backend()
+    if mode == "celery":
+        from apps.core.tasks import run_job
+
+        try:
+            run_job.delay(str(job_id))
+        except Exception:
+            # Broker unreachable: the job stays queued for a `run_jobs` worker.
+            logger.exception("Could not publish job %s to Celery", job_id)
+    elif mode == "eager":
+        run(job_id, worker="eager")
+
+
+def _claim(job_id, worker: str) -> bool:
+    return bool(
+        Job.objects.filter(pk=job_id, status=Job.Status.QUEUED).update(
+            status=Job.Status.RUNNING, started_at=timezone.now(), worker=worker[:128]
+        )
+    )
+
+
+def fail_stale(now=None) -> int:
+    """Mark jobs running for longer than JOB_TIMEOUT as failed; returns count."""
+    now = now or timezone.now()
+    timeout = getattr(settings, "JOB_TIMEOUT", JOB_TIMEOUT)
+    stale = Job.objects.filter(
+        status=Job.Status.RUNNING,
+        started_at__lt=now - timedelta(seconds=timeout),
+    ).update(
+        status=Job.Status.FAILED,
+        finished_at=now,
+        error=f"Timed out: still running after {timeout}s (worker lost?)",
+    )
+    if stale:
+        logger.warning("Marked %d stale running job(s) as failed", stale)
+    return stale
+
+
+def run(job_id, worker: str = "") -> Job | None:
+    """Claim and execute one job. Returns None if it was not (still) queued."""
+    if not _claim(job_id, worker):
+        return None
+    job = Job.objects.get(pk=job_id)
+    ctx = JobContext(job)
+    try:
+        job.result = handler_for(job.kind)(ctx)
+        job.status = Job.Status.SUCCEEDED
+        if job.progress_total is not None:
+            job.progress_done = job.progress_total
+    except Exception as exc:
+        logger.exception("Job %s (%s) failed", job.pk, job.kind)
+        job.status = Job.Status.FAILED
+        job.error = f"{type(exc).__name__}: {exc}"
+    job.finished_at = timezone.now()
+    job.save()
+    return job
+
+
+def run_next(worker: str = "") -> Job | None:
+    """Run the oldest queued job this worker manages to claim, if any."""
+    fail_stale()
+    candidates = Job.objects.filter(status=Job.Status.QUEUED).order_by("created_at")
+    for job_id in candidates.values_list("pk", flat=True)[:10]:
+        job = run(job_id, worker)
+        if job is not None:
+            return job
+    return None
+
+
+def cancel(job: Job) -> bool:
+    """Cancel a job that has not started yet."""
+    cancelled = Job.objects.filter(pk=job.pk, status=Job.Status.QUEUED).update(
+        status=Job.Status.CANCELLED, finished_at=timezone.now()
+    )
+    if cancelled:
+        job.refresh_from_db()
+    return bool(cancelled)
@@ -0,0 +1,54 @@
+"""A learner's history collections: badges, artifacts and attendance.
+
+These grow for as long as a learner stays enrolled, so profile views embed
+only the `RECENT_LIMIT` newest rows of each plus a total, and the full
+history is served by cursor-paginated sub-resource endpoints. Each
+collection has a unique newest-first ordering backed by a
+``(learner, <timestamp>, id)``-style index.
+"""
+
+from __future__ import annotations
+
+from apps.core.models import Artifact, Attendance, Badge
+from django.db.models import QuerySet
+
+RECENT_LIMIT = 10
+
+ORDERINGS = {
+    "badges": ("-awarded_at", "-id"),
+    "artifacts": ("-submitted_at", "-id"),
+    "attendance": ("-marked_at", "-id"),
+}
+
+
+def badges(learner) -> QuerySet:
+    return Badge.objects.filter(learner=learner).select_related(
+        "learner", "module", "awarded_by"
+    )
+
+
+def artifacts(learner) -> QuerySet:
+    return Artifact.objects.filter(learner=learner).select_related("learner", "module")
+
+
+def attendance(learner) -> QuerySet:
+    return Attendance.objects.filter(learner=learner).select_related(
+        "session", "session__module"
+    )
+
+
+COLLECTIONS = {
+    "badges": badges,
+    "artifacts": artifacts,
+    "attendance": attendance,
+}
+
+
+def recent(name: str, learner, limit: int = RECENT_LIMIT) -> list:
+    """The `limit` newest rows of collection `name` for `learner`."""
+    return list(COLLECTIONS[name](learner).order_by(*ORDERINGS[name])[:limit])
+
+
+def totals(learner, names=tuple(COLLECTIONS)) -> dict:
+    """Row counts of the named collections for `learner`."""
+    return {name: COLLECTIONS[name](learner).count() for name in names}
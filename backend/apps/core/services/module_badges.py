@@ -0,0 +1,117 @@
+"""The per-learner earned module badge set (`EarnedModuleBadge`).
+
+A learner earns a module's badge by being present at a completed session of
+that module; the badge is dated by the first such session. Rather than
+scanning a learner's whole attendance history on every dashboard view, the
+earned (learner, module) pairs are kept in a table:
+
+- `refresh` recomputes the set of some learners with one grouped query and
+  writes only the difference. Model signals call it on commit when
+  attendance is marked and when a session completes or changes (see
+  apps.core.signals).
+- `rebuild` does every learner with attendance or badges, a chunk at a
+  time; ``python manage.py rebuild_module_badges`` wraps it for backfill and
+  to repair drift from writes that bypass signals.
+
+`for_learner` is the read side.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from apps.core.models import Attendance, EarnedModuleBadge
+from django.db import transaction
+from django.db.models import Min, QuerySet
+
+EARNING_STATUS = "present"
+SESSION_STATUS = "completed"
+CHUNK_SIZE = 500
+
+
+def _earned(learner_ids) -> dict:
+    """{(learner id, module id): first qualifying session date}."""
+    rows = (
+        Attendance.objects.filter(
+            learner_id__in=learner_ids,
+            status=EARNING_STATUS,
+            session__status=SESSION_STATUS,
+        )
+        .order_by()
+        .values("learner_id", "session__module_id")
+        .annotate(earned_on=Min("session__date"))
+    )
+    return {
+        (row["learner_id"], row["session__module_id"]): row["earned_on"] for row in rows
+    }
+
+
+def refresh(learner_ids: Iterable) -> int:
+    """Recompute the badge set of each of `learner_ids`; returns rows changed."""
+    learner_ids = {pk for pk in learner_ids if pk is not None}
+    if not learner_ids:
+        return 0
+    with transaction.atomic():
+        wanted = _earned(learner_ids)
+        existing = {
+            (row.learner_id, row.module_id): row
+            for row in EarnedModuleBadge.objects.select_for_update().filter(
+                learner_id__in=learner_ids
+            )
+        }
+        stale = [row.pk for key, row in existing.items() if key not in wanted]
+        moved = []
+        for key, row in existing.items():
+            if key in wanted and row.earned_on != wanted[key]:
+                row.earned_on = wanted[key]
+                moved.append(row)
+        new = [
+            EarnedModuleBadge(learner_id=learner_id, module_id=module_id, earned_on=day)
+            for (learner_id, module_id), day in wanted.items()
+            if (learner_id, module_id) not in existing
+        ]
+        if stale:
+            EarnedModuleBadge.objects.filter(pk__in=stale).delete()
+        EarnedModuleBadge.objects.bulk_update(
+            moved, ["earned_on"], batch_size=CHUNK_SIZE
+        )
+        EarnedModuleBadge.objects.bulk_create(
+            new, ignore_conflicts=True, batch_size=CHUNK_SIZE
+        )
+    return len(stale) + len(moved) + len(new)
+
+
+def refresh_sessions(session_ids: Iterable) -> int:
+    """`refresh` every learner with attendance at one of `session_ids`."""
+    return refresh(
+        Attendance.objects.filter(session_id__in=list(session_ids))
+        .values_list("learner_id", flat=True)
+        .distinct()
+    )
+
+
+def rebuild(progress=None) -> int:
+    """`refresh` every learner with attendance or earned badges.
+
+    `progress` is called with (learners processed, total) after each chunk.
+    """
+    learner_ids = sorted(
+        set(Attendance.objects.values_list("learner_id", flat=True).distinct())
+        | set(EarnedModuleBadge.objects.values_list("learner_id", flat=True))
+    )
+    changed = 0
+    for start in range(0, len(learner_ids), CHUNK_SIZE):
+        chunk = learner_ids[start : start + CHUNK_SIZE]
+        changed += refresh(chunk)
+        if progress:
+            progress(start + len(chunk), len(learner_ids))
+    return changed
+
+
+def for_learner(learner) -> QuerySet:
+    """`learner`'s earned badges, oldest first, with their modules."""
+    return (
+        EarnedModuleBadge.objects.filter(learner=learner)
+        .select_related("module")
+        .order_by("earned_on", "id")
+    )
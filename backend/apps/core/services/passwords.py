@@ -0,0 +1,58 @@
+"""Password hashing for bulk operations, optionally across worker processes.
+
+Kept free of model imports: spawned pool workers import this module before
+Django's app registry is ready.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+
+def parallel_threshold() -> int:
+    # Below this many passwords, starting worker processes costs more than
+    # hashing inline.
+    return getattr(settings, "USER_IMPORT_PARALLEL_THRESHOLD", 64)
+
+
+def hash_workers() -> int:
+    return getattr(settings, "USER_IMPORT_HASH_WORKERS", os.cpu_count() or 1)
+
+
+def _init_worker() -> None:
+    # Spawned workers start from a fresh interpreter; hashers need settings.
+    import django
+
+    django.setup()
+
+
+def hash_pool(password_count_hint: int) -> Executor | None:
+    """A process pool when enough passwords are expected, else None."""
+    if hash_workers() < 2 or password_count_hint < parallel_threshold():
+        return None
+    # "spawn" rather than "fork": forked children would inherit (and on exit
+    # could tear down) the parent's open database connections.
+    return ProcessPoolExecutor(
+        max_workers=hash_workers(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+
+def hash_passwords(passwords: list[str | None], pool: Executor | None) -> list[str]:
+    """One hash per entry; blank passwords become unusable passwords."""
+    real = [(i, p) for i, p in enumerate(passwords) if p]
+    out = [make_password(None) if not p else "" for p in passwords]
+    if pool is not None and len(real) >= parallel_threshold():
+        chunk = max(1, len(real) // (hash_workers() * 4))
+        hashes = pool.map(make_password, [p for _, p in real], chunksize=chunk)
+    else:
+        hashes = (make_password(p) for _, p in real)
+    for (i, _), hashed in zip(real, hashes):
+        out[i] = hashed
+    return out
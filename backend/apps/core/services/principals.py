@@ -0,0 +1,92 @@
+"""Cached user principals for JWT-authenticated requests.
+
+Resolving a JWT used to load the user row on every request, and teacher
+views then queried ``teacher_schools`` to work out the school context.
+Instead the user's columns (all but `EXCLUDED_FIELDS`) and their allowed
+school ids are cached as one compact principal, keyed by user id plus a
+per-user version token:
+
+- `load` rebuilds a `User` instance from the principal with
+  ``Model.from_db``. Excluded fields are deferred and load on first access,
+  and ``save()`` writes only loaded fields, so views use the instance like
+  the full row. ``cached_school_ids`` on it answers
+  `apps.core.scope.get_user_allowed_school_ids` without a query.
+- `bump` replaces users' version tokens, orphaning their principals.
+  Signals call it on commit when a user row, a user's teacher schools or
+  a school with teachers change (see apps.core.signals). Writes that
+  bypass signals (``QuerySet.update``) are picked up within `TTL`.
+
+Principals are read from the primary database, so replica lag cannot
+cache a row from before the change that bumped the version.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+
+from apps.core.scope import get_user_allowed_school_ids
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+
+KEY_PREFIX = "auth:principal:"
+VERSION_PREFIX = "auth:principal-version:"
+TTL = 60 * 5
+VERSION_TTL = 60 * 60 * 24
+# Deferred: never needed to authorize a request. Saves that touch only these
+# (e.g. `update_last_login` on every login) leave the principal valid.
+EXCLUDED_FIELDS = {"password", "last_login"}
+
+
+def _fields(User) -> list:
+    return [f for f in User._meta.concrete_fields if f.name not in EXCLUDED_FIELDS]
+
+
+def _version(user_id) -> str:
+    key = f"{VERSION_PREFIX}{user_id}"
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, VERSION_TTL):
+            version = cache.get(key, version)
+    return version
+
+
+def bump(user_ids: Iterable) -> None:
+    """Invalidate the cached principals of `user_ids`."""
+    versions = {
+        f"{VERSION_PREFIX}{pk}": uuid.uuid4().hex for pk in user_ids if pk is not None
+    }
+    if versions:
+        cache.set_many(versions, VERSION_TTL)
+
+
+def load(user_id):
+    """The user `user_id` built from their cached principal; None if absent."""
+    User = get_user_model()
+    fields = _fields(User)
+    key = f"{KEY_PREFIX}{user_id}:{_version(user_id)}"
+    entry = cache.get(key)
+    if entry is None:
+        user = (
+            User.objects.using(router.db_for_write(User))
+            .only(*(f.name for f in fields))
+            .filter(pk=user_id)
+            .first()
+        )
+        if user is None:
+            return None
+        entry = {
+            "fields": {f.attname: getattr(user, f.attname) for f in fields},
+            "school_ids": sorted(get_user_allowed_school_ids(user)),
+        }
+        cache.set(key, entry, TTL)
+    # Keyed by column so entries cached before a schema change stay usable:
+    # columns they lack are simply deferred.
+    names = [f.attname for f in fields if f.attname in entry["fields"]]
+    user = User.from_db(
+        router.db_for_write(User), names, [entry["fields"][n] for n in names]
+    )
+    user.cached_school_ids = frozenset(entry["school_ids"])
+    return user
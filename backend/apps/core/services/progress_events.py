@@ -0,0 +1,279 @@
+"""Level progress counters derived from recorded evidence.
+
+Three kinds of rows count as evidence that a learner is working through a
+module:
+
+- an approved `Artifact` tied to the module → ``artifacts_submitted``
+- a completed `QuizAttempt` on one of the module's quizzes → ``assessment_score``
+  (best score)
+- a present/late `Attendance` at a session for the module →
+  ``completed_module_ids`` / ``modules_completed``
+
+Each write to those rows is an event for a (learner, module) pair; model
+signals `record` them (see apps.core.signals) and `apply` runs once the
+transaction commits. `apply` re-derives the counters of every affected
+`LearnerLevelProgress` row, with the rows locked, and runs promotion for the
+enrollments that changed — all in one transaction. Code that writes many
+rows at once runs them inside `collect()`, so they are applied in one
+batch. A level's modules are its ``required_modules``, or, when it names
+none, every module of its course (the same rule teachers' progress updates
+are validated against).
+
+Evidence merges with what teachers typed in: counters only move up, so
+manual entries are kept. `rebuild_queryset` re-derives a whole cohort for
+backfill; with ``reset=True`` it sets counters from evidence alone.
+``python manage.py rebuild_progress_counters`` wraps it.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+from apps.core.models import (
+    Artifact,
+    Attendance,
+    CourseLevel,
+    LearnerLevelProgress,
+    Module,
+    QuizAttempt,
+)
+from apps.core.services import enrollment_progress, promotion
+from django.db import transaction
+from django.db.models import Count, F, Max
+from django.utils import timezone
+
+ATTENDED = ("present", "late")
+COUNTER_FIELDS = (
+    "modules_completed",
+    "completed_module_ids",
+    "artifacts_submitted",
+    "assessment_score",
+)
+CHUNK_SIZE = 200
+
+# Events of the innermost open `collect()` block, if any.
+_collected: ContextVar[set | None] = ContextVar("progress_events", default=None)
+
+
+@contextmanager
+def collect(using=None):
+    """Run the block in a transaction whose events are applied in one batch.
+
+    Events are only applied if the block commits. `apply` re-derives
+    counters from the rows, so an event left behind by a rolled-back
+    savepoint inside the block costs a little work but changes nothing.
+    """
+    events = set()
+    token = _collected.set(events)
+    try:
+        with transaction.atomic(using=using):
+            yield
+            if events:
+                transaction.on_commit(partial(apply, events), using=using)
+    finally:
+        _collected.reset(token)
+
+
+def record(learner_id, module_id, using=None) -> None:
+    """Queue a (learner, module) event to be applied after commit."""
+    if learner_id is None or module_id is None:
+        return
+    events = _collected.get()
+    if events is not None:
+        events.add((learner_id, module_id))
+    else:
+        transaction.on_commit(partial(apply, {(learner_id, module_id)}), using=using)
+
+
+def level_modules(level_ids) -> dict:
+    """Module ids per level id, falling back to the course's modules."""
+    modules = defaultdict(set)
+    through = CourseLevel.required_modules.through
+    for level_id, module_id in through.objects.filter(
+        courselevel_id__in=level_ids
+    ).values_list("courselevel_id", "module_id"):
+        modules[level_id].add(module_id)
+    fallback = dict(
+        CourseLevel.objects.filter(pk__in=level_ids)
+        .exclude(pk__in=list(modules))
+        .values_list("pk", "course_id")
+    )
+    if fallback:
+        by_course = defaultdict(set)
+        for module_id, course_id in Module.objects.filter(
+            course_id__in=set(fallback.values())
+        ).values_list("pk", "course_id"):
+            by_course[course_id].add(module_id)
+        for level_id, course_id in fallback.items():
+            modules[level_id] = by_course[course_id]
+    return modules
+
+
+def _levels_for(module_ids) -> set:
+    """Levels whose module set contains any of `module_ids`."""
+    required = CourseLevel.objects.filter(required_modules__in=module_ids)
+    fallback = CourseLevel.objects.filter(
+        required_modules__isnull=True,
+        course__modules__in=module_ids,
+    )
+    return set(required.values_list("pk", flat=True)) | set(
+        fallback.values_list("pk", flat=True)
+    )
+
+
+def _evidence(learner_ids, module_ids) -> tuple[dict, dict, set]:
+    """(approved artifacts, best quiz score, attended pairs) per (learner, module)."""
+    artifacts = {
+        (row["learner_id"], row["module_id"]): row["n"]
+        for row in Artifact.objects.filter(
+            learner_id__in=learner_ids,
+            module_id__in=module_ids,
+            status=Artifact.STATUS_APPROVED,
+        )
+        .order_by()
+        .values("learner_id", "module_id")
+        .annotate(n=Count("id"))
+    }
+    scores = {
+        (row["learner_id"], row["quiz__module_id"]): row["best"]
+        for row in QuizAttempt.objects.filter(
+            learner_id__in=learner_ids,
+            quiz__module_id__in=module_ids,
+            completed_at__isnull=False,
+        )
+        .order_by()
+        .values("learner_id", "quiz__module_id")
+        .annotate(best=Max("score"))
+    }
+    attended = set(
+        Attendance.objects.filter(
+            learner_id__in=learner_ids,
+            session__module_id__in=module_ids,
+            status__in=ATTENDED,
+        )
+        .order_by()
+        .values_list("learner_id", "session__module_id")
+        .distinct()
+    )
+    return artifacts, scores, attended
+
+
+def _derive(row, learner_id, modules, evidence, reset: bool) -> dict:
+    artifacts, scores, attended = evidence
+    keys = [(learner_id, module_id) for module_id in modules]
+    count = sum(artifacts.get(key, 0) for key in keys)
+    best = max([scores[key] for key in keys if key in scores] or [0])
+    done = sorted(str(module_id) for _, module_id in attended.intersection(keys))
+    if reset:
+        return {
+            "modules_completed": len(done),
+            "completed_module_ids": done,
+            "artifacts_submitted": count,
+            "assessment_score": best,
+        }
+    ids = list(row.completed_module_ids or [])
+    ids += [module_id for module_id in done if module_id not in ids]
+    return {
+        "modules_completed": max(row.modules_completed, len(ids)),
+        "completed_module_ids": ids,
+        "artifacts_submitted": max(row.artifacts_submitted, count),
+        "assessment_score": max(row.assessment_score, best),
+    }
+
+
+def refresh_rows(queryset, reset: bool = False) -> int:
+    """Re-derive the counters of the progress rows in `queryset`.
+
+    Locks the rows, writes the changed ones with one bulk update and
+    promotes their enrollments, in one transaction. Rows for the levels
+    enrollments are promoted to are derived in turn. Returns rows changed.
+    """
+    with transaction.atomic():
+        # Same lock order as promotion (enrollments, then progress rows).
+        locked = promotion.lock_enrollments(
+            queryset.values_list("enrollment_id", flat=True)
+        )
+        if not locked:
+            return 0
+        rows = list(
+            queryset.select_for_update().select_related("enrollment").order_by("pk")
+        )
+        modules = level_modules({row.level_id for row in rows})
+        learner_ids = {row.enrollment.learner_id for row in rows}
+        evidence = _evidence(learner_ids, set().union(*modules.values()))
+
+        now = timezone.now()
+        changed = []
+        for row in rows:
+            values = _derive(
+                row,
+                row.enrollment.learner_id,
+                modules.get(row.level_id, ()),
+                evidence,
+                reset,
+            )
+            if any(getattr(row, f) != v for f, v in values.items()):
+                for field, value in values.items():
+                    setattr(row, field, value)
+                row.updated_at = now
+                changed.append(row)
+        LearnerLevelProgress.objects.bulk_update(
+            changed, [*COUNTER_FIELDS, "updated_at"], batch_size=CHUNK_SIZE
+        )
+        enrollment_ids = {row.enrollment_id for row in changed}
+        if enrollment_ids:
+            # Bulk writes skip the signals that refresh enrollment aggregates.
+            transaction.on_commit(lambda: enrollment_progress.refresh(enrollment_ids))
+            promoted = [
+                p.enrollment_id
+                for p in promotion.promote_enrollments(enrollment_ids)
+                if not p.course_completed
+            ]
+            if promoted:
+                # Evidence gathered earlier may already satisfy the new level.
+                return len(changed) + refresh_rows(
+                    LearnerLevelProgress.objects.filter(
+                        enrollment_id__in=promoted,
+                        level_id=F("enrollment__current_level_id"),
+                    ),
+                    reset=reset,
+                )
+    return len(changed)
+
+
+def apply(events: Iterable[tuple]) -> int:
+    """Apply (learner id, module id) events; returns progress rows changed."""
+    events = set(events)
+    if not events:
+        return 0
+    learner_ids = {learner_id for learner_id, _ in events}
+    level_ids = _levels_for({module_id for _, module_id in events})
+    if not level_ids:
+        return 0
+    return refresh_rows(
+        LearnerLevelProgress.objects.filter(
+            enrollment__learner_id__in=learner_ids, level_id__in=level_ids
+        ),
+        reset=False,
+    )
+
+
+def rebuild_queryset(queryset, reset: bool = False, progress=None) -> int:
+    """`refresh_rows` over every row of `queryset`, a locked chunk at a time.
+
+    `progress` is called with (rows processed, total) after each chunk.
+    """
+    ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+    changed = 0
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start : start + CHUNK_SIZE]
+        changed += refresh_rows(
+            LearnerLevelProgress.objects.filter(pk__in=chunk), reset=reset
+        )
+        if progress:
+            progress(start + len(chunk), len(ids))
+    return changed
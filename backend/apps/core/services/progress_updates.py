@@ -0,0 +1,141 @@
+"""Class-wide level progress updates.
+
+A teacher records progress for a whole class in one request: a list of
+per-row changes, each naming a `LearnerLevelProgress` id and any of the
+fields the single-row endpoint accepts. Every item is validated first —
+module ids against one module set per level, loaded once for the batch —
+and nothing is written unless all items are valid. The rows are then saved
+with a single `bulk_update` and their enrollments promoted in bulk, in the
+same transaction and under the same locks as `promotion`.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from apps.core.models import LearnerLevelProgress
+from apps.core.services import enrollment_progress, progress_events, promotion
+from django.db import transaction
+from django.utils import timezone
+
+MAX_UPDATES = 500
+COUNTS = ("modules_completed", "artifacts_submitted", "assessment_score")
+UPDATE_FIELDS = (
+    "modules_completed",
+    "completed_module_ids",
+    "artifacts_submitted",
+    "assessment_score",
+    "teacher_confirmed",
+    "updated_at",
+)
+
+
+@dataclass
+class BatchResult:
+    rows: list = field(default_factory=list)
+    promotions: list = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+
+
+def _changes(item: dict, allowed: set) -> tuple[dict, dict | None]:
+    """Field values for one item, or an error describing why it is invalid."""
+    values = {}
+    module_ids = item.get("completed_module_ids")
+    if module_ids is not None:
+        if not isinstance(module_ids, list):
+            return {}, {"error": "completed_module_ids must be a list."}
+        normalized = list(dict.fromkeys(str(mid) for mid in module_ids))
+        invalid = [mid for mid in normalized if mid not in allowed]
+        if invalid:
+            return {}, {
+                "error": "Some modules are not valid for this level/course.",
+                "invalid_module_ids": invalid,
+            }
+        values["completed_module_ids"] = normalized
+        values["modules_completed"] = len(normalized)
+    for name in COUNTS:
+        if item.get(name) is None or name in values:
+            continue
+        try:
+            values[name] = int(item[name])
+        except (TypeError, ValueError):
+            return {}, {"error": f"{name} must be an integer."}
+        if values[name] < 0:
+            return {}, {"error": f"{name} cannot be negative."}
+    if "modules_completed" in values and "completed_module_ids" not in values:
+        values["completed_module_ids"] = []
+    if item.get("teacher_confirmed") is not None:
+        values["teacher_confirmed"] = bool(item["teacher_confirmed"])
+    return values, None
+
+
+def apply_updates(queryset, updates: Iterable[dict]) -> BatchResult:
+    """Apply `updates` to rows of `queryset` (the rows the caller may edit).
+
+    All-or-nothing: when any item is invalid, `errors` lists each problem
+    (with the item's index) and nothing is written.
+    """
+    result = BatchResult()
+    updates = list(updates)
+    ids = []
+    for index, item in enumerate(updates):
+        if not isinstance(item, dict) or not item.get("id"):
+            result.errors.append({"index": index, "error": "id is required."})
+            continue
+        try:
+            ids.append(str(uuid.UUID(str(item["id"]))))
+        except ValueError:
+            result.errors.append({"index": index, "error": "Invalid id."})
+    if len(set(ids)) != len(ids):
+        result.errors.append({"error": "Each progress id may appear only once."})
+    if result.errors:
+        return result
+
+    with transaction.atomic():
+        promotion.lock_enrollments(
+            queryset.filter(pk__in=ids).values_list("enrollment_id", flat=True)
+        )
+        rows = {
+            str(row.pk): row
+            for row in queryset.filter(pk__in=ids).select_for_update(of=("self",))
+        }
+        modules = progress_events.level_modules({r.level_id for r in rows.values()})
+        allowed = {
+            level_id: {str(mid) for mid in module_ids}
+            for level_id, module_ids in modules.items()
+        }
+
+        now = timezone.now()
+        for index, (item, pk) in enumerate(zip(updates, ids)):
+            row = rows.get(pk)
+            if row is None:
+                result.errors.append(
+                    {
+                        "index": index,
+                        "id": item["id"],
+                        "error": "Progress record not found.",
+                    }
+                )
+                continue
+            values, error = _changes(item, allowed.get(row.level_id, set()))
+            if error:
+                result.errors.append({"index": index, "id": item["id"], **error})
+                continue
+            for name, value in values.items():
+                setattr(row, name, value)
+            row.updated_at = now
+            result.rows.append(row)
+        if result.errors:
+            result.rows = []
+            return result
+
+        LearnerLevelProgress.objects.bulk_update(
+            result.rows, UPDATE_FIELDS, batch_size=promotion.CHUNK_SIZE
+        )
+        enrollment_ids = {row.enrollment_id for row in result.rows}
+        # Bulk writes skip the signals that refresh enrollment aggregates.
+        transaction.on_commit(lambda: enrollment_progress.refresh(enrollment_ids))
+        result.promotions = promotion.promote_enrollments(enrollment_ids)
+    return result
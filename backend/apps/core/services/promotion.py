@@ -0,0 +1,212 @@
+"""Level promotion for course enrollments.
+
+Promotion locks the enrollment rows (``SELECT ... FOR UPDATE``) inside a
+transaction, so concurrent progress updates for the same learner serialize
+instead of double-promoting. Levels and level progress are then fetched once
+for the whole batch and evaluated in memory: an enrollment advances through
+every consecutive level whose criteria are already met, not just one. All
+writes are bulk updates restricted to the promotion columns, so they never
+clobber progress counters a teacher is saving concurrently.
+
+Each level completed and each course finished is recorded as an
+`Achievement` in the same transaction (see `achievements`).
+
+`promote` handles one enrollment (used after each progress update);
+`promote_enrollments` / `promote_queryset` run a whole cohort in chunks, e.g.
+``python manage.py promote_enrollments --course <id>``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from apps.core.models import CourseLevel, LearnerCourseEnrollment, LearnerLevelProgress
+from apps.core.services import achievements, enrollment_progress
+from django.db import transaction
+from django.utils import timezone
+
+CHUNK_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Promotion:
+    """How far one enrollment moved in a promotion run."""
+
+    enrollment_id: object
+    from_level: int
+    to_level: int
+    levels_completed: int
+    course_completed: bool
+
+
+def _evaluate(enrollment, levels: list, progress: dict, now):
+    """Advance `enrollment` in memory.
+
+    Returns (promotion or None, progress rows marked completed, new current
+    level that still needs a progress row or None).
+    """
+    if enrollment.completed_at or enrollment.current_level_id is None:
+        return None, [], None
+    index = next(
+        (
+            i
+            for i, level in enumerate(levels)
+            if level.pk == enrollment.current_level_id
+        ),
+        None,
+    )
+    if index is None:
+        return None, [], None
+
+    start, completed_rows, course_completed = index, [], False
+    while True:
+        level = levels[index]
+        row = progress.get(level.pk)
+        if row is None:
+            break
+        row.level = level  # criteria live on the level; avoid a lookup
+        if not row.is_complete():
+            break
+        if not row.completed:
+            row.completed, row.completed_at = True, now
+            completed_rows.append(row)
+        if index + 1 == len(levels):
+            course_completed = True
+            break
+        index += 1
+
+    levels_completed = index - start + course_completed
+    if not levels_completed:
+        return None, [], None
+    enrollment.current_level = levels[index]
+    if course_completed:
+        enrollment.completed_at = now
+    promotion = Promotion(
+        enrollment_id=enrollment.pk,
+        from_level=levels[start].level_number,
+        to_level=levels[index].level_number,
+        levels_completed=levels_completed,
+        course_completed=course_completed,
+    )
+    missing = levels[index] if levels[index].pk not in progress else None
+    return promotion, completed_rows, missing
+
+
+def lock_enrollments(enrollment_ids) -> list:
+    """Lock enrollments in primary-key order; call inside a transaction.
+
+    Anything that writes level progress and then promotes takes these locks
+    first, so concurrent writers queue instead of deadlocking.
+    """
+    return list(
+        LearnerCourseEnrollment.objects.select_for_update()
+        .filter(pk__in=enrollment_ids)
+        .order_by("pk")
+        .only("id", "learner_id", "course_id", "current_level_id", "completed_at")
+    )
+
+
+def promote_enrollments(enrollment_ids: Iterable) -> list[Promotion]:
+    """Promote each of `enrollment_ids` as far as its progress allows.
+
+    Runs in one transaction with the enrollments locked; returns a
+    `Promotion` for every enrollment that advanced.
+    """
+    ids = list(enrollment_ids)
+    if not ids:
+        return []
+    now = timezone.now()
+    with transaction.atomic():
+        enrollments = lock_enrollments(ids)
+        levels: dict = {}
+        for level in (
+            CourseLevel.objects.filter(course_id__in={e.course_id for e in enrollments})
+            .select_related("course")
+            .order_by("course_id", "level_number")
+        ):
+            levels.setdefault(level.course_id, []).append(level)
+        progress: dict = {}
+        for row in LearnerLevelProgress.objects.filter(enrollment_id__in=ids):
+            progress.setdefault(row.enrollment_id, {})[row.level_id] = row
+
+        promotions, completed_rows, new_rows, moved, awards = [], [], [], [], []
+        for enrollment in enrollments:
+            promotion, rows, missing = _evaluate(
+                enrollment,
+                levels.get(enrollment.course_id, []),
+                progress.get(enrollment.pk, {}),
+                now,
+            )
+            completed_rows += rows
+            awards += [
+                achievements.for_level(enrollment.learner_id, row.level, now)
+                for row in rows
+            ]
+            if missing is not None:
+                new_rows.append(
+                    LearnerLevelProgress(enrollment=enrollment, level=missing)
+                )
+            if promotion is not None:
+                promotions.append(promotion)
+                moved.append(enrollment)
+                if promotion.course_completed:
+                    awards.append(
+                        achievements.for_course(
+                            enrollment.learner_id, enrollment.current_level.course, now
+                        )
+                    )
+
+        LearnerLevelProgress.objects.bulk_update(
+            completed_rows, ["completed", "completed_at"], batch_size=CHUNK_SIZE
+        )
+        LearnerLevelProgress.objects.bulk_create(
+            new_rows, ignore_conflicts=True, batch_size=CHUNK_SIZE
+        )
+        LearnerCourseEnrollment.objects.bulk_update(
+            moved, ["current_level", "completed_at"], batch_size=CHUNK_SIZE
+        )
+        achievements.award(awards)
+        # Bulk writes skip the model signals that keep aggregates current.
+        changed = [e.pk for e in moved]
+        if changed:
+            transaction.on_commit(lambda: enrollment_progress.refresh(changed))
+    return promotions
+
+
+def promote(enrollment) -> Promotion | None:
+    """Promote one enrollment; updates `enrollment` in place."""
+    promotions = promote_enrollments([enrollment.pk])
+    if promotions:
+        enrollment.refresh_from_db(fields=["current_level", "completed_at"])
+    return promotions[0] if promotions else None
+
+
+def cohort(course=None, school=None):
+    """Enrollments in `course` and/or of `school`'s learners (ids)."""
+    qs = LearnerCourseEnrollment.objects.all()
+    if course:
+        qs = qs.filter(course_id=course)
+    if school:
+        qs = qs.filter(learner__tenant_id=school)
+    return qs
+
+
+def promote_queryset(queryset, progress=None) -> list[Promotion]:
+    """`promote_enrollments` over a cohort, one locked chunk at a time.
+
+    Only active, unfinished enrollments are considered. `progress` is called
+    with (enrollments processed, total) after each chunk.
+    """
+    ids = list(
+        queryset.filter(is_active=True, completed_at__isnull=True)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    promotions = []
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start : start + CHUNK_SIZE]
+        promotions += promote_enrollments(chunk)
+        if progress:
+            progress(start + len(chunk), len(ids))
+    return promotions
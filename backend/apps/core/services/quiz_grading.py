@@ -0,0 +1,144 @@
+"""Automatic grading of multiple-choice quizzes.
+
+A quiz's answer key is compiled once into a compact byte string (one byte
+per question: the index of the correct option) and cached under the quiz's
+``updated_at``, so editing a quiz invalidates its key without any explicit
+cache busting. An attempt's answers are encoded the same way and compared
+byte-for-byte; grading a batch reuses one compiled key for every attempt.
+
+Scores are whole percentages (0-100); ``passed`` is ``score >=
+quiz.passing_score``.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from apps.core.models import QuizAttempt
+from apps.core.services import progress_events
+from django.core.cache import cache
+from django.db import transaction
+
+KEY_PREFIX = "quiz:key:"
+KEY_TTL = 60 * 60 * 24
+MAX_OPTIONS = 26
+# Encodes a missing or out-of-range answer; never equals a key byte.
+NO_ANSWER = 255
+CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    """Correct option index per question, one byte each."""
+
+    correct: bytes
+    options: bytes  # number of options per question
+
+    def __len__(self) -> int:
+        return len(self.correct)
+
+
+@dataclass(frozen=True)
+class Grade:
+    correct: int
+    total: int
+    score: int
+    passed: bool
+
+
+def validate_questions(questions) -> list[str]:
+    """Problems with a quiz's ``questions`` JSON; empty when it is gradable."""
+    if not isinstance(questions, list) or not questions:
+        return ["questions must be a non-empty list."]
+    errors = []
+    for i, q in enumerate(questions, start=1):
+        if not isinstance(q, dict) or not str(q.get("question", "")).strip():
+            errors.append(f"Question {i}: question text is required.")
+            continue
+        options = q.get("options")
+        if not isinstance(options, list) or not 2 <= len(options) <= MAX_OPTIONS:
+            errors.append(f"Question {i}: needs 2-{MAX_OPTIONS} options.")
+            continue
+        answer = q.get("correct_answer")
+        if (
+            not isinstance(answer, int)
+            or isinstance(answer, bool)
+            or not 0 <= answer < len(options)
+        ):
+            errors.append(f"Question {i}: correct_answer must index an option.")
+    return errors
+
+
+def compile_key(questions) -> AnswerKey:
+    return AnswerKey(
+        correct=bytes(q["correct_answer"] for q in questions),
+        options=bytes(len(q["options"]) for q in questions),
+    )
+
+
+def answer_key(quiz) -> AnswerKey:
+    """`quiz`'s compiled key, cached until the quiz is next saved."""
+    key = f"{KEY_PREFIX}{quiz.pk}:{quiz.updated_at.timestamp()}"
+    return cache.get_or_set(key, lambda: compile_key(quiz.questions), KEY_TTL)
+
+
+def encode_answers(key: AnswerKey, answers) -> bytes:
+    """`answers` as one byte per question; invalid entries never match."""
+    answers = list(answers or [])[: len(key)]
+    answers += [None] * (len(key) - len(answers))
+    return bytes(
+        (
+            a
+            if isinstance(a, int) and not isinstance(a, bool) and 0 <= a < n
+            else NO_ANSWER
+        )
+        for a, n in zip(answers, key.options)
+    )
+
+
+def grade(quiz, answers, key: AnswerKey | None = None) -> Grade:
+    key = key or answer_key(quiz)
+    total = len(key)
+    correct = sum(map(operator.eq, key.correct, encode_answers(key, answers)))
+    score = round(100 * correct / total) if total else 0
+    return Grade(correct, total, score, score >= quiz.passing_score)
+
+
+def grade_attempts(quiz, attempts: Iterable[QuizAttempt]) -> list[QuizAttempt]:
+    """Re-grade `attempts` of `quiz` with one compiled key and bulk-save the
+    ones whose score or pass mark changed. Returns the changed attempts."""
+    key = answer_key(quiz)
+    changed = []
+    for attempt in attempts:
+        result = grade(quiz, attempt.answers, key)
+        if (attempt.score, attempt.passed) != (result.score, result.passed):
+            attempt.score, attempt.passed = result.score, result.passed
+            changed.append(attempt)
+    with transaction.atomic():
+        QuizAttempt.objects.bulk_update(
+            changed, ["score", "passed"], batch_size=CHUNK_SIZE
+        )
+        events = {(a.learner_id, quiz.module_id) for a in changed if a.completed_at}
+        if events and quiz.module_id:
+            # Bulk writes skip the signals that feed level progress.
+            transaction.on_commit(lambda: progress_events.apply(events))
+    return changed
+
+
+def regrade_quiz(quiz) -> int:
+    """Re-grade every completed attempt of `quiz`; returns attempts changed."""
+    attempts = QuizAttempt.objects.filter(quiz=quiz, completed_at__isnull=False).only(
+        "id", "learner_id", "answers", "score", "passed", "completed_at"
+    )
+    changed = 0
+    batch = []
+    for attempt in attempts.iterator(chunk_size=CHUNK_SIZE):
+        batch.append(attempt)
+        if len(batch) == CHUNK_SIZE:
+            changed += len(grade_attempts(quiz, batch))
+            batch = []
+    if batch:
+        changed += len(grade_attempts(quiz, batch))
+    return changed
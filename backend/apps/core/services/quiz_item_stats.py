@@ -0,0 +1,149 @@
+"""Per-question statistics of a quiz's completed attempts (item analysis).
+
+Teachers use these to spot questions that are too hard or that do not
+separate stronger from weaker learners. Rather than re-reading every
+attempt's answers on each request, one `QuizItemStatistics` row per quiz
+keeps sufficient statistics: the number of attempts n, the sum and sum of
+squares of attempt totals x (questions answered correctly) and, per
+question, the number correct c, the sum of x over the attempts that got it
+right and a histogram of the options chosen. Every attempt counts,
+including repeat attempts by the same learner. From those:
+
+- difficulty is p = c / n, the share of attempts answering correctly;
+- discrimination is the point-biserial correlation between getting the
+  question right (u) and the attempt total,
+  ``(n·Σxu − Σx·c) / sqrt((n·Σx² − (Σx)²) · (n·c − c²))``, computed from
+  integer sums and ``None`` when either side has no variance.
+
+`record` folds one attempt in; the submit endpoint calls it in the
+transaction that completes the attempt, under a row lock on the quiz's
+statistics. A row built for an older quiz revision (the quiz was edited,
+so the key may differ) is rebuilt instead, in one streamed pass over the
+attempts with a single compiled key. ``python manage.py
+rebuild_quiz_item_stats`` does the same for writes that bypass the
+endpoint. `summary` is the read side.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+
+from apps.core.models import QuizAttempt, QuizItemStatistics
+from apps.core.services import quiz_grading
+from django.db import transaction
+
+CHUNK_SIZE = 500
+
+
+def _reset(stats: QuizItemStatistics, quiz) -> quiz_grading.AnswerKey:
+    key = quiz_grading.answer_key(quiz)
+    stats.revision = quiz.updated_at
+    stats.attempt_count = stats.total_sum = stats.total_sq_sum = 0
+    stats.correct_counts = [0] * len(key)
+    stats.correct_total_sums = [0] * len(key)
+    stats.option_counts = [[0] * n for n in key.options]
+    return key
+
+
+def _add(stats: QuizItemStatistics, key: quiz_grading.AnswerKey, answers) -> None:
+    chosen = quiz_grading.encode_answers(key, answers)
+    hits = bytes(map(operator.eq, key.correct, chosen))  # 1 per correct answer
+    total = sum(hits)
+    stats.attempt_count += 1
+    stats.total_sum += total
+    stats.total_sq_sum += total * total
+    stats.correct_counts = list(map(operator.add, stats.correct_counts, hits))
+    stats.correct_total_sums = [
+        s + total * hit for s, hit in zip(stats.correct_total_sums, hits)
+    ]
+    for counts, option in zip(stats.option_counts, chosen):
+        if option != quiz_grading.NO_ANSWER:
+            counts[option] += 1
+
+
+def _fill(stats: QuizItemStatistics, quiz) -> None:
+    key = _reset(stats, quiz)
+    answers = QuizAttempt.objects.filter(
+        quiz=quiz, completed_at__isnull=False
+    ).values_list("answers", flat=True)
+    for row in answers.iterator(chunk_size=CHUNK_SIZE):
+        _add(stats, key, row)
+
+
+def _locked(quiz) -> QuizItemStatistics:
+    stats, _ = QuizItemStatistics.objects.select_for_update().get_or_create(quiz=quiz)
+    return stats
+
+
+def record(quiz, answers) -> None:
+    """Fold a just-completed attempt of `quiz` into its statistics.
+
+    Call inside the transaction that saves the attempt: a stale row is
+    rebuilt from the attempts table, which then already includes it.
+    """
+    with transaction.atomic():
+        stats = _locked(quiz)
+        if stats.revision == quiz.updated_at:
+            _add(stats, quiz_grading.answer_key(quiz), answers)
+        else:
+            _fill(stats, quiz)
+        stats.save()
+
+
+def rebuild(quiz) -> QuizItemStatistics:
+    """Recompute `quiz`'s statistics from all its completed attempts."""
+    with transaction.atomic():
+        stats = _locked(quiz)
+        _fill(stats, quiz)
+        stats.save()
+    return stats
+
+
+def current(quiz) -> QuizItemStatistics:
+    """`quiz`'s statistics, rebuilt first when missing or stale."""
+    stats = QuizItemStatistics.objects.filter(quiz=quiz).first()
+    if stats is None or stats.revision != quiz.updated_at:
+        stats = rebuild(quiz)
+    return stats
+
+
+def point_biserial(stats: QuizItemStatistics, index: int) -> float | None:
+    n, c = stats.attempt_count, stats.correct_counts[index]
+    sx, sxx = stats.total_sum, stats.total_sq_sum
+    denominator = (n * sxx - sx * sx) * (n * c - c * c)
+    if denominator <= 0:
+        return None
+    numerator = n * stats.correct_total_sums[index] - sx * c
+    return numerator / math.sqrt(denominator)
+
+
+def summary(quiz) -> dict:
+    """Item analysis of `quiz` for the teacher endpoint."""
+    stats = current(quiz)
+    n = stats.attempt_count
+    items = []
+    for index, question in enumerate(quiz.questions):
+        correct = stats.correct_counts[index]
+        options = stats.option_counts[index]
+        discrimination = point_biserial(stats, index)
+        items.append(
+            {
+                "index": index,
+                "question": question.get("question", ""),
+                "correct_answer": question.get("correct_answer"),
+                "correct": correct,
+                "difficulty": round(correct / n, 3) if n else None,
+                "discrimination": (
+                    round(discrimination, 3) if discrimination is not None else None
+                ),
+                "option_counts": options,
+                "unanswered": n - sum(options),
+            }
+        )
+    return {
+        "quiz": str(quiz.pk),
+        "attempts": n,
+        "mean_correct": round(stats.total_sum / n, 2) if n else None,
+        "items": items,
+    }
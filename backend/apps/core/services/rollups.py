@@ -0,0 +1,340 @@
+"""Daily per-school rollups for admin analytics.
+
+Two write paths keep `DailySchoolStats` current:
+
+- `apply_deltas` — small F()-expression increments issued from model signals
+  whenever a user, enrollment, session or attendance record changes.
+- `rebuild_daily_stats` — recomputes a date range from the raw tables with a
+  handful of grouped queries. Run nightly to repair drift from writes that
+  bypass signals (`QuerySet.update`, `bulk_create`, raw SQL).
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, time, timedelta
+
+from apps.core.models import (
+    Attendance,
+    DailySchoolStats,
+    LearnerCourseEnrollment,
+    Session,
+)
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Greatest, TruncDate
+from django.utils import timezone
+
+ROLLUP_FIELDS = (
+    "new_users",
+    "new_enrollments",
+    "sessions_created",
+    "sessions_total",
+    "sessions_completed",
+    "sessions_scheduled",
+    "attendance_total",
+    "attendance_present",
+    "attendance_absent",
+    "attendance_late",
+)
+
+SESSION_STATUS_FIELDS = {
+    "completed": "sessions_completed",
+    "scheduled": "sessions_scheduled",
+}
+ATTENDANCE_STATUS_FIELDS = {
+    "present": "attendance_present",
+    "absent": "attendance_absent",
+    "late": "attendance_late",
+}
+
+BucketKey = tuple  # (school_id | None, date)
+Deltas = dict  # BucketKey -> Counter
+
+
+def _local_date(value) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return value.date()
+    return value
+
+
+# ── Signal-side contributions ────────────────────────────────────────────────
+
+
+def contributions(instance) -> Deltas:
+    """Return the rollup counters a single row contributes, keyed by bucket."""
+    User = get_user_model()
+    out: Deltas = defaultdict(Counter)
+
+    if isinstance(instance, User):
+        day = _local_date(instance.date_joined)
+        if day:
+            out[(instance.tenant_id, day)]["new_users"] += 1
+
+    elif isinstance(instance, LearnerCourseEnrollment):
+        day = _local_date(instance.enrolled_at)
+        if day and instance.learner_id:
+            out[(instance.learner.tenant_id, day)]["new_enrollments"] += 1
+
+    elif isinstance(instance, Session):
+        created = _local_date(instance.created_at)
+        if created:
+            out[(instance.tenant_id, created)]["sessions_created"] += 1
+        if instance.date:
+            bucket = out[(instance.tenant_id, instance.date)]
+            bucket["sessions_total"] += 1
+            field = SESSION_STATUS_FIELDS.get(instance.status)
+            if field:
+                bucket[field] += 1
+
+    elif isinstance(instance, Attendance):
+        if instance.session_id:
+            session = instance.session
+            bucket = out[(session.tenant_id, session.date)]
+            bucket["attendance_total"] += 1
+            field = ATTENDANCE_STATUS_FIELDS.get(instance.status)
+            if field:
+                bucket[field] += 1
+
+    return out
+
+
+def session_attendance_contributions(session_id, school_id, day) -> Deltas:
+    """Attendance counters hanging off one session, for moving between buckets."""
+    out: Deltas = defaultdict(Counter)
+    rows = (
+        Attendance.objects.filter(session_id=session_id)
+        .values("status")
+        .annotate(n=Count("id"))
+    )
+    for row in rows:
+        bucket = out[(school_id, day)]
+        bucket["attendance_total"] += row["n"]
+        field = ATTENDANCE_STATUS_FIELDS.get(row["status"])
+        if field:
+            bucket[field] += row["n"]
+    return out
+
+
+def diff(before: Deltas, after: Deltas) -> Deltas:
+    """Per-bucket `after - before`, keeping negative values."""
+    out: Deltas = defaultdict(Counter)
+    for key, counts in after.items():
+        out[key].update(counts)
+    for key, counts in before.items():
+        out[key].subtract(counts)
+    return {k: v for k, v in out.items() if any(v.values())}
+
+
+def negate(deltas: Deltas) -> Deltas:
+    return {k: Counter({f: -n for f, n in v.items()}) for k, v in deltas.items()}
+
+
+def merge(*parts: Deltas) -> Deltas:
+    out: Deltas = defaultdict(Counter)
+    for part in parts:
+        for key, counts in part.items():
+            out[key].update(counts)
+    return out
+
+
+def apply_deltas(deltas: Deltas) -> None:
+    """Add signed counter deltas to their buckets, creating rows as needed."""
+    for (school_id, day), counts in deltas.items():
+        counts = {f: n for f, n in counts.items() if n}
+        if not counts:
+            continue
+        # Clamp at zero so drift never trips the unsigned column constraint;
+        # the nightly rebuild restores exact values.
+        updates = {f: Greatest(F(f) + n, 0) for f, n in counts.items()}
+        bucket = DailySchoolStats.objects.filter(school_id=school_id, date=day)
+        if bucket.update(**updates):
+            continue
+        try:
+            with transaction.atomic():
+                DailySchoolStats.objects.create(
+                    school_id=school_id,
+                    date=day,
+                    **{f: max(n, 0) for f, n in counts.items()},
+                )
+        except IntegrityError:
+            # Lost a race with a concurrent create; the row exists now.
+            bucket.update(**updates)
+
+
+# ── Reconciliation ───────────────────────────────────────────────────────────
+
+
+def _datetime_bounds(start: date, end: date) -> tuple[datetime, datetime]:
+    tz = timezone.get_current_timezone()
+    lower = timezone.make_aware(datetime.combine(start, time.min), tz)
+    upper = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min), tz)
+    return lower, upper
+
+
+def compute_daily_stats(start: date, end: date) -> Deltas:
+    """Recompute every bucket in [start, end] from the raw tables (5 queries)."""
+    User = get_user_model()
+    lower, upper = _datetime_bounds(start, end)
+    out: Deltas = defaultdict(Counter)
+
+    users = (
+        User.objects.filter(date_joined__gte=lower, date_joined__lt=upper)
+        .annotate(day=TruncDate("date_joined"))
+        .values("tenant_id", "day")
+        .annotate(n=Count("id"))
+    )
+    for row in users:
+        out[(row["tenant_id"], row["day"])]["new_users"] += row["n"]
+
+    enrollments = (
+        LearnerCourseEnrollment.objects.filter(
+            enrolled_at__gte=lower, enrolled_at__lt=upper
+        )
+        .annotate(day=TruncDate("enrolled_at"))
+        .values("learner__tenant_id", "day")
+        .annotate(n=Count("id"))
+    )
+    for row in enrollments:
+        out[(row["learner__tenant_id"], row["day"])]["new_enrollments"] += row["n"]
+
+    created = (
+        Session.objects.filter(created_at__gte=lower, created_at__lt=upper)
+        .annotate(day=TruncDate("created_at"))
+        .values("tenant_id", "day")
+        .annotate(n=Count("id"))
+    )
+    for row in created:
+        out[(row["tenant_id"], row["day"])]["sessions_created"] += row["n"]
+
+    sessions = (
+        Session.objects.filter(date__gte=start, date__lte=end)
+        .values("tenant_id", "date", "status")
+        .annotate(n=Count("id"))
+    )
+    for row in sessions:
+        bucket = out[(row["tenant_id"], row["date"])]
+        bucket["sessions_total"] += row["n"]
+        field = SESSION_STATUS_FIELDS.get(row["status"])
+        if field:
+            bucket[field] += row["n"]
+
+    attendance = (
+        Attendance.objects.filter(session__date__gte=start, session__date__lte=end)
+        .values("session__tenant_id", "session__date", "status")
+        .annotate(n=Count("id"))
+    )
+    for row in attendance:
+        bucket = out[(row["session__tenant_id"], row["session__date"])]
+        bucket["attendance_total"] += row["n"]
+        field = ATTENDANCE_STATUS_FIELDS.get(row["status"])
+        if field:
+            bucket[field] += row["n"]
+
+    return out
+
+
+@transaction.atomic
+def rebuild_daily_stats(start: date, end: date) -> int:
+    """Replace all rollup rows in [start, end] with freshly computed counts.
+
+    Returns the number of rows written.
+    """
+    computed = compute_daily_stats(start, end)
+    DailySchoolStats.objects.filter(date__gte=start, date__lte=end).delete()
+    rows = [
+        DailySchoolStats(school_id=school_id, date=day, **counts)
+        for (school_id, day), counts in computed.items()
+        if any(counts.values())
+    ]
+    DailySchoolStats.objects.bulk_create(rows, batch_size=500)
+    return len(rows)
+
+
+def rebuild_range(
+    start: date,
+    end: date,
+    chunk_days: int = 31,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """`rebuild_daily_stats` over [start, end], one transaction per chunk.
+
+    `progress(days_done, days_total)` is called after each chunk. Returns the
+    number of rows written.
+    """
+    chunk = max(chunk_days, 1)
+    total_days = (end - start).days + 1
+    written = 0
+    cursor = start
+    while cursor <= end:
+        chunk_end = min(cursor + timedelta(days=chunk - 1), end)
+        written += rebuild_daily_stats(cursor, chunk_end)
+        cursor = chunk_end + timedelta(days=1)
+        if progress is not None:
+            progress((cursor - start).days, total_days)
+    return written
+
+
+def data_date_range() -> tuple[date, date] | None:
+    """Earliest and latest dates touched by any rolled-up table."""
+    User = get_user_model()
+    candidates: list[date] = []
+    for qs, field in (
+        (User.objects.all(), "date_joined"),
+        (LearnerCourseEnrollment.objects.all(), "enrolled_at"),
+        (Session.objects.all(), "created_at"),
+        (Session.objects.all(), "date"),
+    ):
+        first = qs.order_by(field).values_list(field, flat=True).first()
+        last = qs.order_by(f"-{field}").values_list(field, flat=True).first()
+        candidates.extend(_local_date(v) for v in (first, last) if v is not None)
+    if not candidates:
+        return None
+    return min(candidates), max(candidates)
+
+
+# ── Reads ────────────────────────────────────────────────────────────────────
+
+
+def daily_totals(start: date, end: date) -> dict[date, dict[str, int]]:
+    """Platform-wide counters per day in [start, end] (all schools summed)."""
+    rows = (
+        DailySchoolStats.objects.filter(date__gte=start, date__lte=end)
+        .values("date")
+        .annotate(**{f: Sum(f) for f in ROLLUP_FIELDS})
+    )
+    return {row.pop("date"): row for row in rows}
+
+
+def totals(start: date | None = None, end: date | None = None) -> dict[str, int]:
+    """Counters summed over a window (or all time when no bounds are given)."""
+    qs = DailySchoolStats.objects.all()
+    if start is not None:
+        qs = qs.filter(date__gte=start)
+    if end is not None:
+        qs = qs.filter(date__lte=end)
+    agg = qs.aggregate(**{f: Sum(f) for f in ROLLUP_FIELDS})
+    return {f: agg[f] or 0 for f in ROLLUP_FIELDS}
+
+
+def sessions_by_school() -> dict:
+    """All-time session totals per school id."""
+    rows = (
+        DailySchoolStats.objects.filter(school__isnull=False)
+        .values("school_id")
+        .annotate(n=Sum("sessions_total"))
+    )
+    return {row["school_id"]: row["n"] or 0 for row in rows}
+
+
+def iter_days(start: date, end: date) -> Iterable[date]:
+    cur = start
+    while cur <= end:
+        yield cur
+        cur += timedelta(days=1)
@@ -0,0 +1,107 @@
+"""The teacher → learner access table (`TeacherLearnerAccess`).
+
+A teacher may access a learner while the learner has an active enrollment in
+a course the teacher is assigned to. Instead of joining enrollments with
+``course__teachers`` on every request, the pairs are kept in a table:
+
+- `refresh` recomputes the pairs of some teachers and/or learners and writes
+  only the difference. Model signals call it on commit after
+  ``Course.teachers`` changes and enrollment writes (see apps.core.signals).
+- `rebuild` recomputes the whole table, a chunk of teachers at a time, to
+  repair drift from writes that bypass signals (``QuerySet.update``,
+  ``bulk_create``); ``python manage.py rebuild_teacher_access`` wraps it.
+
+`learner_ids` / `can_access` are the read side.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from apps.core.models import LearnerCourseEnrollment, TeacherLearnerAccess
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+CHUNK_SIZE = 500
+
+
+def _pairs(teacher_ids=None, learner_ids=None) -> set[tuple]:
+    """(teacher id, learner id) pairs implied by active enrollments."""
+    qs = LearnerCourseEnrollment.objects.filter(
+        is_active=True, course__teachers__isnull=False
+    )
+    if teacher_ids is not None:
+        qs = qs.filter(course__teachers__in=teacher_ids)
+    if learner_ids is not None:
+        qs = qs.filter(learner_id__in=learner_ids)
+    return set(qs.values_list("course__teachers", "learner_id").distinct())
+
+
+def refresh(teacher_ids: Iterable = (), learner_ids: Iterable = ()) -> int:
+    """Recompute every pair involving `teacher_ids` or `learner_ids`.
+
+    Returns the number of rows added plus rows removed.
+    """
+    teacher_ids = {pk for pk in teacher_ids if pk is not None}
+    learner_ids = {pk for pk in learner_ids if pk is not None}
+    if not teacher_ids and not learner_ids:
+        return 0
+    scope = Q(teacher_id__in=teacher_ids) | Q(learner_id__in=learner_ids)
+    with transaction.atomic():
+        wanted = set()
+        if teacher_ids:
+            wanted |= _pairs(teacher_ids=teacher_ids)
+        if learner_ids:
+            wanted |= _pairs(learner_ids=learner_ids)
+        existing = {
+            (teacher_id, learner_id): pk
+            for teacher_id, learner_id, pk in TeacherLearnerAccess.objects.filter(
+                scope
+            ).values_list("teacher_id", "learner_id", "pk")
+        }
+        stale = [pk for pair, pk in existing.items() if pair not in wanted]
+        if stale:
+            TeacherLearnerAccess.objects.filter(pk__in=stale).delete()
+        new = [
+            TeacherLearnerAccess(teacher_id=teacher_id, learner_id=learner_id)
+            for teacher_id, learner_id in wanted
+            if (teacher_id, learner_id) not in existing
+        ]
+        TeacherLearnerAccess.objects.bulk_create(
+            new, ignore_conflicts=True, batch_size=CHUNK_SIZE
+        )
+    return len(stale) + len(new)
+
+
+def rebuild(progress=None) -> int:
+    """`refresh` every teacher (and drop rows of anyone no longer teaching).
+
+    `progress` is called with (teachers processed, total) after each chunk.
+    """
+    teacher_ids = sorted(
+        set(
+            get_user_model()
+            .objects.filter(courses_taught__isnull=False)
+            .values_list("pk", flat=True)
+        )
+        | set(TeacherLearnerAccess.objects.values_list("teacher_id", flat=True))
+    )
+    changed = 0
+    for start in range(0, len(teacher_ids), CHUNK_SIZE):
+        chunk = teacher_ids[start : start + CHUNK_SIZE]
+        changed += refresh(teacher_ids=chunk)
+        if progress:
+            progress(start + len(chunk), len(teacher_ids))
+    return changed
+
+
+def learner_ids(teacher) -> QuerySet:
+    """Ids of the learners `teacher` may access, as a subquery."""
+    return TeacherLearnerAccess.objects.filter(teacher=teacher).values("learner_id")
+
+
+def can_access(teacher, learner_id) -> bool:
+    return TeacherLearnerAccess.objects.filter(
+        teacher=teacher, learner_id=learner_id
+    ).exists()
@@ -0,0 +1,193 @@
+"""Bulk user import from CSV.
+
+The upload is parsed as a stream and handled in batches. Each batch is
+validated against a school-id map loaded once up front, plus one query each
+for clashing usernames and emails. Passwords are hashed exactly once per user,
+spread over a process pool for large imports, and the users are inserted with
+`bulk_create`. A dry run performs the same validation without hashing or
+writing anything.
+
+Expected columns: username,email,first_name,last_name,role,school_id,password
+(legacy `tenant_id` is accepted in place of `school_id`).
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+
+from apps.core.models import School
+from apps.core.roles import UserRole
+from apps.core.services import counters, rollups
+from apps.core.services.passwords import hash_passwords, hash_pool
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+BATCH_SIZE = 500
+REQUIRED_FIELDS = ("username", "email", "role")
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    valid: int = 0
+    dry_run: bool = False
+    errors: list[str] = field(default_factory=list)
+
+
+def iter_csv_rows(uploaded_file) -> Iterator[tuple[int, dict]]:
+    """Yield ``(row_number, row)`` without reading the whole file into memory."""
+    reader = csv.DictReader(codecs.iterdecode(uploaded_file, "utf-8-sig"))
+    yield from enumerate(reader, start=2)
+
+
+def _batches(rows: Iterable, size: int) -> Iterator[list]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class UserImporter:
+    def __init__(self, dry_run: bool = False):
+        self.User = get_user_model()
+        self.result = ImportResult(dry_run=dry_run)
+        self.school_ids = {
+            str(pk) for pk in School.objects.values_list("id", flat=True)
+        }
+        self.roles = set(UserRole.values)
+        self.seen_usernames: set[str] = set()
+        self.seen_emails: set[str] = set()
+
+    def _clean(self, row_num: int, row: dict) -> dict | None:
+        missing = [f for f in REQUIRED_FIELDS if not (row.get(f) or "").strip()]
+        if missing:
+            self.result.errors.append(f"Row {row_num}: Missing fields {missing}")
+            return None
+
+        username = self.User.normalize_username(row["username"].strip())
+        email = self.User.objects.normalize_email(row["email"].strip())
+        role = row["role"].strip()
+        if role not in self.roles:
+            self.result.errors.append(f"Row {row_num}: Invalid role '{role}'")
+            return None
+
+        school_id = (row.get("school_id") or row.get("tenant_id") or "").strip()
+        if school_id and school_id not in self.school_ids:
+            self.result.errors.append(f"Row {row_num}: School {school_id} not found")
+            return None
+
+        if username.lower() in self.seen_usernames:
+            self.result.errors.append(
+                f"Row {row_num}: Duplicate username '{username}' in file"
+            )
+            return None
+        if email.lower() in self.seen_emails:
+            self.result.errors.append(
+                f"Row {row_num}: Duplicate email '{email}' in file"
+            )
+            return None
+        self.seen_usernames.add(username.lower())
+        self.seen_emails.add(email.lower())
+
+        return {
+            "row_num": row_num,
+            "username": username,
+            "email": email,
+            "first_name": (row.get("first_name") or "").strip(),
+            "last_name": (row.get("last_name") or "").strip(),
+            "role": role,
+            "tenant_id": school_id or None,
+            "password": row.get("password") or None,
+        }
+
+    def _drop_existing(self, cleaned: list[dict]) -> list[dict]:
+        # Logins are unique ignoring case; LOWER() matches the unique indexes.
+        taken_usernames = set(
+            self.User.objects.annotate(key=Lower("username"))
+            .filter(key__in=[c["username"].lower() for c in cleaned])
+            .values_list("key", flat=True)
+        )
+        taken_emails = set(
+            self.User.objects.annotate(key=Lower("email"))
+            .filter(key__in=[c["email"].lower() for c in cleaned])
+            .values_list("key", flat=True)
+        )
+        kept = []
+        for c in cleaned:
+            if c["username"].lower() in taken_usernames:
+                self.result.errors.append(
+                    f"Row {c['row_num']}: Username '{c['username']}' already exists"
+                )
+            elif c["email"].lower() in taken_emails:
+                self.result.errors.append(
+                    f"Row {c['row_num']}: Email '{c['email']}' already exists"
+                )
+            else:
+                kept.append(c)
+        return kept
+
+    def _create(self, cleaned: list[dict], pool: Executor | None) -> None:
+        hashes = hash_passwords([c.pop("password") for c in cleaned], pool)
+        users = []
+        for c, hashed in zip(cleaned, hashes):
+            c.pop("row_num")
+            users.append(self.User(password=hashed, **c))
+        self.User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+        self.result.created += len(users)
+
+    def run(
+        self,
+        rows: Iterable[tuple[int, dict]],
+        size_hint: int = 0,
+        progress: Callable[[int], None] | None = None,
+    ) -> ImportResult:
+        """Import `rows`, calling `progress(rows_seen)` after each batch."""
+        pool = None if self.result.dry_run else hash_pool(size_hint)
+        seen = 0
+        try:
+            with transaction.atomic():
+                for batch in _batches(rows, BATCH_SIZE):
+                    cleaned = [c for c in (self._clean(n, r) for n, r in batch) if c]
+                    cleaned = self._drop_existing(cleaned) if cleaned else []
+                    self.result.valid += len(cleaned)
+                    if cleaned and not self.result.dry_run:
+                        self._create(cleaned, pool)
+                    seen += len(batch)
+                    if progress is not None:
+                        progress(seen)
+                if self.result.created:
+                    # bulk_create bypasses model signals; resync derived stats.
+                    transaction.on_commit(_resync_derived_stats)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return self.result
+
+
+def _resync_derived_stats() -> None:
+    today = timezone.localdate()
+    rollups.rebuild_daily_stats(today, today)
+    counters.reconcile()
+
+
+def import_users(
+    uploaded_file,
+    dry_run: bool = False,
+    progress: Callable[[int], None] | None = None,
+) -> ImportResult:
+    """Validate and (unless `dry_run`) create users from an uploaded CSV."""
+    # ~60 bytes per row is a conservative lower bound for this format.
+    size_hint = (getattr(uploaded_file, "size", 0) or 0) // 60
+    return UserImporter(dry_run=dry_run).run(
+        iter_csv_rows(uploaded_file), size_hint, progress
+    )
@@ -0,0 +1,501 @@
+"""Model signal handlers for denormalized read models.
+
+Handlers only compute what changed and defer the write to
+`transaction.on_commit`, so rolled-back requests never leak into rollups
+or cached counters.
+"""
+
+from __future__ import annotations
+
+from apps.core.models import Course, LearnerCourseEnrollment, School, Session
+from apps.core.services import (
+    counters,
+    enrollment_progress,
+    module_badges,
+    principals,
+    progress_events,
+    rollups,
+    teacher_access,
+)
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+
+# Fields whose change can move a row between rollup buckets. Saves restricted
+# to other fields (e.g. `update_fields=["last_login"]` on login) are skipped.
+_ROLLUP_TRACKED_FIELDS = {
+    settings.AUTH_USER_MODEL: {"tenant", "date_joined"},
+    "core.LearnerCourseEnrollment": {"learner", "enrolled_at"},
+    "core.Session": {"tenant", "date", "status", "created_at"},
+    "core.Attendance": {"session", "status"},
+}
+
+
+def _model_label(sender) -> str:
+    return f"{sender._meta.app_label}.{sender._meta.object_name}"
+
+
+def _tracks(sender, update_fields) -> bool:
+    if update_fields is None:
+        return True
+    tracked = _ROLLUP_TRACKED_FIELDS[_model_label(sender)]
+    return bool(tracked.intersection(update_fields))
+
+
+def _schedule(deltas) -> None:
+    if deltas:
+        transaction.on_commit(lambda: rollups.apply_deltas(deltas))
+
+
+def _rollup_pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._rollup_before = {}
+    instance._rollup_previous = None
+    if raw or instance._state.adding or not _tracks(sender, update_fields):
+        return
+    previous = sender._base_manager.filter(pk=instance.pk).first()
+    if previous is not None:
+        instance._rollup_before = rollups.contributions(previous)
+        instance._rollup_previous = previous
+
+
+def _rollup_post_save(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    if raw or (not created and not _tracks(sender, update_fields)):
+        return
+    before = getattr(instance, "_rollup_before", {})
+    deltas = rollups.diff(before, rollups.contributions(instance))
+
+    # A session moving to another day/school carries its attendance with it.
+    previous = getattr(instance, "_rollup_previous", None)
+    if isinstance(instance, Session) and previous is not None:
+        old_key = (previous.tenant_id, previous.date)
+        new_key = (instance.tenant_id, instance.date)
+        if old_key != new_key:
+            moved = rollups.session_attendance_contributions(instance.pk, *old_key)
+            deltas = rollups.merge(
+                deltas,
+                rollups.negate(moved),
+                {new_key: moved.get(old_key, {})} if moved else {},
+            )
+
+    _schedule(deltas)
+
+
+def _rollup_pre_delete(sender, instance, **kwargs):
+    # Related rows (session, learner) still exist here; in post_delete they
+    # may already be gone as part of the same cascade.
+    instance._rollup_before = rollups.contributions(instance)
+
+
+def _rollup_post_delete(sender, instance, **kwargs):
+    _schedule(rollups.negate(getattr(instance, "_rollup_before", {})))
+
+
+for _sender in _ROLLUP_TRACKED_FIELDS:
+    pre_save.connect(
+        _rollup_pre_save, sender=_sender, dispatch_uid=f"rollup_pre_save_{_sender}"
+    )
+    post_save.connect(
+        _rollup_post_save, sender=_sender, dispatch_uid=f"rollup_post_save_{_sender}"
+    )
+    pre_delete.connect(
+        _rollup_pre_delete, sender=_sender, dispatch_uid=f"rollup_pre_delete_{_sender}"
+    )
+    post_delete.connect(
+        _rollup_post_delete,
+        sender=_sender,
+        dispatch_uid=f"rollup_post_delete_{_sender}",
+    )
+
+
+# ── Overview counters ────────────────────────────────────────────────────────
+
+
+def _schedule_counters(deltas) -> None:
+    deltas = {name: n for name, n in deltas.items() if n}
+    if deltas:
+        transaction.on_commit(lambda: counters.apply_deltas(deltas))
+
+
+def _counter_pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._counter_before = None
+    label = _model_label(sender)
+    tracked = counters.tracked_fields(label)
+    if raw or instance._state.adding or not tracked:
+        return
+    if update_fields is not None and not tracked.intersection(update_fields):
+        return
+    previous = sender._base_manager.filter(pk=instance.pk).first()
+    if previous is not None:
+        instance._counter_before = counters.membership(previous, label)
+
+
+def _counter_post_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    label = _model_label(sender)
+    after = counters.membership(instance, label)
+    if created:
+        _schedule_counters({name: 1 for name in after})
+        return
+    before = getattr(instance, "_counter_before", None)
+    if before is None or before == after:
+        return
+    deltas = {name: 1 for name in after - before}
+    deltas.update({name: -1 for name in before - after})
+    _schedule_counters(deltas)
+
+
+def _counter_post_delete(sender, instance, **kwargs):
+    label = _model_label(sender)
+    _schedule_counters({name: -1 for name in counters.membership(instance, label)})
+
+
+for _sender in {spec.model for spec in counters.COUNTERS}:
+    pre_save.connect(
+        _counter_pre_save, sender=_sender, dispatch_uid=f"counter_pre_save_{_sender}"
+    )
+    post_save.connect(
+        _counter_post_save,
+        sender=_sender,
+        dispatch_uid=f"counter_post_save_{_sender}",
+    )
+    post_delete.connect(
+        _counter_post_delete,
+        sender=_sender,
+        dispatch_uid=f"counter_post_delete_{_sender}",
+    )
+
+
+# ── Enrollment progress aggregates ───────────────────────────────────────────
+
+_PROGRESS_TRACKED_FIELDS = {
+    "core.LearnerLevelProgress": {
+        "enrollment",
+        "modules_completed",
+        "artifacts_submitted",
+        "assessment_score",
+    },
+    "core.LearnerCourseEnrollment": {"course", "completed_at"},
+    "core.CourseLevel": {"course", "required_modules_count"},
+}
+
+
+def _schedule_progress(enrollment_ids=(), course_id=None) -> None:
+    ids = [pk for pk in enrollment_ids if pk is not None]
+    if ids:
+        transaction.on_commit(lambda: enrollment_progress.refresh(ids))
+    if course_id is not None:
+        transaction.on_commit(lambda: enrollment_progress.refresh_course(course_id))
+
+
+def _progress_targets(instance):
+    """(enrollment ids, course id) whose aggregates `instance` feeds."""
+    label = _model_label(type(instance))
+    if label == "core.LearnerLevelProgress":
+        return [instance.enrollment_id], None
+    if label == "core.LearnerCourseEnrollment":
+        return [instance.pk], None
+    return [], instance.course_id
+
+
+def _progress_post_save(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    if raw:
+        return
+    tracked = _PROGRESS_TRACKED_FIELDS[_model_label(sender)]
+    if update_fields is not None and not tracked.intersection(update_fields):
+        return
+    _schedule_progress(*_progress_targets(instance))
+
+
+def _progress_post_delete(sender, instance, **kwargs):
+    if _model_label(sender) == "core.LearnerCourseEnrollment":
+        return
+    _schedule_progress(*_progress_targets(instance))
+
+
+for _sender in _PROGRESS_TRACKED_FIELDS:
+    post_save.connect(
+        _progress_post_save,
+        sender=_sender,
+        dispatch_uid=f"progress_post_save_{_sender}",
+    )
+    post_delete.connect(
+        _progress_post_delete,
+        sender=_sender,
+        dispatch_uid=f"progress_post_delete_{_sender}",
+    )
+
+
+# ── Progress evidence events ─────────────────────────────────────────────────
+# Approved artifacts, completed quiz attempts and attendance feed level
+# progress counters (apps.core.services.progress_events).
+
+_EVIDENCE_TRACKED_FIELDS = {
+    "core.Artifact": {"learner", "module", "status"},
+    "core.QuizAttempt": {"learner", "quiz", "score", "completed_at"},
+    "core.Attendance": {"learner", "session", "status"},
+}
+
+
+def _related_module_id(instance, field_name):
+    """`module_id` of `instance`'s quiz/session, without loading that row."""
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        return getattr(instance, field_name).module_id
+    return (
+        field.related_model.objects.filter(pk=getattr(instance, field.attname))
+        .values_list("module_id", flat=True)
+        .first()
+    )
+
+
+def _evidence_event(instance):
+    """The (learner id, module id) `instance` is evidence for, or None."""
+    label = _model_label(type(instance))
+    if label == "core.Artifact":
+        if instance.status != instance.STATUS_APPROVED:
+            return None
+        return instance.learner_id, instance.module_id
+    if label == "core.QuizAttempt":
+        if instance.completed_at is None:
+            return None
+        return instance.learner_id, _related_module_id(instance, "quiz")
+    if instance.status not in progress_events.ATTENDED:
+        return None
+    return instance.learner_id, _related_module_id(instance, "session")
+
+
+def _evidence_post_save(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    if raw:
+        return
+    tracked = _EVIDENCE_TRACKED_FIELDS[_model_label(sender)]
+    if update_fields is not None and not tracked.intersection(update_fields):
+        return
+    event = _evidence_event(instance)
+    if event:
+        progress_events.record(*event)
+
+
+for _sender in _EVIDENCE_TRACKED_FIELDS:
+    post_save.connect(
+        _evidence_post_save,
+        sender=_sender,
+        dispatch_uid=f"evidence_post_save_{_sender}",
+    )
+
+
+# ── Teacher → learner access ─────────────────────────────────────────────────
+# Keeps TeacherLearnerAccess in step with course assignments and enrollments
+# (apps.core.services.teacher_access).
+
+_ACCESS_TRACKED_FIELDS = {"learner", "course", "is_active"}
+
+
+def _schedule_access(teacher_ids=(), learner_ids=()) -> None:
+    teacher_ids, learner_ids = set(teacher_ids), set(learner_ids)
+    if teacher_ids or learner_ids:
+        transaction.on_commit(lambda: teacher_access.refresh(teacher_ids, learner_ids))
+
+
+def _access_enrollment_post_save(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    if raw:
+        return
+    if update_fields is not None and not _ACCESS_TRACKED_FIELDS.intersection(
+        update_fields
+    ):
+        return
+    learner_ids = {instance.learner_id}
+    # The rollup pre_save has already loaded the row as it was, whenever the
+    # learner may have changed.
+    previous = getattr(instance, "_rollup_previous", None)
+    if previous is not None:
+        learner_ids.add(previous.learner_id)
+    _schedule_access(learner_ids=learner_ids)
+
+
+def _access_enrollment_post_delete(sender, instance, **kwargs):
+    _schedule_access(learner_ids=[instance.learner_id])
+
+
+def _access_teachers_changed(sender, instance, action, reverse, pk_set=None, **kwargs):
+    if action == "pre_clear":
+        # pk_set is not provided for clears; remember who is being removed.
+        instance._access_cleared = (
+            [instance.pk]
+            if reverse
+            else list(instance.teachers.values_list("pk", flat=True))
+        )
+        return
+    if action == "post_clear":
+        _schedule_access(teacher_ids=getattr(instance, "_access_cleared", []))
+    elif action in ("post_add", "post_remove") and pk_set:
+        _schedule_access(teacher_ids=[instance.pk] if reverse else pk_set)
+
+
+post_save.connect(
+    _access_enrollment_post_save,
+    sender="core.LearnerCourseEnrollment",
+    dispatch_uid="access_post_save_core.LearnerCourseEnrollment",
+)
+post_delete.connect(
+    _access_enrollment_post_delete,
+    sender="core.LearnerCourseEnrollment",
+    dispatch_uid="access_post_delete_core.LearnerCourseEnrollment",
+)
+m2m_changed.connect(
+    _access_teachers_changed,
+    sender=Course.teachers.through,
+    dispatch_uid="access_m2m_changed_core.Course.teachers",
+)
+
+
+# ── Enrollment school ────────────────────────────────────────────────────────
+# LearnerCourseEnrollment.school copies the learner's tenant; moving a learner
+# to another school moves their enrollments with them.
+
+
+def _enrollment_school_learner_post_save(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    if raw or created:
+        return
+    if update_fields is not None and "tenant" not in update_fields:
+        return
+    LearnerCourseEnrollment.objects.filter(learner=instance).exclude(
+        school_id=instance.tenant_id
+    ).update(school_id=instance.tenant_id)
+
+
+post_save.connect(
+    _enrollment_school_learner_post_save,
+    sender="core.Learner",
+    dispatch_uid="enrollment_school_post_save_core.Learner",
+)
+
+
+# ── Earned module badges ─────────────────────────────────────────────────────
+# Presence at a completed session earns the module's badge
+# (apps.core.services.module_badges).
+
+_BADGE_TRACKED_FIELDS = {
+    "core.Attendance": {"learner", "session", "status"},
+    "core.Session": {"module", "date", "status"},
+}
+
+
+def _badge_post_save(
+    sender, instance, created, raw=False, update_fields=None, **kwargs
+):
+    if raw:
+        return
+    tracked = _BADGE_TRACKED_FIELDS[_model_label(sender)]
+    if update_fields is not None and not tracked.intersection(update_fields):
+        return
+    if isinstance(instance, Session):
+        if created:
+            return  # no attendance yet
+        session_ids = [instance.pk]
+        transaction.on_commit(lambda: module_badges.refresh_sessions(session_ids))
+        return
+    learner_ids = {instance.learner_id}
+    # The rollup pre_save has already loaded the row as it was.
+    previous = getattr(instance, "_rollup_previous", None)
+    if previous is not None:
+        learner_ids.add(previous.learner_id)
+    transaction.on_commit(lambda: module_badges.refresh(learner_ids))
+
+
+def _badge_attendance_post_delete(sender, instance, **kwargs):
+    learner_ids = [instance.learner_id]
+    transaction.on_commit(lambda: module_badges.refresh(learner_ids))
+
+
+for _sender in _BADGE_TRACKED_FIELDS:
+    post_save.connect(
+        _badge_post_save,
+        sender=_sender,
+        dispatch_uid=f"badge_post_save_{_sender}",
+    )
+post_delete.connect(
+    _badge_attendance_post_delete,
+    sender="core.Attendance",
+    dispatch_uid="badge_post_delete_core.Attendance",
+)
+
+
+# ── Authentication principals ────────────────────────────────────────────────
+# Cached JWT principals are invalidated when the user, their teacher schools
+# or a school they teach at change (apps.core.services.principals).
+
+
+def _schedule_bump(user_ids) -> None:
+    user_ids = set(user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: principals.bump(user_ids))
+
+
+def _principal_user_changed(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and update_fields <= principals.EXCLUDED_FIELDS:
+        return
+    _schedule_bump([instance.pk])
+
+
+def _principal_schools_changed(
+    sender, instance, action, reverse, pk_set=None, **kwargs
+):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            _schedule_bump([instance.pk])
+    elif action == "pre_clear":
+        # pk_set is not provided for clears; remember who is being removed.
+        instance._principal_cleared = list(
+            instance.teachers.values_list("pk", flat=True)
+        )
+    elif action == "post_clear":
+        _schedule_bump(getattr(instance, "_principal_cleared", []))
+    elif action in ("post_add", "post_remove") and pk_set:
+        _schedule_bump(pk_set)
+
+
+def _principal_school_pre_delete(sender, instance, **kwargs):
+    # The school's teacher links go with it, without m2m signals.
+    _schedule_bump(instance.teachers.values_list("pk", flat=True))
+
+
+post_save.connect(
+    _principal_user_changed,
+    sender=settings.AUTH_USER_MODEL,
+    dispatch_uid=f"principal_post_save_{settings.AUTH_USER_MODEL}",
+)
+post_delete.connect(
+    _principal_user_changed,
+    sender=settings.AUTH_USER_MODEL,
+    dispatch_uid=f"principal_post_delete_{settings.AUTH_USER_MODEL}",
+)
+m2m_changed.connect(
+    _principal_schools_changed,
+    sender=get_user_model().teacher_schools.through,
+    dispatch_uid=f"principal_m2m_changed_{settings.AUTH_USER_MODEL}.teacher_schools",
+)
+pre_delete.connect(
+    _principal_school_pre_delete,
+    sender=School,
+    dispatch_uid="principal_pre_delete_core.School",
+)
@@ -0,0 +1,12 @@
+"""Celery tasks. Only used when ``JOBS_BACKEND == "celery"``."""
+
+from __future__ import annotations
+
+from apps.core.services import jobs
+from celery import shared_task
+
+
+@shared_task(name="core.run_job", bind=True, ignore_result=True)
+def run_job(self, job_id: str) -> None:
+    jobs.fail_stale()
+    jobs.run(job_id, worker=f"celery:{self.request.hostname or ''}")
@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
-from django.db.models import Q
+
+from .models import email_iexact, username_iexact
 
 User = get_user_model()
 
@@ -8,33 +9,32 @@ User = get_user_model()
 class EmailBackend(ModelBackend):
     """
     Authenticate against the User model using email or username.
+
+    Usernames and emails are each unique ignoring case, so one probe of the
+    functional indexes finds at most one user per column. When one user's
+    username equals another's email, the username match wins: only a single
+    candidate's password is ever checked.
     """
 
     def authenticate(self, request, username=None, password=None, **kwargs):
         if username is None:
             username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
 
-        try:
-            # Check if username is email or username
-            user = User.objects.get(
-                Q(username__iexact=username) | Q(email__iexact=username)
-            )
-        except User.DoesNotExist:
+        user = (
+            User.objects.filter(username_iexact(username) | email_iexact(username))
+            .alias(by_username=username_iexact(username))
+            .order_by("-by_username")
+            .first()
+        )
+        if user is None:
             # Run the default password hasher once to reduce the timing
             # difference between an existing and a nonexistent user (#20760).
             User().set_password(password)
             return None
-        except User.MultipleObjectsReturned:
-            # If multiple users match, try to find one with correct password
-            users = User.objects.filter(
-                Q(username__iexact=username) | Q(email__iexact=username)
-            ).order_by("-id")
-            for user in users:
-                if user.check_password(password) and self.user_can_authenticate(user):
-                    return user
-            return None
 
-        if user and user.check_password(password) and self.user_can_authenticate(user):
+        if user.check_password(password) and self.user_can_authenticate(user):
             return user
 
         return None
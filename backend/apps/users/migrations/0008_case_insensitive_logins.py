@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:23
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def check_duplicates(apps, schema_editor):
+    """Refuse to add the constraints over case-insensitive duplicates.
+
+    Which account keeps a clashing login is a support decision, so the
+    clashes are listed for manual resolution instead of being renamed.
+    """
+    User = apps.get_model("users", "User")
+    clashes = []
+    for field in ("username", "email"):
+        rows = (
+            User.objects.exclude(**{f"{field}__isnull": True})
+            .annotate(key=Lower(field))
+            .values("key")
+            .annotate(n=models.Count("id"))
+            .filter(n__gt=1)
+            .values_list("key", flat=True)
+        )
+        clashes += [f"{field} {key!r}" for key in rows[:20]]
+    if clashes:
+        raise RuntimeError(
+            "Users differ only by letter case; resolve before migrating: "
+            + ", ".join(clashes)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0007_add_unique_email"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("username"),
+                name="uniq_user_username_ci",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="uniq_user_email_ci",
+            ),
+        ),
+    ]
@@ -5,6 +5,24 @@ import uuid
 from apps.core.roles import UserRole
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Lower
+from django.db.models.lookups import Exact
+
+
+def username_iexact(value: str) -> Exact:
+    """Filter matching `value` against usernames, ignoring case.
+
+    Compiles to ``LOWER(username) = LOWER(value)``, which the functional
+    unique index answers; ``username__iexact`` compiles to ``UPPER()`` on
+    PostgreSQL and cannot use it.
+    """
+    return Exact(Lower("username"), Lower(Value(value)))
+
+
+def email_iexact(value: str) -> Exact:
+    """Filter matching `value` against emails, ignoring case (see above)."""
+    return Exact(Lower("email"), Lower(Value(value)))
 
 
 def user_avatar_path(instance, filename):
@@ -61,6 +79,12 @@ class User(AbstractUser):
             models.Index(fields=["role", "tenant"]),
             models.Index(fields=["email"]),
         ]
+        constraints = [
+            # Logins are case-insensitive; these also serve as the lookup
+            # indexes for `username_iexact` / `email_iexact`.
+            models.UniqueConstraint(Lower("username"), name="uniq_user_username_ci"),
+            models.UniqueConstraint(Lower("email"), name="uniq_user_email_ci"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.username} ({self.get_role_display()})"
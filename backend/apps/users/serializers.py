@@ -5,10 +5,39 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
-from .models import User
+from .models import User, email_iexact, username_iexact
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UniqueLoginMixin:
+    """Reject a username or email another user holds in any letter case.
+
+    The validators DRF derives from the model's unique fields compare case
+    sensitively, so case variants would only fail on the ``LOWER()`` unique
+    indexes, as an IntegrityError.
+    """
+
+    def _unique(self, condition, value, message):
+        others = User.objects.filter(condition)
+        if self.instance is not None:
+            others = others.exclude(pk=self.instance.pk)
+        if others.exists():
+            raise serializers.ValidationError(message)
+        return value
+
+    def validate_username(self, value):
+        return self._unique(
+            username_iexact(value), value, "This username is already taken."
+        )
+
+    def validate_email(self, value):
+        if not value:
+            return value
+        return self._unique(
+            email_iexact(value), value, "This email is already registered."
+        )
+
+
+class UserSerializer(UniqueLoginMixin, serializers.ModelSerializer):
     """Serializer for user profile data."""
 
     tenant_name = serializers.CharField(source="tenant.name", read_only=True)
@@ -113,13 +142,13 @@ class RegisterSerializer(serializers.ModelSerializer):
             )
 
         # Check for duplicate username
-        if User.objects.filter(username=attrs["username"]).exists():
+        if User.objects.filter(username_iexact(attrs["username"])).exists():
             raise serializers.ValidationError(
                 {"username": "This username is already taken."}
             )
 
         # Check for duplicate email
-        if User.objects.filter(email=attrs["email"]).exists():
+        if User.objects.filter(email_iexact(attrs["email"])).exists():
             raise serializers.ValidationError(
                 {"email": "This email is already registered."}
             )
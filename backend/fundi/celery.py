@@ -0,0 +1,15 @@
+"""Celery application for background jobs (see apps.core.services.jobs).
+
+Start a worker with ``celery -A fundi worker -l info`` when
+``CELERY_BROKER_URL`` is configured; otherwise run ``manage.py run_jobs``.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "fundi.settings")
+
+app = Celery("fundi")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
@@ -156,6 +156,21 @@ else:
         }
     }
 
+# Background jobs (apps.core.services.jobs). With a broker configured jobs go
+# to Celery; otherwise they wait in the database for `manage.py run_jobs`.
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "")
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+JOBS_BACKEND = os.getenv("JOBS_BACKEND", "celery" if CELERY_BROKER_URL else "db")
+# Seconds a job may stay running before it is presumed dead and marked failed.
+JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", str(60 * 60)))
+JOB_HANDLERS = {
+    "users.import": "apps.core.services.job_handlers.import_users",
+    "stats.rebuild": "apps.core.services.job_handlers.rebuild_stats",
+    "enrollments.promote": "apps.core.services.job_handlers.promote_enrollments",
+    "export": "apps.api.jobs.run_export",
+}
+
 # Static files
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
@@ -225,6 +240,8 @@ CORS_ALLOW_HEADERS = list(default_headers) + [
     "baggage",
     "sentry-trace",
 ]
+# Let the SPA read response-cache metadata (see apps.api.utils.cache).
+CORS_EXPOSE_HEADERS = ["X-Cache", "X-Cache-Age"]
 
 # CSRF Trusted Origins (Required for Django admin in production with HTTPS)
 # This prevents "Bad Request (400)" errors when accessing /admin/
@@ -235,7 +252,7 @@ CSRF_TRUSTED_ORIGINS = os.getenv(
 # DRF + JWT
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_THROTTLE_CLASSES": [
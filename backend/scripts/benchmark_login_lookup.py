@@ -0,0 +1,113 @@
+"""
+Benchmark the login lookup used by EmailBackend against a large user table.
+
+This script:
+- Seeds synthetic users (``bench_login_*``; 1,000,000 by default) sharing
+  one pre-hashed password, so seeding does not pay for hashing
+- Prints the query plan of the old ``__iexact`` lookup and the new
+  ``LOWER()`` lookup backed by the functional unique indexes
+- Times both lookups and a full ``authenticate()`` call
+- Deletes the synthetic users unless BENCH_KEEP=1, with one raw DELETE so
+  no signal handlers run (see `cleanup`)
+
+Run against PostgreSQL with:
+    BENCH_USERS=1000000 python manage.py shell < scripts/benchmark_login_lookup.py
+"""
+
+import os
+import time
+
+from apps.users.models import email_iexact, username_iexact
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.db.models import Q
+
+User = get_user_model()
+
+PREFIX = "bench_login_"
+TOTAL = int(os.getenv("BENCH_USERS", "1000000"))
+BATCH = 10_000
+ROUNDS = 200
+PASSWORD = "Bench1234!"
+
+
+def seed():
+    existing = User.objects.filter(username__startswith=PREFIX).count()
+    hashed = make_password(PASSWORD)
+    for start in range(existing, TOTAL, BATCH):
+        User.objects.bulk_create(
+            [
+                User(
+                    username=f"{PREFIX}{i}",
+                    email=f"{PREFIX}{i}@bench.local",
+                    password=hashed,
+                )
+                for i in range(start, min(start + BATCH, TOTAL))
+            ],
+            batch_size=BATCH,
+        )
+    print(f"📌 {TOTAL:,} benchmark users in place")
+
+
+def cleanup():
+    """Delete the synthetic users; returns the number of rows removed.
+
+    They were seeded with ``bulk_create``, so the rollup, counter and
+    principal signals never saw them. An ORM ``.delete()`` would fire those
+    handlers' post_delete side and decrement aggregates for rows they never
+    counted. Nothing references the rows, so one raw DELETE is enough.
+    """
+    ids, params = (
+        User.objects.filter(username__startswith=PREFIX)
+        .values("pk")
+        .query.sql_with_params()
+    )
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {qn(User._meta.db_table)} "
+            f"WHERE {qn(User._meta.pk.column)} IN ({ids})",
+            params,
+        )
+        return cursor.rowcount
+
+
+def timed(label, fn):
+    t0 = time.perf_counter()
+    for i in range(ROUNDS):
+        fn(f"{PREFIX.upper()}{(i * 7919) % TOTAL}")
+    per_call = (time.perf_counter() - t0) * 1000 / ROUNDS
+    print(f"⏱  {label}: {per_call:.2f} ms per lookup")
+
+
+def run():
+    seed()
+    probe = f"{PREFIX.upper()}{TOTAL // 2}"
+    old = User.objects.filter(Q(username__iexact=probe) | Q(email__iexact=probe))
+    new = User.objects.filter(username_iexact(probe) | email_iexact(probe))
+    print("\n-- old plan --\n" + old.explain())
+    print("\n-- new plan --\n" + new.explain() + "\n")
+
+    timed(
+        "old __iexact lookup",
+        lambda v: list(
+            User.objects.filter(Q(username__iexact=v) | Q(email__iexact=v))[:2]
+        ),
+    )
+    timed(
+        "new LOWER() lookup",
+        lambda v: list(User.objects.filter(username_iexact(v) | email_iexact(v))[:2]),
+    )
+    t0 = time.perf_counter()
+    assert authenticate(None, username=probe, password=PASSWORD) is not None
+    print(
+        f"⏱  authenticate(): {(time.perf_counter() - t0) * 1000:.2f} ms (incl. hashing)"
+    )
+
+    if os.getenv("BENCH_KEEP") != "1":
+        deleted = cleanup()
+        print(f"✅ Removed {deleted:,} benchmark rows")
+
+
+run()
@@ -0,0 +1,63 @@
+"""Shared builders for the test suite.
+
+Each builder creates one row (or a numbered run of rows) with the defaults
+the tests rely on; keyword arguments are passed through to the model, so a
+test only spells out what it is about.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from apps.core.models import (
+    Course,
+    CourseLevel,
+    Learner,
+    LearnerCourseEnrollment,
+    Module,
+)
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+PASSWORD = "Test1234!"
+
+
+def make_user(role="learner", username=None, **kw):
+    """A user with a unique username, a matching email and `PASSWORD`."""
+    uname = username or f"u_{uuid.uuid4().hex[:8]}"
+    kw.setdefault("email", f"{uname}@x.com")
+    return User.objects.create_user(username=uname, password=PASSWORD, role=role, **kw)
+
+
+def make_course(name="Robotics", **kw) -> Course:
+    return Course.objects.create(name=name, **kw)
+
+
+def make_modules(course, count, **kw) -> list[Module]:
+    """`count` modules named M0, M1, ... on `course`."""
+    return [
+        Module.objects.create(name=f"M{i}", course=course, **kw) for i in range(count)
+    ]
+
+
+def make_levels(course, count, **kw) -> list[CourseLevel]:
+    """Levels 1..`count` (named L1, L2, ...) of `course`, sharing `kw`."""
+    return [
+        CourseLevel.objects.create(
+            course=course, level_number=i + 1, name=f"L{i + 1}", **kw
+        )
+        for i in range(count)
+    ]
+
+
+def make_learner(school, first_name="Ada", last_name="L", **kw) -> Learner:
+    return Learner.objects.create(
+        first_name=first_name, last_name=last_name, tenant=school, **kw
+    )
+
+
+def enroll(learner, course, level=None, **kw) -> LearnerCourseEnrollment:
+    """Enroll `learner` in `course`, at `level` when given."""
+    return LearnerCourseEnrollment.objects.create(
+        learner=learner, course=course, current_level=level, **kw
+    )
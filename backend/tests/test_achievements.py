@@ -0,0 +1,97 @@
+"""Tests for automatic level/course completion achievements.
+
+Run with:
+    python manage.py test tests.test_achievements
+"""
+
+from __future__ import annotations
+
+import io
+from datetime import timedelta
+
+from apps.core.models import (
+    Achievement,
+    LearnerLevelProgress,
+    School,
+)
+from apps.core.services import promotion
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import enroll, make_course, make_learner, make_levels, make_user
+
+API = "/api"
+MET = {"modules_completed": 4, "artifacts_submitted": 6, "assessment_score": 80}
+
+
+class AchievementAwardTests(TestCase):
+
+    def setUp(self):
+        self.school = School.objects.create(name="Award School", code="AW-1")
+        self.course = make_course()
+        self.levels = make_levels(self.course, 2)
+        self.user = make_user("learner", tenant=self.school)
+        self.learner = make_learner(self.school, user=self.user)
+        self.enrollment = enroll(self.learner, self.course, self.levels[0])
+
+    def _awards(self):
+        return sorted(self.learner.achievements.values_list("achievement_type", "name"))
+
+    def test_promotion_awards_each_level_and_the_course_once(self):
+        for level in self.levels:
+            LearnerLevelProgress.objects.create(
+                enrollment=self.enrollment, level=level, **MET
+            )
+        result = promotion.promote(self.enrollment)
+        self.assertTrue(result.course_completed)
+        self.assertEqual(
+            self._awards(),
+            [
+                ("course_complete", "Robotics"),
+                ("level_complete", "L1"),
+                ("level_complete", "L2"),
+            ],
+        )
+        # Repeat runs (and the backfill) never duplicate awards.
+        self.assertIsNone(promotion.promote(self.enrollment))
+        call_command("award_achievements", stdout=io.StringIO())
+        self.assertEqual(Achievement.objects.count(), 3)
+
+    def test_backfill_uses_original_completion_times(self):
+        done = timezone.now() - timedelta(days=30)
+        LearnerLevelProgress.objects.create(
+            enrollment=self.enrollment,
+            level=self.levels[0],
+            completed=True,
+            completed_at=done,
+            **MET,
+        )
+        out = io.StringIO()
+        call_command("award_achievements", school=str(self.school.pk), stdout=out)
+        self.assertIn("Checked 1 completion(s)", out.getvalue())
+        award = self.learner.achievements.get()
+        self.assertEqual(
+            (award.level_id, award.course_id, award.earned_at),
+            (self.levels[0].pk, self.course.pk, done),
+        )
+
+    def test_learner_dashboard_reads_badges_from_achievements(self):
+        Achievement.objects.create(
+            learner=self.learner, name="Helper", achievement_type="participation"
+        )
+        row = LearnerLevelProgress.objects.create(
+            enrollment=self.enrollment, level=self.levels[0]
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            row.update_progress(modules=4, artifacts=6, score=90)
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        r = client.get(f"{API}/learners/{self.learner.pk}/dashboard/")
+        self.assertEqual(r.status_code, 200, r.content)
+        badges = {b["name"]: b for b in r.data["badges"]}
+        self.assertEqual(set(badges), {"Helper", "L1"})
+        self.assertEqual(badges["L1"]["course"], "Robotics")
+        self.assertEqual(badges["Helper"]["icon"], "award")
@@ -0,0 +1,207 @@
+"""Tests for the admin monitor endpoints (keyset pagination, summaries).
+
+Run with:
+    python manage.py test tests.test_admin_monitor
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, timedelta
+
+from apps.api.utils.pagination import encode_cursor
+from apps.core.models import Attendance, Module, School, Session, TeacherTask
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from tests.factories import make_learner, make_user
+
+API = "/api"
+
+
+class MonitorFixtureMixin:
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=make_user("admin"))
+        self.school = School.objects.create(name="Monitor School", code="MS-1")
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.other_teacher = make_user("teacher", tenant=self.school)
+        self.module = Module.objects.create(name="Electronics")
+        self.learner = make_learner(self.school, "A", "B")
+        self.base = date(2025, 3, 3)
+
+    def _sessions(self, n, teacher=None, **kw):
+        out = []
+        for i in range(n):
+            out.append(
+                Session.objects.create(
+                    tenant=self.school,
+                    teacher=teacher or self.teacher,
+                    module=self.module,
+                    # Several sessions share a date so the tie-breakers matter.
+                    date=self.base + timedelta(days=i // 3),
+                    **kw,
+                )
+            )
+        return out
+
+
+class KeysetPaginationTests(MonitorFixtureMixin, TestCase):
+
+    def _walk(self, url, page_size, **filters):
+        ids, cursor, pages = [], None, 0
+        while True:
+            params = {"page_size": page_size, **filters}
+            if cursor:
+                params["cursor"] = cursor
+            r = self.client.get(url, params)
+            self.assertEqual(r.status_code, 200)
+            ids.extend(row["id"] for row in r.data["results"])
+            pages += 1
+            cursor = r.data["next_cursor"]
+            if not cursor:
+                return ids, pages
+
+    def test_sessions_walk_visits_every_row_once_in_order(self):
+        sessions = self._sessions(11)
+        ids, pages = self._walk(f"{API}/admin/monitor/sessions/", 4)
+        self.assertEqual(pages, 3)
+        expected = sorted(
+            sessions, key=lambda s: (s.date, s.created_at, str(s.id)), reverse=True
+        )
+        self.assertEqual(ids, [str(s.id) for s in expected])
+
+    def test_attendance_and_tasks_walk(self):
+        for session in self._sessions(5):
+            Attendance.objects.create(session=session, learner=self.learner)
+        for i in range(5):
+            TeacherTask.objects.create(teacher=self.teacher, title=f"T{i}")
+
+        ids, _ = self._walk(f"{API}/admin/monitor/attendance/", 2)
+        self.assertEqual(len(set(ids)), 5)
+        ids, _ = self._walk(f"{API}/admin/monitor/tasks/", 2)
+        self.assertEqual(len(set(ids)), 5)
+
+    def test_filters_apply_across_pages(self):
+        self._sessions(4)
+        self._sessions(3, teacher=self.other_teacher)
+        ids, _ = self._walk(
+            f"{API}/admin/monitor/sessions/", 2, teacher=self.other_teacher.id
+        )
+        self.assertEqual(len(ids), 3)
+
+    def test_deep_page_query_count_is_constant(self):
+        self._sessions(12)
+        r = self.client.get(f"{API}/admin/monitor/sessions/", {"page_size": 2})
+        with self.assertNumQueries(1):
+            self.client.get(f"{API}/admin/monitor/sessions/", {"page_size": 2})
+        cursor = r.data["next_cursor"]
+        for _ in range(4):
+            r = self.client.get(
+                f"{API}/admin/monitor/sessions/", {"page_size": 2, "cursor": cursor}
+            )
+            cursor = r.data["next_cursor"]
+        with self.assertNumQueries(1):
+            self.client.get(
+                f"{API}/admin/monitor/sessions/", {"page_size": 2, "cursor": cursor}
+            )
+
+    def test_totals_are_opt_in(self):
+        self._sessions(3)
+        r = self.client.get(f"{API}/admin/monitor/sessions/")
+        self.assertNotIn("total", r.data)
+        r = self.client.get(f"{API}/admin/monitor/sessions/?total=exact")
+        self.assertEqual((r.data["total"], r.data["total_is_estimate"]), (3, False))
+        r = self.client.get(f"{API}/admin/monitor/sessions/?total=estimate")
+        self.assertEqual(r.data["total"], 3)  # exact fallback off PostgreSQL
+
+    def test_invalid_cursor_is_rejected(self):
+        r = self.client.get(f"{API}/admin/monitor/sessions/?cursor=not-a-cursor")
+        self.assertEqual(r.status_code, 400)
+        # Decodes, but the values do not fit the ordering columns.
+        for values in (
+            ["2026-13-45", "2026-01-01T00:00:00+00:00", str(uuid.uuid4())],
+            ["2026-01-01", "2026-01-01T00:00:00+00:00", "not-a-uuid"],
+        ):
+            r = self.client.get(
+                f"{API}/admin/monitor/sessions/", {"cursor": encode_cursor(values)}
+            )
+            self.assertEqual(r.status_code, 400, r.content)
+
+
+class MonitorSummaryTests(MonitorFixtureMixin, TestCase):
+
+    def test_session_summary_single_query_honors_filters(self):
+        self._sessions(3, status="completed")
+        self._sessions(2, teacher=self.other_teacher)
+        with self.assertNumQueries(1):
+            r = self.client.get(f"{API}/admin/monitor/sessions/summary/")
+        self.assertEqual(r.data["total"], 5)
+        self.assertEqual(r.data["by_status"]["completed"], 3)
+        self.assertEqual(r.data["by_status"]["scheduled"], 2)
+        self.assertEqual(r.data["attendance_pending"], 3)
+
+        r = self.client.get(
+            f"{API}/admin/monitor/sessions/summary/",
+            {"teacher": self.other_teacher.id},
+        )
+        self.assertEqual(r.data["total"], 2)
+        self.assertEqual(r.data["by_status"]["completed"], 0)
+
+        r = self.client.get(
+            f"{API}/admin/monitor/sessions/summary/",
+            {"date_from": str(self.base + timedelta(days=1))},
+        )
+        self.assertEqual(r.data["total"], 0)
+
+    def test_task_summary(self):
+        TeacherTask.objects.create(teacher=self.teacher, title="a", priority="urgent")
+        TeacherTask.objects.create(
+            teacher=self.teacher,
+            title="b",
+            status="done",
+            due_date=date(2020, 1, 1),
+        )
+        TeacherTask.objects.create(
+            teacher=self.other_teacher, title="c", due_date=date(2020, 1, 1)
+        )
+        with self.assertNumQueries(1):
+            r = self.client.get(f"{API}/admin/monitor/tasks/summary/")
+        self.assertEqual(r.data["total"], 3)
+        self.assertEqual(r.data["by_status"], {"todo": 2, "in_progress": 0, "done": 1})
+        self.assertEqual(r.data["by_priority"]["urgent"], 1)
+        self.assertEqual(r.data["overdue"], 1)
+
+        r = self.client.get(
+            f"{API}/admin/monitor/tasks/summary/", {"teacher": self.teacher.id}
+        )
+        self.assertEqual((r.data["total"], r.data["overdue"]), (2, 0))
+
+    def test_attendance_summary(self):
+        s1, s2 = self._sessions(2)
+        other = make_learner(self.school, "C", "D")
+        Attendance.objects.create(session=s1, learner=self.learner, status="present")
+        Attendance.objects.create(session=s1, learner=other, status="absent")
+        Attendance.objects.create(session=s2, learner=self.learner, status="present")
+        with self.assertNumQueries(1):
+            r = self.client.get(f"{API}/admin/monitor/attendance/summary/")
+        self.assertEqual(r.data["total"], 3)
+        self.assertEqual(r.data["by_status"], {"present": 2, "absent": 1, "late": 0})
+        self.assertEqual(r.data["overall_attendance_rate"], 66.7)
+
+        r = self.client.get(
+            f"{API}/admin/monitor/attendance/summary/", {"learner": other.id}
+        )
+        self.assertEqual((r.data["total"], r.data["overall_attendance_rate"]), (1, 0))
+
+    def test_summary_cache_is_keyed_by_filter_set(self):
+        self._sessions(2)
+        url = f"{API}/admin/monitor/tasks/summary/"
+        self.assertEqual(self.client.get(url)["X-Cache"], "MISS")
+        r = self.client.get(url, {"cursor": "x", "page_size": 5})
+        self.assertEqual(r["X-Cache"], "HIT")
+        r = self.client.get(url, {"teacher": self.teacher.id})
+        self.assertEqual(r["X-Cache"], "MISS")
@@ -0,0 +1,240 @@
+"""Tests for the rollups and cached counters behind the admin analytics views.
+
+Run with:
+    python manage.py test tests.test_analytics_rollups
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+
+from apps.core.models import (
+    Attendance,
+    DailySchoolStats,
+    Learner,
+    Module,
+    School,
+    Session,
+)
+from apps.core.services import counters, rollups
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import enroll, make_course, make_learner, make_user
+
+API = "/api"
+
+
+def snapshot():
+    return {
+        (row.school_id, row.date): {f: getattr(row, f) for f in rollups.ROLLUP_FIELDS}
+        for row in DailySchoolStats.objects.all()
+        if any(getattr(row, f) for f in rollups.ROLLUP_FIELDS)
+    }
+
+
+class DailyStatsSignalTests(TransactionTestCase):
+    # Rollup writes run in transaction.on_commit, so real commits are needed.
+
+    def setUp(self):
+        self.school = School.objects.create(name="Rollup School", code="RS-1")
+        self.teacher = make_user(role="teacher", tenant=self.school)
+        self.module = Module.objects.create(name="Robotics 101")
+        self.today = timezone.localdate()
+        self.learners = [make_learner(self.school, f"L{i}", "X") for i in range(3)]
+
+    def _session(self, **kw):
+        defaults = {
+            "tenant": self.school,
+            "teacher": self.teacher,
+            "module": self.module,
+            "date": self.today,
+        }
+        defaults.update(kw)
+        return Session.objects.create(**defaults)
+
+    def _row(self, day=None, school="default"):
+        school = self.school if school == "default" else school
+        return DailySchoolStats.objects.get(school=school, date=day or self.today)
+
+    def test_user_and_session_creation_increment_buckets(self):
+        self._session()
+        row = self._row()
+        self.assertEqual(row.new_users, 1)
+        self.assertEqual(row.sessions_total, 1)
+        self.assertEqual(row.sessions_created, 1)
+        self.assertEqual(row.sessions_scheduled, 1)
+
+    def test_status_change_moves_between_counters(self):
+        session = self._session()
+        session.status = "completed"
+        session.save()
+        row = self._row()
+        self.assertEqual(row.sessions_scheduled, 0)
+        self.assertEqual(row.sessions_completed, 1)
+        self.assertEqual(row.sessions_total, 1)
+
+    def test_attendance_updates_and_session_date_move(self):
+        session = self._session()
+        for learner, st in zip(self.learners, ["present", "present", "absent"]):
+            Attendance.objects.create(session=session, learner=learner, status=st)
+        row = self._row()
+        self.assertEqual((row.attendance_total, row.attendance_present), (3, 2))
+
+        Attendance.objects.update_or_create(
+            session=session, learner=self.learners[2], defaults={"status": "late"}
+        )
+        row = self._row()
+        self.assertEqual((row.attendance_absent, row.attendance_late), (0, 1))
+
+        moved_to = self.today - timedelta(days=3)
+        session.date = moved_to
+        session.save()
+        self.assertEqual(self._row().attendance_total, 0)
+        self.assertEqual(self._row(moved_to).attendance_total, 3)
+        self.assertEqual(self._row(moved_to).sessions_total, 1)
+
+    def test_delete_cascade_decrements(self):
+        session = self._session()
+        Attendance.objects.create(session=session, learner=self.learners[0])
+        session.delete()
+        row = self._row()
+        self.assertEqual((row.sessions_total, row.attendance_total), (0, 0))
+
+    def test_login_timestamp_save_is_ignored(self):
+        self.teacher.last_login = timezone.now()
+        with self.assertNumQueries(1):
+            self.teacher.save(update_fields=["last_login"])
+
+    def test_reconcile_matches_signal_maintained_state(self):
+        session = self._session(date=self.today - timedelta(days=1))
+        Attendance.objects.create(session=session, learner=self.learners[0])
+        make_user(role="parent")
+        expected = snapshot()
+
+        DailySchoolStats.objects.all().delete()
+        call_command("reconcile_daily_stats", "--all", stdout=StringIO())
+        self.assertEqual(snapshot(), expected)
+
+
+class AnalyticsDashboardRollupTests(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.admin = make_user(role="admin")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+        school = School.objects.create(name="Dash School", code="DS-1")
+        teacher = make_user(role="teacher", tenant=school)
+        module = Module.objects.create(name="Coding")
+        learner = make_learner(school, "A", "B")
+        session = Session.objects.create(
+            tenant=school,
+            teacher=teacher,
+            module=module,
+            date=timezone.localdate(),
+            status="completed",
+        )
+        Attendance.objects.create(session=session, learner=learner, status="present")
+
+    def test_dashboard_reads_rollups(self):
+        r = self.client.get(f"{API}/admin/analytics/dashboard/?days=7")
+        self.assertEqual(r.status_code, 200)
+        kpis = r.data["kpis"]
+        self.assertEqual(kpis["total_users"], 2)
+        self.assertEqual(kpis["total_sessions"], 1)
+        self.assertEqual(kpis["completed_sessions"], 1)
+        self.assertEqual(kpis["attendance_rate"], 100.0)
+        self.assertEqual(len(r.data["session_trend"]), 8)
+        self.assertEqual(r.data["session_trend"][-1]["completed"], 1)
+        self.assertEqual(
+            r.data["school_performance"],
+            [{"school": "Dash School", "learners": 1, "sessions": 1}],
+        )
+
+    def test_dashboard_query_count_independent_of_window(self):
+        with self.assertNumQueries(12) as small:
+            self.client.get(f"{API}/admin/analytics/dashboard/?days=7")
+        with self.assertNumQueries(len(small.captured_queries)):
+            self.client.get(f"{API}/admin/analytics/dashboard/?days=365")
+
+    def test_users_series_is_gap_filled_and_clamped(self):
+        r = self.client.get(f"{API}/admin/analytics/users/?days=5000")
+        self.assertEqual(r.status_code, 200)
+        series = r.data["registrations_over_time"]
+        self.assertEqual(len(series), 366)
+        self.assertEqual(series[-1]["count"], 2)
+        self.assertEqual(sum(p["count"] for p in series), 2)
+
+        r = self.client.get(f"{API}/admin/analytics/users/?days=abc")
+        self.assertEqual(len(r.data["registrations_over_time"]), 31)
+
+    def test_enrollment_series(self):
+        enroll(Learner.objects.get(), make_course("Course A"))
+        r = self.client.get(f"{API}/admin/analytics/enrollments/?days=3")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.data["total_enrollments"], 1)
+        series = r.data["enrollments_over_time"]
+        self.assertEqual([p["count"] for p in series], [0, 0, 0, 1])
+
+    def test_series_query_count_independent_of_window(self):
+        for endpoint in ("users", "enrollments"):
+            with self.subTest(endpoint=endpoint):
+                with CaptureQueriesContext(connection) as small:
+                    self.client.get(f"{API}/admin/analytics/{endpoint}/?days=1")
+                with self.assertNumQueries(len(small.captured_queries)):
+                    self.client.get(f"{API}/admin/analytics/{endpoint}/?days=365")
+
+
+class OverviewCounterTests(TransactionTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.admin = make_user(role="admin")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_counters_follow_writes_without_db_reads(self):
+        self.assertEqual(counters.get_all()["users"], 1)
+        school = School.objects.create(name="Counter School", code="CS-1")
+        teacher = make_user(role="teacher", tenant=school)
+        make_learner(school, "A", "B")
+
+        with self.assertNumQueries(0):
+            values = counters.get_all()
+        self.assertEqual(values["users"], 2)
+        self.assertEqual(values["teachers"], 1)
+        self.assertEqual(values["schools"], 1)
+        self.assertEqual(values["learners"], 1)
+
+        teacher.is_active = False
+        teacher.save(update_fields=["is_active"])
+        teacher.role = "parent"
+        teacher.save()
+        values = counters.get_all()
+        self.assertEqual(values["users_active"], 1)
+        self.assertEqual((values["teachers"], values["parents"]), (0, 1))
+
+        school.delete()  # cascades to the learner and the user's tenant FK
+        values = counters.get_all()
+        self.assertEqual((values["schools"], values["learners"]), (0, 0))
+        self.assertEqual(values, counters.compute())
+
+    def test_cold_cache_reconciles(self):
+        make_user(role="parent")
+        cache.delete(f"{counters.KEY_PREFIX}parents")
+        self.assertEqual(counters.get_all()["parents"], 1)
+
+    def test_overview_endpoint_reads_counters(self):
+        self.client.get(f"{API}/admin/analytics/overview/")  # warm
+        with self.assertNumQueries(0):
+            r = self.client.get(f"{API}/admin/analytics/overview/")
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.data["users"]["total"], 1)
+        self.assertEqual(r.data["users"]["new_last_7_days"], 1)
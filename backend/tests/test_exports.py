@@ -0,0 +1,110 @@
+"""Tests for the streaming CSV/NDJSON admin exports.
+
+Run with:
+    python manage.py test tests.test_exports
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import date
+
+from apps.core.models import (
+    Artifact,
+    Attendance,
+    Module,
+    School,
+    Session,
+)
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from tests.factories import enroll, make_course, make_learner, make_user
+
+API = "/api"
+
+
+class StreamingExportTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=make_user("admin"))
+        self.school = School.objects.create(name="Export School", code="EX-1")
+        self.teacher = make_user("teacher", tenant=self.school, first_name="Tia")
+        module = Module.objects.create(name="Drones")
+        self.learner = make_learner(self.school)
+        self.session = Session.objects.create(
+            tenant=self.school, teacher=self.teacher, module=module, date=date.today()
+        )
+        Attendance.objects.create(session=self.session, learner=self.learner)
+        enroll(self.learner, make_course("Aerospace"))
+        Artifact.objects.create(
+            tenant=self.school, learner=self.learner, title="Wing", module=module
+        )
+
+    def _get(self, url, **params):
+        r = self.client.get(url, params)
+        self.assertEqual(r.status_code, 200, getattr(r, "data", None))
+        self.assertTrue(r.streaming)
+        return r, b"".join(r.streaming_content).decode()
+
+    def test_users_csv_keeps_legacy_columns(self):
+        r, body = self._get(f"{API}/admin/users/export/", role="teacher")
+        self.assertTrue(r["Content-Type"].startswith("text/csv"))
+        self.assertIn('filename="users_', r["Content-Disposition"])
+        rows = list(csv.reader(io.StringIO(body)))
+        self.assertEqual(rows[0][:3], ["ID", "Username", "Email"])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][6], "Export School")
+        self.assertEqual(rows[1][7], "Yes")
+
+    def test_users_ndjson(self):
+        r, body = self._get(f"{API}/admin/users/export/", export_format="ndjson")
+        self.assertEqual(r["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(records), 2)
+        teacher = next(rec for rec in records if rec["role"] == "teacher")
+        self.assertEqual(teacher["school"], "Export School")
+        self.assertIs(teacher["is_active"], True)
+
+    def test_every_dataset_exports(self):
+        for url, key, expected in (
+            (f"{API}/admin/monitor/sessions/export/", "module", "Drones"),
+            (f"{API}/admin/monitor/attendance/export/", "first_name", "Ada"),
+            (f"{API}/admin/exports/enrollments/", "course", "Aerospace"),
+            (f"{API}/admin/exports/artifacts/", "title", "Wing"),
+        ):
+            with self.subTest(url=url):
+                _, body = self._get(url, export_format="ndjson")
+                records = [json.loads(line) for line in body.splitlines()]
+                self.assertEqual([rec[key] for rec in records], [expected])
+                _, body = self._get(url)
+                self.assertEqual(len(list(csv.reader(io.StringIO(body)))), 2)
+
+    def test_exports_honor_list_filters(self):
+        _, body = self._get(
+            f"{API}/admin/monitor/sessions/export/",
+            status="completed",
+            export_format="ndjson",
+        )
+        self.assertEqual(body, "")
+
+    def test_export_is_a_single_streamed_query(self):
+        for i in range(30):
+            make_user("parent")
+        r = self.client.get(f"{API}/admin/users/export/")
+        with self.assertNumQueries(1):
+            body = b"".join(r.streaming_content)
+        self.assertEqual(body.count(b"\n"), 33)
+
+    def test_unknown_format_is_rejected(self):
+        r = self.client.get(f"{API}/admin/users/export/", {"export_format": "xlsx"})
+        self.assertEqual(r.status_code, 400)
+
+    def test_non_admin_forbidden(self):
+        client = APIClient()
+        client.force_authenticate(user=self.teacher)
+        r = client.get(f"{API}/admin/exports/artifacts/")
+        self.assertEqual(r.status_code, 403)
@@ -0,0 +1,184 @@
+"""Tests for background jobs (apps.core.services.jobs, /api/admin/jobs/).
+
+Run with:
+    python manage.py test tests.test_jobs
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from apps.core.models import Job, School
+from apps.core.services import jobs
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import make_user
+
+User = get_user_model()
+API = "/api"
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def run_worker():
+    call_command("run_jobs", "--once", stdout=io.StringIO())
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, JOBS_BACKEND="db")
+class JobTests(TestCase):
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.admin = make_user("admin")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+        self.school = School.objects.create(name="Job School", code="JB-1")
+
+    def _job(self, job_id):
+        r = self.client.get(f"{API}/admin/jobs/{job_id}/")
+        self.assertEqual(r.status_code, 200)
+        return r.data
+
+    def test_async_bulk_import_runs_on_worker(self):
+        body = "username,email,role,school_id\n" + "".join(
+            f"j{i},j{i}@x.com,learner,{self.school.id}\n" for i in range(3)
+        )
+        r = self.client.post(
+            f"{API}/admin/users/bulk-import/",
+            {"file": SimpleUploadedFile("u.csv", body.encode()), "async": "true"},
+            format="multipart",
+        )
+        self.assertEqual(r.status_code, 202)
+        self.assertEqual(r.data["status"], "queued")
+        self.assertFalse(User.objects.filter(username="j0").exists())
+
+        run_worker()
+        job = self._job(r.data["id"])
+        self.assertEqual(job["status"], "succeeded", job["error"])
+        self.assertEqual(job["result"]["created"], 3)
+        self.assertEqual(job["progress"]["done"], 3)
+        self.assertEqual(User.objects.filter(username__startswith="j").count(), 3)
+
+    def test_async_export_writes_downloadable_file(self):
+        make_user("teacher", tenant=self.school)
+        r = self.client.get(
+            f"{API}/admin/users/export/", {"async": "1", "role": "teacher"}
+        )
+        self.assertEqual(r.status_code, 202)
+        self.assertEqual(r.data["params"]["filters"], {"role": "teacher"})
+
+        run_worker()
+        job = self._job(r.data["id"])
+        self.assertEqual(job["status"], "succeeded", job["error"])
+        self.assertEqual(job["result"]["rows"], 1)
+        self.assertTrue(job["download_url"].endswith("/download/"))
+
+        r = self.client.get(f"{API}/admin/jobs/{job['id']}/download/")
+        self.assertEqual(r.status_code, 200)
+        rows = list(csv.reader(io.StringIO(b"".join(r.streaming_content).decode())))
+        self.assertEqual(rows[0][:2], ["ID", "Username"])
+        self.assertEqual(len(rows), 2)
+
+    def test_enqueue_via_jobs_endpoint_and_list(self):
+        r = self.client.post(
+            f"{API}/admin/jobs/",
+            {"kind": "stats.rebuild", "params": {"days": 3}},
+            format="json",
+        )
+        self.assertEqual(r.status_code, 202)
+        run_worker()
+        job = self._job(r.data["id"])
+        self.assertEqual(job["status"], "succeeded")
+        self.assertEqual(job["progress"]["total"], 3)
+        self.assertIn("users", job["result"]["counters"])
+
+        r = self.client.get(f"{API}/admin/jobs/", {"status": "succeeded"})
+        self.assertEqual([j["id"] for j in r.data["results"]], [job["id"]])
+
+    def test_invalid_requests_are_rejected(self):
+        r = self.client.post(f"{API}/admin/jobs/", {"kind": "nope"}, format="json")
+        self.assertEqual(r.status_code, 400)
+        r = self.client.post(
+            f"{API}/admin/jobs/", {"kind": "export", "params": [1]}, format="json"
+        )
+        self.assertEqual(r.status_code, 400)
+
+    def test_handler_errors_mark_job_failed(self):
+        job = jobs.enqueue("export", {"dataset": "nope"})
+        with self.assertLogs("apps.core.services.jobs", "ERROR"):
+            run_worker()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertIn("Unknown export dataset", job.error)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_job_runs_at_most_once(self):
+        job = jobs.enqueue("stats.rebuild")
+        self.assertIsNotNone(jobs.run(job.pk))
+        self.assertIsNone(jobs.run(job.pk))
+
+    @override_settings(JOB_TIMEOUT=60)
+    def test_jobs_left_running_by_a_dead_worker_are_failed(self):
+        dead = jobs.enqueue("stats.rebuild")
+        alive = jobs.enqueue("stats.rebuild")
+        now = timezone.now()
+        Job.objects.filter(pk=dead.pk).update(
+            status=Job.Status.RUNNING, started_at=now - timedelta(seconds=61)
+        )
+        Job.objects.filter(pk=alive.pk).update(
+            status=Job.Status.RUNNING, started_at=now - timedelta(seconds=30)
+        )
+        with self.assertLogs("apps.core.services.jobs", "WARNING"):
+            run_worker()
+        dead.refresh_from_db()
+        alive.refresh_from_db()
+        self.assertEqual(dead.status, Job.Status.FAILED)
+        self.assertIn("Timed out", dead.error)
+        self.assertIsNotNone(dead.finished_at)
+        self.assertEqual(alive.status, Job.Status.RUNNING)
+
+    def test_cancel_only_queued_jobs(self):
+        job = jobs.enqueue("stats.rebuild")
+        r = self.client.post(f"{API}/admin/jobs/{job.pk}/cancel/")
+        self.assertEqual(r.data["status"], "cancelled")
+        run_worker()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.CANCELLED)
+        r = self.client.post(f"{API}/admin/jobs/{job.pk}/cancel/")
+        self.assertEqual(r.status_code, 409)
+
+    @override_settings(JOBS_BACKEND="eager")
+    def test_eager_backend_runs_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = jobs.enqueue("stats.rebuild", {"days": 1})
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.SUCCEEDED)
+        self.assertEqual(job.worker, "eager")
+
+    @override_settings(JOBS_BACKEND="celery")
+    def test_celery_backend_publishes_task_on_commit(self):
+        with mock.patch("apps.core.tasks.run_job.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                job = jobs.enqueue("stats.rebuild")
+                delay.assert_not_called()
+        delay.assert_called_once_with(str(job.pk))
+
+    def test_non_admin_forbidden(self):
+        client = APIClient()
+        client.force_authenticate(user=make_user("teacher"))
+        self.assertEqual(client.get(f"{API}/admin/jobs/").status_code, 403)
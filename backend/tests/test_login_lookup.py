@@ -0,0 +1,107 @@
+"""Tests for case-insensitive login lookups (EmailBackend, user constraints).
+
+Run with:
+    python manage.py test tests.test_login_lookup
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth import authenticate, get_user_model
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+User = get_user_model()
+PASSWORD = "Test1234!"
+
+
+class LoginLookupTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="Ada.Lovelace", email="Ada@Example.com", password=PASSWORD
+        )
+
+    def test_login_ignores_case_with_one_indexed_query(self):
+        for login in ("ada.lovelace", "ADA@example.COM"):
+            with CaptureQueriesContext(connection) as ctx:
+                user = authenticate(None, username=login, password=PASSWORD)
+            self.assertEqual(user, self.user)
+            self.assertEqual(len(ctx.captured_queries), 1)
+            sql = ctx.captured_queries[0]["sql"]
+            self.assertIn("LOWER", sql)
+            self.assertNotIn("UPPER", sql)
+
+        self.assertIsNone(authenticate(None, username="ada", password=PASSWORD))
+        self.assertIsNone(authenticate(None, username="ada.lovelace", password="wrong"))
+
+        r = APIClient().post(
+            "/auth/token/", {"username": "ADA.LOVELACE", "password": PASSWORD}
+        )
+        self.assertEqual(r.status_code, 200, r.content)
+
+    def test_case_variants_are_rejected(self):
+        for kw in (
+            {"username": "ADA.LOVELACE", "email": "other@example.com"},
+            {"username": "someone", "email": "ada@example.com"},
+        ):
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                User.objects.create_user(password=PASSWORD, **kw)
+
+        r = APIClient().post(
+            "/auth/register/",
+            {
+                "username": "ada.LOVELACE",
+                "email": "new@example.com",
+                "password": "SecurePass123!",
+                "password_confirm": "SecurePass123!",
+                "first_name": "A",
+                "last_name": "L",
+            },
+        )
+        self.assertEqual(r.status_code, 400, r.content)
+
+    def test_user_serializers_reject_case_variants(self):
+        other = User.objects.create_user(
+            username="grace", email="grace@example.com", password=PASSWORD
+        )
+        client = APIClient()
+        client.force_authenticate(user=other)
+        for data in ({"username": "ADA.lovelace"}, {"email": "ada@EXAMPLE.com"}):
+            r = client.patch("/user/profile/", data, format="json")
+            self.assertEqual(r.status_code, 400, r.content)
+            self.assertEqual(list(r.data), list(data))
+        # A user's own login may change case.
+        r = client.patch("/user/profile/", {"username": "Grace"}, format="json")
+        self.assertEqual(r.status_code, 200, r.content)
+
+        admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password=PASSWORD, role="admin"
+        )
+        client.force_authenticate(user=admin)
+        r = client.post(
+            "/api/admin/users/",
+            {
+                "username": "Ada.LOVELACE",
+                "email": "ada2@example.com",
+                "password": "SecurePass123!",
+                "role": "parent",
+            },
+            format="json",
+        )
+        self.assertEqual(r.status_code, 400, r.content)
+        self.assertIn("username", r.data["error"]["details"])
+
+    def test_username_match_wins_over_another_users_email(self):
+        other = User.objects.create_user(
+            username="ada@example.com", email="x@example.com", password="Other123!"
+        )
+        self.assertEqual(
+            authenticate(None, username="ADA@example.com", password="Other123!"),
+            other,
+        )
+        # The email owner is not a candidate for that login.
+        self.assertIsNone(
+            authenticate(None, username="ada@example.com", password=PASSWORD)
+        )
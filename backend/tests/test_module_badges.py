@@ -0,0 +1,116 @@
+"""Tests for the maintained earned module badge set (module_badges).
+
+Run with:
+    python manage.py test tests.test_module_badges
+"""
+
+from __future__ import annotations
+
+import io
+from datetime import timedelta
+
+from apps.core.models import (
+    Attendance,
+    EarnedModuleBadge,
+    Module,
+    School,
+    Session,
+)
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import make_course, make_learner, make_user
+
+API = "/api"
+
+
+class ModuleBadgeTests(TestCase):
+
+    def setUp(self):
+        self.school = School.objects.create(name="Badge School", code="BS-1")
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.parent = make_user("parent")
+        course = make_course()
+        self.module = Module.objects.create(
+            name="Motors", course=course, badge_name="Motor Maker"
+        )
+        self.plain = Module.objects.create(name="Intro", course=course)
+        self.child = make_learner(self.school, parent=self.parent)
+
+    def _session(self, module=None, days_ago=0):
+        return Session.objects.create(
+            tenant=self.school,
+            teacher=self.teacher,
+            module=module or self.module,
+            date=timezone.localdate() - timedelta(days=days_ago),
+        )
+
+    def _complete(self, session):
+        session.status = "completed"
+        with self.captureOnCommitCallbacks(execute=True):
+            session.save()
+
+    def _attend(self, session, status="present"):
+        with self.captureOnCommitCallbacks(execute=True):
+            Attendance.objects.update_or_create(
+                session=session, learner=self.child, defaults={"status": status}
+            )
+
+    def _earned(self):
+        return list(
+            EarnedModuleBadge.objects.filter(learner=self.child).values_list(
+                "module_id", "earned_on"
+            )
+        )
+
+    def test_set_follows_attendance_and_session_completion(self):
+        later, earlier = self._session(days_ago=1), self._session(days_ago=5)
+        self._attend(later)
+        self.assertEqual(self._earned(), [])  # session not completed yet
+
+        self._complete(later)
+        self.assertEqual(self._earned(), [(self.module.pk, later.date)])
+
+        # A completed earlier session backdates the badge.
+        self._complete(earlier)
+        self._attend(earlier)
+        self.assertEqual(self._earned(), [(self.module.pk, earlier.date)])
+
+        self._attend(earlier, status="absent")
+        self._attend(later, status="late")
+        self.assertEqual(self._earned(), [])
+
+        self._attend(later)
+        with self.captureOnCommitCallbacks(execute=True):
+            later.delete()
+        self.assertEqual(self._earned(), [])
+
+    def test_parent_dashboard_reads_the_badge_set(self):
+        for module in (self.module, self.plain):
+            session = self._session(module)
+            self._attend(session)
+            self._complete(session)
+        self.assertEqual(len(self._earned()), 2)
+
+        client = APIClient()
+        client.force_authenticate(user=self.parent)
+        r = client.get(f"{API}/children/{self.child.pk}/dashboard/")
+        self.assertEqual(r.status_code, 200, r.content)
+        # Modules without a badge name do not show up as badges.
+        self.assertEqual(
+            [(b["id"], b["name"]) for b in r.data["badges"]],
+            [(str(self.module.pk), "Motor Maker")],
+        )
+
+    def test_rebuild_backfills(self):
+        session = self._session()
+        Attendance.objects.create(session=session, learner=self.child)
+        Session.objects.filter(pk=session.pk).update(status="completed")
+        self.assertEqual(self._earned(), [])
+
+        out = io.StringIO()
+        call_command("rebuild_module_badges", stdout=out)
+        self.assertIn("1 row(s) changed", out.getvalue())
+        self.assertEqual(self._earned(), [(self.module.pk, session.date)])
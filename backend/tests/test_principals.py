@@ -0,0 +1,115 @@
+"""Tests for cached JWT principals (CachedJWTAuthentication, principals).
+
+Run with:
+    python manage.py test tests.test_principals
+"""
+
+from __future__ import annotations
+
+
+from apps.core.models import School
+from apps.core.services import principals
+from django.contrib.auth.models import update_last_login
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.factories import PASSWORD, make_user
+
+API = "/api"
+
+
+class PrincipalCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.home = School.objects.create(name="Home School", code="PH-1")
+        self.other = School.objects.create(name="Other School", code="PH-2")
+        self.teacher = make_user("teacher", tenant=self.home)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teacher.teacher_schools.add(self.other)
+
+        r = APIClient().post(
+            "/auth/token/", {"username": self.teacher.username, "password": PASSWORD}
+        )
+        self.assertEqual(r.status_code, 200, r.content)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {r.data['access']}")
+
+    def _get(self, school=None):
+        return self.client.get(
+            f"{API}/teacher/quizzes/",
+            HTTP_X_SCHOOL_ID=str((school or self.other).id),
+        )
+
+    def _schools(self):
+        return principals.load(self.teacher.pk).cached_school_ids
+
+    def test_repeat_requests_skip_the_users_table(self):
+        self.assertEqual(self._get().status_code, 200)
+        with CaptureQueriesContext(connection) as ctx:
+            r = self._get()
+        self.assertEqual(r.status_code, 200, r.content)
+        tables = " ".join(q["sql"] for q in ctx.captured_queries)
+        self.assertNotIn('"users_user"', tables)
+        self.assertNotIn("users_user_teacher_schools", tables)
+
+        user = principals.load(self.teacher.pk)
+        self.assertEqual((user.pk, user.role), (self.teacher.pk, "teacher"))
+        self.assertEqual(
+            user.cached_school_ids, {str(self.home.id), str(self.other.id)}
+        )
+        # The password hash and last login time are deferred, not cached.
+        self.assertLessEqual({"password", "last_login"}, user.get_deferred_fields())
+
+    def test_logins_do_not_bump_the_principal(self):
+        version = principals._version(self.teacher.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            update_last_login(None, self.teacher)
+        self.assertEqual(principals._version(self.teacher.pk), version)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teacher.save(update_fields=["last_login", "first_name"])
+        self.assertNotEqual(principals._version(self.teacher.pk), version)
+
+    def test_user_changes_take_effect_immediately(self):
+        self.assertEqual(self._get().status_code, 200)
+
+        self.teacher.role = "parent"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teacher.save()
+        self.assertEqual(self._get().status_code, 403)
+
+        self.teacher.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teacher.save()
+        self.assertEqual(self._get().status_code, 401)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teacher.delete()
+        self.assertEqual(self._get().status_code, 401)
+
+    def test_teacher_school_changes_bump_the_principal(self):
+        self.assertIn(str(self.other.id), self._schools())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teacher.teacher_schools.remove(self.other)
+        self.assertEqual(self._schools(), {str(self.home.id)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.teachers.add(self.teacher)
+        self.assertIn(str(self.other.id), self._schools())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.teachers.clear()
+        self.assertEqual(self._schools(), {str(self.home.id)})
+
+    def test_saving_a_principal_user_keeps_uncached_columns(self):
+        user = principals.load(self.teacher.pk)
+        user.first_name = "Grace"
+        user.save()
+        self.teacher.refresh_from_db()
+        self.assertEqual(self.teacher.first_name, "Grace")
+        self.assertTrue(self.teacher.check_password(PASSWORD))
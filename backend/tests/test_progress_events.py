@@ -0,0 +1,221 @@
+"""Tests for progress counters derived from evidence (progress_events).
+
+Run with:
+    python manage.py test tests.test_progress_events
+"""
+
+from __future__ import annotations
+
+import io
+from unittest import mock
+
+from apps.core.models import (
+    Artifact,
+    Attendance,
+    LearnerLevelProgress,
+    Quiz,
+    QuizAttempt,
+    School,
+    Session,
+)
+from apps.core.services import progress_events
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import (
+    enroll,
+    make_course,
+    make_learner,
+    make_levels,
+    make_modules,
+    make_user,
+)
+
+API = "/api"
+
+
+class ProgressEventTests(TestCase):
+
+    def setUp(self):
+        self.school = School.objects.create(name="Evidence School", code="ES-1")
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.course = make_course()
+        self.modules = make_modules(self.course, 3)
+        self.level1, self.level2 = make_levels(
+            self.course,
+            2,
+            required_modules_count=1,
+            required_artifacts_count=1,
+            required_assessment_score=70,
+        )
+        self.level1.required_modules.set(self.modules[:2])
+        # Level 2 names no modules, so every course module counts toward it.
+        self.learner = make_learner(self.school)
+        self.enrollment = enroll(self.learner, self.course, self.level1)
+        self.row = LearnerLevelProgress.objects.create(
+            enrollment=self.enrollment, level=self.level1
+        )
+
+    def _artifact(self, module, status=Artifact.STATUS_APPROVED, **kw):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Artifact.objects.create(
+                tenant=self.school,
+                learner=self.learner,
+                module=module,
+                title="Build",
+                status=status,
+                **kw,
+            )
+
+    def _attend(self, module, status="present"):
+        session = Session.objects.create(
+            tenant=self.school,
+            teacher=self.teacher,
+            module=module,
+            date=timezone.localdate(),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            Attendance.objects.create(
+                session=session, learner=self.learner, status=status
+            )
+
+    def _attempt(self, module, score, completed=True):
+        quiz = Quiz.objects.create(
+            tenant=self.school, title="Q", module=module, created_by=self.teacher
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            return QuizAttempt.objects.create(
+                quiz=quiz,
+                learner=self.learner,
+                score=score,
+                completed_at=timezone.now() if completed else None,
+            )
+
+    def test_counters_follow_evidence(self):
+        self._artifact(self.modules[0], status=Artifact.STATUS_PENDING)
+        self._attend(self.modules[1], status="absent")
+        self._attempt(self.modules[0], 95, completed=False)
+        self._artifact(self.modules[2])  # not a level 1 module
+        self.row.refresh_from_db()
+        self.assertEqual(
+            (
+                self.row.artifacts_submitted,
+                self.row.modules_completed,
+                self.row.assessment_score,
+            ),
+            (0, 0, 0),
+        )
+
+        self._attend(self.modules[1])
+        self._attempt(self.modules[0], 60)
+        self._attempt(self.modules[0], 40)  # best score is kept
+        self.row.refresh_from_db()
+        self.assertEqual(self.row.completed_module_ids, [str(self.modules[1].id)])
+        self.assertEqual(self.row.modules_completed, 1)
+        self.assertEqual(self.row.assessment_score, 60)
+        self.enrollment.refresh_from_db()
+        self.assertEqual(self.enrollment.current_level, self.level1)
+        self.assertEqual(self.enrollment.average_score, 60)
+
+    def test_review_approval_promotes_and_carries_evidence(self):
+        self._attend(self.modules[0])
+        self._attempt(self.modules[0], 90)
+        artifact = self._artifact(
+            self.modules[1],
+            status=Artifact.STATUS_PENDING,
+            uploaded_by_student=True,
+        )
+
+        client = APIClient()
+        client.force_authenticate(user=self.teacher)
+        with self.captureOnCommitCallbacks(execute=True):
+            r = client.post(
+                f"{API}/teacher/quick-artifacts/{artifact.id}/review/",
+                {"action": "approve"},
+                format="json",
+                HTTP_X_SCHOOL_ID=str(self.school.id),
+            )
+        self.assertEqual(r.status_code, 200)
+
+        self.enrollment.refresh_from_db()
+        self.row.refresh_from_db()
+        self.assertTrue(self.row.completed)
+        self.assertEqual(self.row.artifacts_submitted, 1)
+        # Level 2 counts every course module, so the evidence already gathered
+        # satisfies it too and the course completes in one pass.
+        self.assertEqual(self.enrollment.current_level, self.level2)
+        self.assertIsNotNone(self.enrollment.completed_at)
+        level2 = self.enrollment.level_progress.get(level=self.level2)
+        self.assertEqual(level2.artifacts_submitted, 1)
+
+    def test_manual_entries_are_kept_until_reset(self):
+        self.row.update_progress(artifacts=5)
+        self._artifact(self.modules[0])
+        self.row.refresh_from_db()
+        self.assertEqual(self.row.artifacts_submitted, 5)
+
+        out = io.StringIO()
+        call_command("rebuild_progress_counters", stdout=out)
+        self.assertIn("0 progress row(s)", out.getvalue())
+
+        call_command("rebuild_progress_counters", reset=True, stdout=out)
+        self.row.refresh_from_db()
+        self.assertEqual(self.row.artifacts_submitted, 1)
+
+    def test_rebuild_backfills_rows_written_without_signals(self):
+        self._attend(self.modules[0])
+        Artifact.objects.bulk_create(
+            [
+                Artifact(
+                    tenant=self.school,
+                    learner=self.learner,
+                    module=self.modules[i % 2],
+                    title=f"A{i}",
+                )
+                for i in range(3)
+            ]
+        )
+        self.row.refresh_from_db()
+        self.assertEqual(self.row.artifacts_submitted, 0)
+
+        call_command(
+            "rebuild_progress_counters",
+            course=str(self.course.id),
+            stdout=io.StringIO(),
+        )
+        self.row.refresh_from_db()
+        self.assertEqual(
+            (self.row.artifacts_submitted, self.row.modules_completed), (3, 1)
+        )
+
+    def test_collected_events_are_applied_once(self):
+        learners = [self.learner] + [
+            make_learner(self.school, f"L{i}") for i in range(3)
+        ]
+        session = Session.objects.create(
+            tenant=self.school,
+            teacher=self.teacher,
+            module=self.modules[0],
+            date=timezone.localdate(),
+        )
+        apply = mock.Mock(wraps=progress_events.apply)
+        with mock.patch.object(progress_events, "apply", apply):
+            with self.captureOnCommitCallbacks(execute=True):
+                # A block that rolls back applies nothing.
+                with self.assertRaises(RuntimeError):
+                    with progress_events.collect():
+                        Attendance.objects.create(session=session, learner=learners[0])
+                        raise RuntimeError
+                with progress_events.collect():
+                    for learner in learners:
+                        Attendance.objects.create(session=session, learner=learner)
+
+        apply.assert_called_once()
+        self.assertEqual(
+            apply.call_args.args[0],
+            {(learner.id, self.modules[0].id) for learner in learners},
+        )
+        self.row.refresh_from_db()
+        self.assertEqual(self.row.completed_module_ids, [str(self.modules[0].id)])
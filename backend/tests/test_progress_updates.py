@@ -0,0 +1,169 @@
+"""Tests for class-wide progress updates (POST /api/progress/bulk-update/).
+
+Run with:
+    python manage.py test tests.test_progress_updates
+"""
+
+from __future__ import annotations
+
+
+from apps.core.models import (
+    LearnerLevelProgress,
+    School,
+)
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from tests.factories import (
+    enroll,
+    make_course,
+    make_learner,
+    make_levels,
+    make_modules,
+    make_user,
+)
+
+API = "/api"
+URL = f"{API}/progress/bulk-update/"
+
+
+class BulkProgressUpdateTests(TestCase):
+
+    def setUp(self):
+        self.school = School.objects.create(name="Class School", code="CS-1")
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.course = make_course()
+        self.course.teachers.add(self.teacher)
+        self.modules = make_modules(self.course, 3)
+        self.levels = make_levels(
+            self.course,
+            2,
+            required_modules_count=2,
+            required_artifacts_count=1,
+            required_assessment_score=50,
+        )
+        self.levels[0].required_modules.set(self.modules[:2])
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.teacher)
+
+    def _rows(self, n, course=None):
+        rows = []
+        for i in range(n):
+            learner = make_learner(self.school, f"L{i}", "X")
+            # Commit hooks maintain the teacher -> learner access table.
+            with self.captureOnCommitCallbacks(execute=True):
+                enrollment = enroll(
+                    learner,
+                    course or self.course,
+                    self.levels[0] if course is None else None,
+                )
+            rows.append(
+                LearnerLevelProgress.objects.create(
+                    enrollment=enrollment, level=self.levels[0]
+                )
+            )
+        return rows
+
+    def _passing(self, row):
+        return {
+            "id": str(row.id),
+            "completed_module_ids": [str(m.id) for m in self.modules[:2]],
+            "artifacts_submitted": 1,
+            "assessment_score": 80,
+        }
+
+    def test_updates_and_promotes_the_class(self):
+        rows = self._rows(3)
+        updates = [
+            self._passing(rows[0]),
+            self._passing(rows[1]),
+            {"id": str(rows[2].id), "artifacts_submitted": 4, "teacher_confirmed": 1},
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            r = self.client.post(URL, {"updates": updates}, format="json")
+        self.assertEqual(r.status_code, 200, r.content)
+        self.assertEqual(r.data["updated"], 3)
+        self.assertEqual(
+            {p["enrollment"] for p in r.data["promoted"]},
+            {rows[0].enrollment_id, rows[1].enrollment_id},
+        )
+        self.assertEqual(
+            sum(p["completed"] for p in r.data["progress"]), 2, r.data["progress"]
+        )
+
+        rows[2].refresh_from_db()
+        self.assertEqual(rows[2].artifacts_submitted, 4)
+        self.assertTrue(rows[2].teacher_confirmed)
+        enrollment = rows[0].enrollment
+        enrollment.refresh_from_db()
+        self.assertEqual(enrollment.current_level, self.levels[1])
+        self.assertEqual(enrollment.modules_completed, 2)
+
+    def test_invalid_item_rejects_the_whole_batch(self):
+        rows = self._rows(2)
+        bad = {
+            "id": str(rows[1].id),
+            "completed_module_ids": [str(self.modules[2].id)],  # not on level 1
+        }
+        r = self.client.post(
+            URL, {"updates": [self._passing(rows[0]), bad]}, format="json"
+        )
+        self.assertEqual(r.status_code, 400)
+        self.assertEqual(r.data["errors"][0]["index"], 1)
+        self.assertEqual(
+            r.data["errors"][0]["invalid_module_ids"], [str(self.modules[2].id)]
+        )
+        rows[0].refresh_from_db()
+        self.assertEqual(rows[0].artifacts_submitted, 0)
+
+        r = self.client.post(
+            URL,
+            {"updates": [{"id": str(rows[0].id), "assessment_score": "lots"}]},
+            format="json",
+        )
+        self.assertEqual(r.status_code, 400)
+        r = self.client.post(URL, {"updates": []}, format="json")
+        self.assertEqual(r.status_code, 400)
+
+    def test_malformed_ids_are_reported_per_item(self):
+        (row,) = self._rows(1)
+        r = self.client.post(
+            URL,
+            {"updates": [self._passing(row), {"id": "42", "artifacts_submitted": 1}]},
+            format="json",
+        )
+        self.assertEqual(r.status_code, 400, r.content)
+        self.assertEqual(r.data["errors"], [{"index": 1, "error": "Invalid id."}])
+        row.refresh_from_db()
+        self.assertEqual(row.artifacts_submitted, 0)
+
+    def test_rows_outside_teachers_courses_are_not_found(self):
+        other = make_course("Other")
+        (row,) = self._rows(1, course=other)
+        r = self.client.post(
+            URL,
+            {"updates": [{"id": str(row.id), "artifacts_submitted": 3}]},
+            format="json",
+        )
+        self.assertEqual(r.status_code, 400)
+        self.assertEqual(r.data["errors"][0]["error"], "Progress record not found.")
+
+        learner_user = make_user("learner")
+        self.client.force_authenticate(user=learner_user)
+        r = self.client.post(URL, {"updates": [self._passing(row)]}, format="json")
+        self.assertEqual(r.status_code, 403)
+
+    def test_query_count_does_not_grow_with_class_size(self):
+        small = self._rows(2)
+        with self.assertNumQueries(17) as ctx:
+            r = self.client.post(
+                URL, {"updates": [self._passing(row) for row in small]}, format="json"
+            )
+        self.assertEqual(r.status_code, 200)
+
+        large = self._rows(8)
+        with self.assertNumQueries(len(ctx.captured_queries)):
+            r = self.client.post(
+                URL, {"updates": [self._passing(row) for row in large]}, format="json"
+            )
+        self.assertEqual(len(r.data["promoted"]), 8)
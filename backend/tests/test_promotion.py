@@ -0,0 +1,120 @@
+"""Tests for the level promotion engine (apps.core.services.promotion).
+
+Run with:
+    python manage.py test tests.test_promotion
+"""
+
+from __future__ import annotations
+
+import io
+
+from apps.core.models import (
+    CourseLevel,
+    LearnerLevelProgress,
+    School,
+)
+from apps.core.services import jobs, promotion
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from tests.factories import enroll, make_course, make_learner, make_levels
+
+MET = {"modules_completed": 4, "artifacts_submitted": 6, "assessment_score": 80}
+
+
+class PromotionTests(TestCase):
+
+    def setUp(self):
+        self.school = School.objects.create(name="Promo School", code="PS-1")
+        self.course = make_course()
+        self.levels = make_levels(self.course, 3)
+
+    def _enroll(self, met_levels=0, name="Ada"):
+        """Enrollment on level 1 with criteria met on the first `met_levels`."""
+        learner = make_learner(self.school, name)
+        enrollment = enroll(learner, self.course, self.levels[0])
+        for level in self.levels[: max(met_levels, 1)]:
+            values = MET if level.level_number <= met_levels else {}
+            LearnerLevelProgress.objects.create(
+                enrollment=enrollment, level=level, **values
+            )
+        return enrollment
+
+    def test_promotes_through_every_satisfied_level(self):
+        enrollment = self._enroll(met_levels=2)
+        self.assertTrue(enrollment.check_and_promote())
+
+        self.assertEqual(enrollment.current_level, self.levels[2])
+        self.assertIsNone(enrollment.completed_at)
+        rows = {
+            row.level.level_number: row.completed
+            for row in enrollment.level_progress.select_related("level")
+        }
+        self.assertEqual(rows, {1: True, 2: True, 3: False})
+        # Nothing further is satisfied, so a repeat call is a no-op.
+        self.assertFalse(enrollment.check_and_promote())
+
+    def test_completes_course_once(self):
+        enrollment = self._enroll(met_levels=3)
+        result = promotion.promote(enrollment)
+        self.assertEqual(
+            (result.from_level, result.to_level, result.levels_completed), (1, 3, 3)
+        )
+        self.assertTrue(result.course_completed)
+        self.assertIsNotNone(enrollment.completed_at)
+        self.assertEqual(enrollment.current_level, self.levels[2])
+        self.assertFalse(enrollment.check_and_promote())
+
+    def test_teacher_confirmation_blocks_promotion(self):
+        CourseLevel.objects.filter(pk=self.levels[0].pk).update(
+            requires_teacher_confirmation=True
+        )
+        enrollment = self._enroll(met_levels=1)
+        self.assertFalse(enrollment.check_and_promote())
+
+        row = enrollment.level_progress.get()
+        row.teacher_confirmed = True
+        row.save()
+        self.assertTrue(enrollment.check_and_promote())
+        self.assertEqual(enrollment.current_level, self.levels[1])
+
+    def test_update_progress_promotes_and_refreshes_aggregates(self):
+        enrollment = self._enroll()
+        row = enrollment.level_progress.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            row.update_progress(modules=4, artifacts=6, score=90)
+        enrollment.refresh_from_db()
+        self.assertEqual(enrollment.current_level, self.levels[1])
+        # Level 2 has a fresh progress row, so the average now spans two levels.
+        self.assertEqual(enrollment.average_score, 45.0)
+
+    def test_cohort_runs_in_constant_queries(self):
+        for i in range(2):
+            self._enroll(met_levels=i + 1, name=f"A{i}")
+        with self.assertNumQueries(10) as small:
+            promotion.promote_queryset(promotion.cohort(course=self.course.pk))
+
+        for i in range(6):
+            self._enroll(met_levels=i % 4, name=f"B{i}")
+        with self.assertNumQueries(len(small.captured_queries)):
+            promotions = promotion.promote_queryset(
+                promotion.cohort(school=self.school.pk)
+            )
+        # met_levels 0, 1, 2, 3, 0, 1: four new enrollments can advance, and the
+        # first run already promoted the earlier two as far as they go.
+        self.assertEqual(len(promotions), 4)
+        self.assertEqual(sum(p.course_completed for p in promotions), 1)
+
+    @override_settings(JOBS_BACKEND="eager")
+    def test_command_and_job(self):
+        self._enroll(met_levels=1)
+        out = io.StringIO()
+        call_command("promote_enrollments", course=str(self.course.pk), stdout=out)
+        self.assertIn("Promoted 1 enrollment(s) through 1 level(s)", out.getvalue())
+
+        self._enroll(met_levels=2, name="Bo")
+        with self.captureOnCommitCallbacks(execute=True):
+            job = jobs.enqueue("enrollments.promote", {"school": str(self.school.pk)})
+        job.refresh_from_db()
+        self.assertEqual(job.status, "succeeded")
+        self.assertEqual(job.result["levels_completed"], 2)
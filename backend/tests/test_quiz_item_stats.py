@@ -0,0 +1,114 @@
+"""Tests for incremental quiz item statistics (quiz_item_stats).
+
+Run with:
+    python manage.py test tests.test_quiz_item_stats
+"""
+
+from __future__ import annotations
+
+import io
+import statistics
+
+from apps.core.models import Quiz, QuizAttempt, QuizItemStatistics, School
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import make_learner, make_user
+
+API = "/api"
+
+QUESTIONS = [
+    {"question": f"Q{i}", "options": ["a", "b", "c"], "correct_answer": 0}
+    for i in range(3)
+]
+# One submission per learner; None leaves a question unanswered.
+SUBMISSIONS = [[0, 0, 0], [0, 0, 1], [0, 1, 2], [1, 2, None], [0, 0, 0]]
+
+
+class QuizItemStatsTests(TestCase):
+
+    def setUp(self):
+        self.school = School.objects.create(name="Item School", code="IS-1")
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.quiz = Quiz.objects.create(
+            tenant=self.school,
+            title="Check",
+            created_by=self.teacher,
+            questions=QUESTIONS,
+        )
+        self.tc = APIClient()
+        self.tc.force_authenticate(user=self.teacher)
+
+    def _submit_all(self):
+        for answers in SUBMISSIONS:
+            user = make_user("learner", tenant=self.school)
+            make_learner(self.school, "L", "X", user=user)
+            client = APIClient()
+            client.force_authenticate(user=user)
+            r = client.post(
+                f"{API}/student/quizzes/{self.quiz.pk}/submit/",
+                {"answers": answers},
+                format="json",
+            )
+            self.assertEqual(r.status_code, 200, r.content)
+
+    def _stats(self):
+        r = self.tc.get(f"{API}/teacher/quizzes/{self.quiz.pk}/item-stats/")
+        self.assertEqual(r.status_code, 200, r.content)
+        return r.data
+
+    def test_submissions_update_counts_incrementally(self):
+        self._submit_all()
+        row = QuizItemStatistics.objects.get(quiz=self.quiz)
+        self.assertEqual(row.attempt_count, len(SUBMISSIONS))
+
+        data = self._stats()
+        self.assertEqual(data["attempts"], 5)
+        first, second, third = data["items"]
+        self.assertEqual((first["correct"], first["difficulty"]), (4, 0.8))
+        self.assertEqual(second["option_counts"], [3, 1, 1])
+        self.assertEqual((third["option_counts"], third["unanswered"]), ([2, 1, 1], 1))
+
+        # Point-biserial equals Pearson's r of item score vs attempt total.
+        hits = [[int(a == 0) for a in answers] for answers in SUBMISSIONS]
+        totals = [sum(row) for row in hits]
+        expected = statistics.correlation([row[0] for row in hits], totals)
+        self.assertAlmostEqual(first["discrimination"], expected, places=3)
+
+        # Incremental counts match a full recompute.
+        counts = (row.correct_counts, row.correct_total_sums, row.option_counts)
+        call_command("rebuild_quiz_item_stats", stdout=io.StringIO())
+        row.refresh_from_db()
+        self.assertEqual(
+            (row.correct_counts, row.correct_total_sums, row.option_counts), counts
+        )
+
+    def test_editing_the_quiz_rebuilds_on_read(self):
+        self._submit_all()
+        questions = [dict(q) for q in QUESTIONS]
+        questions[1]["correct_answer"] = 1
+        r = self.tc.patch(
+            f"{API}/teacher/quizzes/{self.quiz.pk}/",
+            {"questions": questions},
+            format="json",
+        )
+        self.assertEqual(r.status_code, 200, r.content)
+        self.assertEqual(self._stats()["items"][1]["correct"], 1)
+
+    def test_command_picks_up_attempts_written_directly(self):
+        QuizAttempt.objects.create(
+            quiz=self.quiz,
+            learner=make_learner(self.school, "A"),
+            answers=[0, 0, 0],
+            score=100,
+            completed_at=timezone.now(),
+        )
+        out = io.StringIO()
+        call_command("rebuild_quiz_item_stats", quiz=str(self.quiz.pk), stdout=out)
+        self.assertIn("1 quiz(zes)", out.getvalue())
+        row = QuizItemStatistics.objects.get(quiz=self.quiz)
+        self.assertEqual((row.attempt_count, row.correct_counts), (1, [1, 1, 1]))
+        # No variance among attempts, so no discrimination.
+        self.assertIsNone(self._stats()["items"][0]["discrimination"])
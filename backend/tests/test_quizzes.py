@@ -0,0 +1,185 @@
+"""Tests for quiz delivery and auto-grading (quiz_views, quiz_grading).
+
+Run with:
+    python manage.py test tests.test_quizzes
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from apps.core.models import (
+    LearnerLevelProgress,
+    Module,
+    Quiz,
+    QuizAttempt,
+    School,
+)
+from apps.core.services import quiz_grading
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from tests.factories import enroll, make_course, make_learner, make_levels, make_user
+
+API = "/api"
+
+QUESTIONS = [
+    {"question": f"Q{i}", "options": ["a", "b", "c"], "correct_answer": i % 3}
+    for i in range(4)
+]
+
+
+class QuizTests(TestCase):
+
+    def setUp(self):
+        self.school = School.objects.create(name="Quiz School", code="QS-1")
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.course = make_course()
+        self.module = Module.objects.create(name="Motors", course=self.course)
+        self.quiz = Quiz.objects.create(
+            tenant=self.school,
+            title="Motors check",
+            module=self.module,
+            created_by=self.teacher,
+            questions=QUESTIONS,
+            passing_score=75,
+        )
+        student = make_user("learner", tenant=self.school)
+        self.learner = make_learner(self.school, user=student)
+
+        self.tc = APIClient()
+        self.tc.force_authenticate(user=self.teacher)
+        self.sc = APIClient()
+        self.sc.force_authenticate(user=student)
+
+    def _submit(self, answers):
+        return self.sc.post(
+            f"{API}/student/quizzes/{self.quiz.pk}/submit/",
+            {"answers": answers},
+            format="json",
+        )
+
+    def test_teacher_create_validates_questions(self):
+        url = f"{API}/teacher/quizzes/"
+        bad = [{"question": "Q", "options": ["a"], "correct_answer": 3}]
+        r = self.tc.post(url, {"title": "T", "questions": bad}, format="json")
+        self.assertEqual(r.status_code, 400, r.content)
+        self.assertIn("questions", r.data["error"]["details"])
+
+        r = self.tc.post(
+            url,
+            {"title": "T", "questions": QUESTIONS, "passing_score": 60},
+            format="json",
+            HTTP_X_SCHOOL_ID=str(self.school.id),
+        )
+        self.assertEqual(r.status_code, 201, r.content)
+        quiz = Quiz.objects.get(pk=r.data["id"])
+        self.assertEqual(
+            (quiz.tenant_id, quiz.created_by_id), (self.school.id, self.teacher.id)
+        )
+
+    def test_student_sees_no_answer_key_and_is_graded_on_submit(self):
+        r = self.sc.get(f"{API}/student/quizzes/")
+        self.assertEqual(r.status_code, 200, r.content)
+        rows = r.data["results"] if isinstance(r.data, dict) else r.data
+        self.assertEqual(len(rows), 1)
+        self.assertNotIn("correct_answer", rows[0]["questions"][0])
+
+        r = self.sc.post(f"{API}/student/quizzes/{self.quiz.pk}/start/")
+        self.assertEqual(r.status_code, 201, r.content)
+        attempt_id = r.data["id"]
+        r = self.sc.post(f"{API}/student/quizzes/{self.quiz.pk}/start/")
+        self.assertEqual((r.status_code, r.data["id"]), (200, attempt_id))
+
+        # Three of four right; the out-of-range answer never matches.
+        r = self._submit([0, 1, 2, 7])
+        self.assertEqual(r.status_code, 200, r.content)
+        self.assertEqual((r.data["correct"], r.data["total"]), (3, 4))
+        attempt = QuizAttempt.objects.get(pk=attempt_id)
+        self.assertEqual((attempt.score, attempt.passed), (75, True))
+        self.assertIsNotNone(attempt.completed_at)
+
+        # Without an open attempt a submission creates and completes one.
+        r = self._submit([0])
+        self.assertEqual(r.data["attempt"]["score"], 25)
+        self.assertEqual(self.quiz.attempts.count(), 2)
+
+        self.assertEqual(self._submit("0,1").status_code, 400)
+
+    def test_time_limit(self):
+        self.quiz.time_limit_minutes = 5
+        self.quiz.save()
+        attempt = QuizAttempt.objects.create(
+            quiz=self.quiz, learner=self.learner, score=0
+        )
+        QuizAttempt.objects.filter(pk=attempt.pk).update(
+            started_at=attempt.started_at - timedelta(minutes=10)
+        )
+        r = self._submit([0, 1, 2, 0])
+        self.assertEqual(r.status_code, 400, r.content)
+        # The expired attempt is closed so the learner can start again.
+        attempt.refresh_from_db()
+        self.assertIsNotNone(attempt.completed_at)
+        self.assertEqual((attempt.score, attempt.passed), (0, False))
+
+        r = self.sc.post(f"{API}/student/quizzes/{self.quiz.pk}/start/")
+        self.assertEqual(r.status_code, 201, r.content)
+        new_id = r.data["id"]
+        self.assertNotEqual(new_id, str(attempt.pk))
+        r = self._submit([0, 1, 2, 0])
+        self.assertEqual(r.status_code, 200, r.content)
+        self.assertEqual(r.data["attempt"]["id"], new_id)
+
+    def test_timed_quiz_requires_a_started_attempt(self):
+        self.quiz.time_limit_minutes = 5
+        self.quiz.save()
+        r = self._submit([0, 1, 2, 0])
+        self.assertEqual(r.status_code, 400, r.content)
+        self.assertFalse(QuizAttempt.objects.filter(quiz=self.quiz).exists())
+
+        # An open attempt left past the limit is replaced on start.
+        attempt = QuizAttempt.objects.create(
+            quiz=self.quiz, learner=self.learner, score=0
+        )
+        QuizAttempt.objects.filter(pk=attempt.pk).update(
+            started_at=attempt.started_at - timedelta(minutes=10)
+        )
+        r = self.sc.post(f"{API}/student/quizzes/{self.quiz.pk}/start/")
+        self.assertEqual(r.status_code, 201, r.content)
+        attempt.refresh_from_db()
+        self.assertIsNotNone(attempt.completed_at)
+
+    def test_editing_the_key_regrades_and_feeds_progress(self):
+        (level,) = make_levels(self.course, 1, required_assessment_score=70)
+        enrollment = enroll(self.learner, self.course, level)
+        row = LearnerLevelProgress.objects.create(enrollment=enrollment, level=level)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._submit([0, 1, 0, 1])  # 2 of 4
+        row.refresh_from_db()
+        self.assertEqual(row.assessment_score, 50)
+
+        # Make the learner's third answer correct.
+        questions = [dict(q) for q in QUESTIONS]
+        questions[2]["correct_answer"] = 0
+        with self.captureOnCommitCallbacks(execute=True):
+            r = self.tc.patch(
+                f"{API}/teacher/quizzes/{self.quiz.pk}/",
+                {"questions": questions},
+                format="json",
+            )
+        self.assertEqual(r.status_code, 200, r.content)
+        attempt = self.quiz.attempts.get()
+        self.assertEqual((attempt.score, attempt.passed), (75, True))
+        row.refresh_from_db()
+        self.assertEqual(row.assessment_score, 75)
+
+        r = self.tc.post(f"{API}/teacher/quizzes/{self.quiz.pk}/regrade/")
+        self.assertEqual(r.data["regraded"], 0)
+
+    def test_answer_key_is_cached_per_revision(self):
+        key = quiz_grading.answer_key(self.quiz)
+        self.assertEqual(key.correct, bytes([0, 1, 2, 0]))
+        self.quiz.questions = QUESTIONS[:2]
+        self.quiz.save()
+        self.assertEqual(len(quiz_grading.answer_key(self.quiz)), 2)
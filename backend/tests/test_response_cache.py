@@ -0,0 +1,94 @@
+"""Tests for the stale-while-revalidate response cache (apps.api.utils.cache).
+
+Run with:
+    python manage.py test tests.test_response_cache
+"""
+
+from __future__ import annotations
+
+import time
+from unittest import mock
+
+from apps.api.utils import cache as response_cache
+from apps.core.models import School
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from tests.factories import make_learner, make_user
+
+API = "/api"
+ANALYTICS = f"{API}/school/dashboard/analytics/"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+
+class SWRCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.school = School.objects.create(name="Cache School", code="CA-1")
+        self.client = APIClient()
+        self.client.force_authenticate(user=make_user("school", tenant=self.school))
+        make_learner(self.school, "A", "B")
+        self.clock = FakeClock()
+        patcher = mock.patch.object(response_cache, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _students(self, r):
+        return r.data["overview"]["total_students"]
+
+    def test_miss_then_hit(self):
+        r = self.client.get(ANALYTICS)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r["X-Cache"], "MISS")
+
+        self.clock.now += 30
+        with self.assertNumQueries(0):
+            r = self.client.get(ANALYTICS)
+        self.assertEqual(r["X-Cache"], "HIT")
+        self.assertEqual(r["X-Cache-Age"], "30")
+
+    def test_query_params_and_scope_are_part_of_key(self):
+        self.client.get(ANALYTICS)
+        self.assertEqual(self.client.get(f"{ANALYTICS}?x=1")["X-Cache"], "MISS")
+
+        other = School.objects.create(name="Other School", code="CA-2")
+        other_client = APIClient()
+        other_client.force_authenticate(user=make_user("school", tenant=other))
+        r = other_client.get(ANALYTICS)
+        self.assertEqual(r["X-Cache"], "MISS")
+        self.assertEqual(self._students(r), 0)
+
+    def test_stale_serves_old_data_and_refreshes_once(self):
+        self.client.get(ANALYTICS)
+        make_learner(self.school, "C", "D")
+        self.clock.now += 500
+
+        scheduled = []
+        with mock.patch.object(response_cache, "_run_in_background", scheduled.append):
+            r1 = self.client.get(ANALYTICS)
+            r2 = self.client.get(ANALYTICS)
+        self.assertEqual((r1["X-Cache"], r2["X-Cache"]), ("STALE", "STALE"))
+        self.assertEqual(self._students(r1), 1)
+        self.assertEqual(len(scheduled), 1)
+
+        scheduled[0]()
+        r = self.client.get(ANALYTICS)
+        self.assertEqual(r["X-Cache"], "HIT")
+        self.assertEqual(self._students(r), 2)
+
+    def test_errors_are_not_cached(self):
+        orphan = APIClient()
+        orphan.force_authenticate(user=make_user("school"))
+        r = orphan.get(ANALYTICS)
+        self.assertEqual(r.status_code, 400)
+        self.assertNotIn("X-Cache", r)
+        self.assertEqual(orphan.get(ANALYTICS).status_code, 400)
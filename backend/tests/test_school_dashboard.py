@@ -0,0 +1,374 @@
+"""Tests for SchoolDashboardViewSet (school admin dashboard endpoints).
+
+Run with:
+    python manage.py test tests.test_school_dashboard
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import time, timedelta
+
+from apps.core.models import (
+    Achievement,
+    Artifact,
+    CourseLevel,
+    LearnerLevelProgress,
+    Module,
+    School,
+    Session,
+)
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import enroll, make_course, make_learner, make_levels, make_user
+
+API = "/api"
+
+
+class SchoolDashboardFixtureMixin:
+
+    def setUp(self):
+        cache.clear()
+        self.school = School.objects.create(name="Dash School", code="DS-1")
+        self.other_school = School.objects.create(name="Other", code="DS-2")
+        self.client = APIClient()
+        self.client.force_authenticate(user=make_user("school", tenant=self.school))
+
+    def _course(self, name, levels, tenant=None):
+        course = make_course(name, tenant=tenant)
+        return course, make_levels(course, levels)
+
+    def _learner(self, name="Ada", school=None):
+        return make_learner(school or self.school, name)
+
+    def _enroll(self, learner, course, levels, completed=0):
+        enrollment = enroll(learner, course)
+        for i, level in enumerate(levels):
+            LearnerLevelProgress.objects.create(
+                enrollment=enrollment,
+                level=level,
+                completed=i < completed,
+                assessment_score=80,
+            )
+        return enrollment
+
+
+class SchoolAnalyticsTests(SchoolDashboardFixtureMixin, TestCase):
+    URL = f"{API}/school/dashboard/analytics/"
+
+    def test_course_completion_rates(self):
+        robotics, r_levels = self._course("Robotics", 4)
+        coding, c_levels = self._course("Coding", 2, tenant=self.school)
+        self._course("Unused", 3)
+        ada, bo = self._learner("Ada"), self._learner("Bo")
+        self._enroll(ada, robotics, r_levels, completed=3)
+        self._enroll(bo, robotics, r_levels, completed=1)
+        self._enroll(ada, coding, c_levels, completed=2)
+        # Another school's learners do not count.
+        self._enroll(self._learner("Zed", self.other_school), robotics, r_levels, 4)
+
+        data = self.client.get(self.URL).data
+        self.assertEqual(
+            data["courseStats"],
+            [
+                {
+                    "course_name": "Coding",
+                    "enrolled_students": 1,
+                    "completion_rate": 100,
+                },
+                {
+                    "course_name": "Robotics",
+                    "enrolled_students": 2,
+                    "completion_rate": 50,
+                },
+            ],
+        )
+        # (3 + 1 + 2) completed of (4 + 4 + 2) level slots
+        self.assertEqual(data["performance"]["average_completion_rate"], 60.0)
+        self.assertEqual(data["performance"]["average_assessment_score"], 80.0)
+
+        stats = self.client.get(f"{API}/school/dashboard/stats/").data
+        self.assertEqual(stats["performance"]["average_completion_rate"], 60.0)
+
+    def test_top_performers_use_real_completion(self):
+        course, levels = self._course("Robotics", 4)
+        ada, bo = self._learner("Ada"), self._learner("Bo")
+        self._enroll(ada, course, levels, completed=1)
+        self._enroll(bo, course, levels, completed=4)
+        for _ in range(2):
+            Achievement.objects.create(
+                learner=ada, name="Star", achievement_type="special"
+            )
+
+        top = self.client.get(self.URL).data["topPerformers"]
+        self.assertEqual(top[0]["badges_count"], 2)
+        self.assertEqual(top[0]["completion_rate"], 25)
+        self.assertEqual(top[1]["completion_rate"], 100)
+
+    def test_query_count_does_not_grow_with_courses(self):
+        learner = self._learner()
+        course, levels = self._course("C0", 2)
+        self._enroll(learner, course, levels, completed=1)
+        with self.assertNumQueries(13):
+            self.client.get(self.URL)
+
+        cache.clear()
+        for i in range(1, 6):
+            course, levels = self._course(f"C{i}", 3)
+            self._enroll(self._learner(f"L{i}"), course, levels, completed=i % 3)
+        with self.assertNumQueries(13):
+            r = self.client.get(self.URL)
+        self.assertEqual(len(r.data["courseStats"]), 6)
+
+
+class EnrollmentProgressTests(SchoolDashboardFixtureMixin, TestCase):
+    URL = f"{API}/school/dashboard/progress/"
+
+    def _enroll_committed(self, *args, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self._enroll(*args, **kwargs)
+
+    def test_aggregates_follow_level_progress_saves(self):
+        course, levels = self._course("Robotics", 2)
+        enrollment = self._enroll_committed(self._learner(), course, levels)
+        enrollment.refresh_from_db()
+        self.assertEqual((enrollment.total_modules, enrollment.average_score), (8, 80))
+
+        first = enrollment.level_progress.get(level=levels[0])
+        with self.captureOnCommitCallbacks(execute=True):
+            first.update_progress(modules=4, artifacts=3, score=90)
+        enrollment.refresh_from_db()
+        self.assertEqual(enrollment.modules_completed, 4)
+        self.assertEqual(enrollment.artifacts_submitted, 3)
+        self.assertEqual(enrollment.average_score, 85.0)
+        self.assertEqual(enrollment.completion_percentage, 50)
+        self.assertEqual(enrollment.progress_status, "on_track")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CourseLevel.objects.filter(pk=levels[1].pk).get().delete()
+        enrollment.refresh_from_db()
+        self.assertEqual(
+            (enrollment.total_modules, enrollment.completion_percentage), (4, 100)
+        )
+        self.assertEqual(enrollment.progress_status, "completed")
+
+    def test_low_scores_need_attention(self):
+        course, levels = self._course("Robotics", 1)
+        enrollment = self._enroll_committed(self._learner(), course, levels)
+        with self.captureOnCommitCallbacks(execute=True):
+            LearnerLevelProgress.objects.filter(
+                enrollment=enrollment
+            ).get().update_progress(score=30)
+        enrollment.refresh_from_db()
+        self.assertEqual(enrollment.progress_status, "on_track")  # best score kept
+        LearnerLevelProgress.objects.filter(enrollment=enrollment).update(
+            assessment_score=30
+        )
+        call_command("refresh_enrollment_progress", stdout=io.StringIO())
+        enrollment.refresh_from_db()
+        self.assertEqual(enrollment.progress_status, "needs_attention")
+
+    def test_endpoint_sorts_filters_and_paginates(self):
+        course, levels = self._course("Robotics", 4)
+        for i, name in enumerate(["Ann", "Ben", "Cal", "Dee", "Eve"]):
+            self._enroll_committed(self._learner(name), course, levels)
+            LearnerLevelProgress.objects.filter(
+                enrollment__learner__first_name=name
+            ).update(modules_completed=i)
+        call_command("refresh_enrollment_progress", stdout=io.StringIO())
+
+        names, cursor = [], None
+        while True:
+            params = {"ordering": "-completion_percentage", "page_size": 2}
+            if cursor:
+                params["cursor"] = cursor
+            r = self.client.get(self.URL, params)
+            self.assertEqual(r.status_code, 200)
+            names += [row["student_name"].split()[0] for row in r.data["results"]]
+            cursor = r.data["next_cursor"]
+            if not cursor:
+                break
+        self.assertEqual(names, ["Eve", "Dee", "Cal", "Ben", "Ann"])
+
+        r = self.client.get(self.URL, {"status": "completed"})
+        self.assertEqual([row["student_name"] for row in r.data["results"]], ["Eve L"])
+        self.assertEqual(r.data["results"][0]["completion_percentage"], 100)
+        r = self.client.get(self.URL, {"search": "ben"})
+        self.assertEqual(len(r.data["results"]), 1)
+        r = self.client.get(self.URL, {"ordering": "student_name"})
+        self.assertEqual(r.status_code, 400)
+
+    def test_enrollments_follow_their_learner_between_schools(self):
+        course, levels = self._course("Robotics", 1)
+        learner = self._learner("Mover", school=self.other_school)
+        enrollment = self._enroll_committed(learner, course, levels)
+        self.assertEqual(enrollment.school, self.other_school)
+        self.assertEqual(self.client.get(self.URL).data["results"], [])
+
+        learner.tenant = self.school
+        learner.save()
+        enrollment.refresh_from_db()
+        self.assertEqual(enrollment.school, self.school)
+        r = self.client.get(self.URL)
+        self.assertEqual(
+            [row["student_name"] for row in r.data["results"]], ["Mover L"]
+        )
+
+    def test_page_is_one_query(self):
+        course, levels = self._course("Robotics", 2)
+        for i in range(6):
+            self._enroll_committed(self._learner(f"S{i}"), course, levels)
+        with self.assertNumQueries(1):
+            r = self.client.get(self.URL, {"page_size": 3})
+        self.assertEqual(len(r.data["results"]), 3)
+
+
+class SchoolSessionFeedTests(SchoolDashboardFixtureMixin, TestCase):
+    URL = f"{API}/school/dashboard/sessions/"
+
+    def setUp(self):
+        super().setUp()
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.module = Module.objects.create(name="Circuits")
+        self.today = timezone.localdate()
+
+    def _session(self, offset_days, learners=0, school=None, start_time=None):
+        session = Session.objects.create(
+            tenant=school or self.school,
+            teacher=self.teacher,
+            module=self.module,
+            date=self.today + timedelta(days=offset_days),
+            start_time=start_time,
+        )
+        session.learners.set([self._learner(f"S{i}") for i in range(learners)])
+        return session
+
+    def test_default_window_around_today(self):
+        self._session(-30)
+        recent = self._session(-2, learners=3)
+        upcoming = self._session(5)
+        self._session(60)
+        self._session(0, school=self.other_school)
+
+        r = self.client.get(self.URL)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(
+            [row["id"] for row in r.data["results"]], [str(recent.id), str(upcoming.id)]
+        )
+        self.assertEqual(r.data["results"][0]["learner_count"], 3)
+        self.assertEqual(
+            r.data["window"]["date_from"], str(self.today - timedelta(days=7))
+        )
+
+        r = self.client.get(
+            self.URL, {"date_from": str(self.today - timedelta(days=40))}
+        )
+        self.assertEqual(len(r.data["results"]), 3)
+
+    def test_cursor_walk_with_constant_queries(self):
+        # Created late-to-early within each day, so creation order differs
+        # from time-of-day order; one session has no start time.
+        sessions = [
+            self._session(
+                i % 3, learners=2, start_time=None if i == 6 else time(17 - i, 0)
+            )
+            for i in range(7)
+        ]
+        seen, cursor = [], None
+        while True:
+            params = {"page_size": 3}
+            if cursor:
+                params["cursor"] = cursor
+            with self.assertNumQueries(1):
+                r = self.client.get(self.URL, params)
+            seen += [row["id"] for row in r.data["results"]]
+            self.assertTrue(all(row["learner_count"] == 2 for row in r.data["results"]))
+            cursor = r.data["next_cursor"]
+            if not cursor:
+                break
+        expected = sorted(
+            sessions, key=lambda s: (s.date, s.start_time or time.min, s.id)
+        )
+        self.assertEqual(seen, [str(s.id) for s in expected])
+
+    def test_invalid_windows_are_rejected(self):
+        for params in (
+            {"date_from": "yesterday"},
+            {"date_from": "2025-02-01", "date_to": "2025-01-01"},
+            {"date_from": "2020-01-01", "date_to": "2025-01-01"},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(self.URL, params).status_code, 400)
+
+
+class SchoolBadgeArtifactFeedTests(SchoolDashboardFixtureMixin, TestCase):
+    BADGES = f"{API}/school/dashboard/badges/"
+    ARTIFACTS = f"{API}/school/dashboard/artifacts/"
+
+    def setUp(self):
+        super().setUp()
+        self.ada = self._learner("Ada")
+        self.badges = [
+            Achievement.objects.create(learner=self.ada, name=f"Badge {i}")
+            for i in range(5)
+        ]
+        self.artifacts = [
+            Artifact.objects.create(
+                tenant=self.school, learner=self.ada, title=f"Artifact {i}"
+            )
+            for i in range(5)
+        ]
+        zed = self._learner("Zed", self.other_school)
+        Achievement.objects.create(learner=zed, name="Elsewhere")
+        Artifact.objects.create(tenant=self.other_school, learner=zed, title="X")
+
+    def _walk(self, url):
+        ids, cursor = [], None
+        while True:
+            params = {"page_size": 2}
+            if cursor:
+                params["cursor"] = cursor
+            with self.assertNumQueries(1):
+                r = self.client.get(url, params)
+            self.assertEqual(r.status_code, 200)
+            ids += [row["id"] for row in r.data["results"]]
+            cursor = r.data["next_cursor"]
+            if not cursor:
+                return ids
+
+    def test_cursor_walk_newest_first(self):
+        for url, rows, field in (
+            (self.BADGES, self.badges, "earned_at"),
+            (self.ARTIFACTS, self.artifacts, "submitted_at"),
+        ):
+            with self.subTest(url=url):
+                expected = sorted(
+                    rows, key=lambda o: (getattr(o, field), o.id), reverse=True
+                )
+                self.assertEqual(self._walk(url), [str(o.id) for o in expected])
+
+    def test_ndjson_stream(self):
+        r = self.client.get(self.BADGES, {"export_format": "ndjson"})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in b"".join(r.streaming_content).splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["student_name"], "Ada L")
+        page = self.client.get(self.BADGES).data["results"]
+        self.assertEqual(set(rows[0]), set(page[0]))
+
+        r = self.client.get(self.ARTIFACTS, {"export_format": "ndjson"})
+        rows = [json.loads(line) for line in b"".join(r.streaming_content).splitlines()]
+        self.assertEqual(
+            sorted(row["title"] for row in rows), [f"Artifact {i}" for i in range(5)]
+        )
+        page = self.client.get(self.ARTIFACTS).data["results"]
+        self.assertEqual(set(rows[0]), set(page[0]))
+        self.assertEqual(
+            self.client.get(self.BADGES, {"export_format": "xml"}).status_code, 400
+        )
@@ -0,0 +1,181 @@
+"""Tests for student roster and profile endpoints (school admin and teacher).
+
+Run with:
+    python manage.py test tests.test_school_students
+"""
+
+from __future__ import annotations
+
+
+from apps.core.models import (
+    Artifact,
+    Attendance,
+    Badge,
+    Module,
+    School,
+    Session,
+)
+from apps.core.services import learner_history
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import enroll, make_course, make_learner, make_user
+
+API = "/api"
+
+
+class SchoolStudentFieldsTests(TestCase):
+    URL = f"{API}/school/students/"
+
+    def setUp(self):
+        cache.clear()
+        self.school = School.objects.create(name="Roster School", code="RS-1")
+        self.client = APIClient()
+        self.client.force_authenticate(user=make_user("school", tenant=self.school))
+        self.robotics = make_course()
+        self.coding = make_course("Coding")
+
+    def _students(self, n):
+        learners = []
+        for i in range(n):
+            learner = make_learner(
+                self.school,
+                f"S{i}",
+                user=make_user("learner", tenant=self.school),
+                parent=make_user("parent"),
+            )
+            enroll(learner, self.robotics)
+            enroll(learner, self.coding, is_active=False)
+            learners.append(learner)
+        return learners
+
+    def test_list_query_count_is_constant(self):
+        self._students(2)
+        # count + page (user/parent joined) + active enrollments
+        with self.assertNumQueries(3):
+            r = self.client.get(self.URL)
+        self.assertEqual(r.status_code, 200)
+
+        self._students(4)
+        with self.assertNumQueries(3):
+            r = self.client.get(self.URL)
+        row = r.data["results"][0]
+        self.assertEqual(
+            row["pathways"], [{"id": str(self.robotics.id), "name": "Robotics"}]
+        )
+        self.assertTrue(row["username"].startswith("u_"))
+
+    def test_sparse_fieldset_skips_unrendered_loads(self):
+        self._students(3)
+        with self.assertNumQueries(2):
+            r = self.client.get(self.URL, {"fields": "id,full_name"})
+        self.assertEqual(set(r.data["results"][0]), {"id", "full_name"})
+
+        r = self.client.get(self.URL, {"fields": "id,nope"})
+        self.assertEqual(r.status_code, 400)
+
+    def test_retrieve_honours_fields(self):
+        learner = self._students(1)[0]
+        r = self.client.get(f"{self.URL}{learner.id}/", {"fields": "id,pathways"})
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(set(r.data), {"id", "pathways"})
+
+        r = self.client.get(f"{self.URL}{learner.id}/")
+        self.assertIn("attendance", r.data)
+        self.assertEqual(len(r.data["pathways"]), 1)
+
+
+class StudentHistoryTests(TestCase):
+    """Profiles embed recent history slices; sub-resources page the rest."""
+
+    def setUp(self):
+        cache.clear()
+        self.school = School.objects.create(name="History School", code="HS-1")
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.learner = make_learner(self.school)
+        module = Module.objects.create(name="Circuits")
+        n = learner_history.RECENT_LIMIT + 3
+        self.badges = [
+            Badge.objects.create(
+                learner=self.learner, module=module, badge_name=f"B{i}"
+            )
+            for i in range(n)
+        ]
+        self.artifacts = [
+            Artifact.objects.create(
+                tenant=self.school, learner=self.learner, title=f"A{i}"
+            )
+            for i in range(n)
+        ]
+        for i in range(n):
+            session = Session.objects.create(
+                tenant=self.school,
+                teacher=self.teacher,
+                module=module,
+                date=timezone.localdate(),
+            )
+            Attendance.objects.create(session=session, learner=self.learner)
+
+    def _client(self, user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    def _walk(self, client, url):
+        ids, cursor = [], None
+        while True:
+            params = {"page_size": 5}
+            if cursor:
+                params["cursor"] = cursor
+            r = client.get(url, params)
+            self.assertEqual(r.status_code, 200)
+            ids += [row["id"] for row in r.data["results"]]
+            cursor = r.data["next_cursor"]
+            if not cursor:
+                return ids
+
+    def _newest_first(self, rows, field):
+        rows = sorted(rows, key=lambda o: (getattr(o, field), o.id), reverse=True)
+        return [str(o.id) for o in rows]
+
+    def test_school_detail_is_bounded(self):
+        client = self._client(make_user("school", tenant=self.school))
+        url = f"{API}/school/students/{self.learner.id}/"
+        data = client.get(url).data
+        limit, total = learner_history.RECENT_LIMIT, learner_history.RECENT_LIMIT + 3
+        for name in ("badges", "artifacts", "attendance"):
+            self.assertEqual(len(data[name]), limit)
+        self.assertEqual(
+            data["totals"], {"badges": total, "artifacts": total, "attendance": total}
+        )
+        expected = self._newest_first(self.badges, "awarded_at")
+        self.assertEqual([b["id"] for b in data["badges"]], expected[:limit])
+
+        self.assertEqual(self._walk(client, f"{url}badges/"), expected)
+        self.assertEqual(
+            self._walk(client, f"{url}artifacts/"),
+            self._newest_first(self.artifacts, "submitted_at"),
+        )
+        self.assertEqual(len(self._walk(client, f"{url}attendance/")), total)
+
+    def test_teacher_detail_is_bounded(self):
+        client = self._client(self.teacher)
+        url = f"{API}/teacher/students/{self.learner.id}/"
+        data = client.get(url).data
+        limit, total = learner_history.RECENT_LIMIT, learner_history.RECENT_LIMIT + 3
+        self.assertEqual((len(data["badges"]), len(data["artifacts"])), (limit, limit))
+        self.assertEqual(data["totals"], {"badges": total, "artifacts": total})
+
+        self.assertEqual(
+            self._walk(client, f"{url}badges/"),
+            self._newest_first(self.badges, "awarded_at"),
+        )
+        with self.assertNumQueries(3):  # school scope + learner + page
+            r = client.get(f"{url}artifacts/", {"page_size": 5})
+        self.assertEqual(r.data["results"][0]["learner_name"], "Ada L")
+
+        other = make_learner(School.objects.create(name="O", code="HS-2"), "Zed")
+        r = client.get(f"{API}/teacher/students/{other.id}/badges/")
+        self.assertEqual(r.status_code, 404)
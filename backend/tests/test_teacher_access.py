@@ -0,0 +1,110 @@
+"""Tests for the maintained teacher → learner access table.
+
+Run with:
+    python manage.py test tests.test_teacher_access
+"""
+
+from __future__ import annotations
+
+import io
+
+from apps.core.models import (
+    LearnerCourseEnrollment,
+    LearnerLevelProgress,
+    School,
+    TeacherLearnerAccess,
+)
+from apps.core.services import teacher_access
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from tests.factories import enroll, make_course, make_learner, make_levels, make_user
+
+API = "/api"
+
+
+class TeacherAccessTests(TestCase):
+
+    def setUp(self):
+        self.school = School.objects.create(name="Access School", code="AS-1")
+        self.teacher = make_user("teacher", tenant=self.school)
+        self.course = make_course()
+        (self.level,) = make_levels(self.course, 1)
+        self.learner = make_learner(self.school)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.enrollment = enroll(self.learner, self.course, self.level)
+        self.progress = LearnerLevelProgress.objects.create(
+            enrollment=self.enrollment, level=self.level
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.teacher)
+
+    def _can_access(self):
+        return teacher_access.can_access(self.teacher, self.learner.pk)
+
+    def test_follows_course_assignment(self):
+        self.assertFalse(self._can_access())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.teachers.add(self.teacher)
+        self.assertTrue(self._can_access())
+        r = self.client.get(f"{API}/progress/{self.progress.id}/")
+        self.assertEqual(r.status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teacher.courses_taught.remove(self.course)
+        self.assertFalse(self._can_access())
+        r = self.client.get(f"{API}/progress/{self.progress.id}/")
+        self.assertEqual(r.status_code, 404)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.teacher.courses_taught.add(self.course)
+        self.assertTrue(self._can_access())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.teachers.clear()
+        self.assertFalse(self._can_access())
+
+    def test_follows_enrollment_writes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.teachers.add(self.teacher)
+            other = make_course("Coding")
+            other.teachers.add(self.teacher)
+
+        self.enrollment.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.enrollment.save(update_fields=["is_active"])
+        self.assertFalse(self._can_access())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second = enroll(self.learner, other)
+        self.assertTrue(self._can_access())
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(self._can_access())
+
+    def test_queryset_is_a_single_probe(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.teachers.add(self.teacher)
+        with self.assertNumQueries(1):
+            ids = list(
+                teacher_access.learner_ids(self.teacher).values_list(
+                    "learner_id", flat=True
+                )
+            )
+        self.assertEqual(ids, [self.learner.pk])
+
+    def test_rebuild_repairs_drift(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.teachers.add(self.teacher)
+        # Writes that bypass signals leave the table stale.
+        LearnerCourseEnrollment.objects.filter(pk=self.enrollment.pk).update(
+            is_active=False
+        )
+        stray = make_user("teacher", tenant=self.school)
+        TeacherLearnerAccess.objects.create(teacher=stray, learner=self.learner)
+        self.assertTrue(self._can_access())
+
+        out = io.StringIO()
+        call_command("rebuild_teacher_access", stdout=out)
+        self.assertIn("2 row(s) changed", out.getvalue())
+        self.assertFalse(TeacherLearnerAccess.objects.exists())
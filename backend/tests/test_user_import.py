@@ -0,0 +1,112 @@
+"""Tests for AdminUserViewSet.bulk_import (apps.core.services.user_import).
+
+Run with:
+    python manage.py test tests.test_user_import
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from apps.core.models import DailySchoolStats, School
+from apps.core.services import counters
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tests.factories import make_user
+
+User = get_user_model()
+URL = "/api/admin/users/bulk-import/"
+HEADER = "username,email,first_name,last_name,role,school_id,password\n"
+
+
+def upload(body: str, name="users.csv"):
+    return SimpleUploadedFile(name, (HEADER + body).encode(), content_type="text/csv")
+
+
+class BulkImportTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=make_user("admin", username="admin"))
+        self.school = School.objects.create(name="Import School", code="IM-1")
+
+    def _post(self, body, **extra):
+        r = self.client.post(URL, {"file": upload(body), **extra}, format="multipart")
+        self.assertEqual(r.status_code, 200, r.data)
+        return r.data
+
+    def test_creates_users_with_school_and_password(self):
+        data = self._post(
+            f"amy,amy@x.com,Amy,A,teacher,{self.school.id},Secret123!\n"
+            "bob,bob@x.com,Bob,B,parent,,\n"
+        )
+        self.assertEqual((data["created"], data["errors"]), (2, []))
+        amy = User.objects.get(username="amy")
+        self.assertEqual(amy.tenant_id, self.school.id)
+        self.assertTrue(amy.check_password("Secret123!"))
+        self.assertFalse(User.objects.get(username="bob").has_usable_password())
+
+    def test_row_errors_are_reported_and_valid_rows_kept(self):
+        make_user("parent", username="taken")
+        data = self._post(
+            ",nouser@x.com,,,teacher,,\n"
+            "r1,r1@x.com,,,wizard,,\n"
+            f"r2,r2@x.com,,,teacher,{uuid.uuid4()},\n"
+            "taken,new@x.com,,,teacher,,\n"
+            "dup,dup@x.com,,,teacher,,\n"
+            "dup,dup2@x.com,,,teacher,,\n"
+            "ok,ok@x.com,,,learner,,\n"
+        )
+        self.assertEqual(data["created"], 2)
+        self.assertEqual(len(data["errors"]), 5)
+        self.assertTrue(data["errors"][0].startswith("Row 2: Missing fields"))
+        self.assertIn("Invalid role", data["errors"][1])
+        self.assertIn("not found", data["errors"][2])
+        self.assertEqual(User.objects.filter(username__in=["dup", "ok"]).count(), 2)
+
+    def test_dry_run_validates_without_writing(self):
+        data = self._post(
+            "amy,amy@x.com,,,teacher,,pw\nbad,bad@x.com,,,nope,,\n", dry_run="true"
+        )
+        self.assertTrue(data["dry_run"])
+        self.assertEqual((data["created"], data["valid"]), (0, 1))
+        self.assertEqual(len(data["errors"]), 1)
+        self.assertFalse(User.objects.filter(username="amy").exists())
+
+    def test_query_count_does_not_grow_per_row(self):
+        body = "".join(f"u{i},u{i}@x.com,,,learner,,\n" for i in range(40))
+        # schools map, username clash, email clash, bulk insert, savepoints
+        with self.assertNumQueries(6):
+            self.client.post(URL, {"file": upload(body)}, format="multipart")
+        self.assertEqual(User.objects.filter(username__startswith="u").count(), 40)
+
+    def test_derived_stats_are_resynced(self):
+        counters.reconcile()
+        with self.captureOnCommitCallbacks(execute=True):
+            self._post(f"amy,amy@x.com,,,teacher,{self.school.id},\n")
+        self.assertEqual(counters.get_all()["teachers"], 1)
+        row = DailySchoolStats.objects.get(
+            school=self.school, date=timezone.localdate()
+        )
+        self.assertEqual(row.new_users, 1)
+
+    @override_settings(USER_IMPORT_PARALLEL_THRESHOLD=2, USER_IMPORT_HASH_WORKERS=2)
+    def test_process_pool_hashing(self):
+        body = "".join(f"p{i},p{i}@x.com,,,learner,,Pass{i}word!\n" for i in range(4))
+        data = self._post(body)
+        self.assertEqual(data["created"], 4)
+        self.assertTrue(User.objects.get(username="p3").check_password("Pass3word!"))
+
+    def test_rejects_non_csv(self):
+        r = self.client.post(
+            URL,
+            {"file": SimpleUploadedFile("x.txt", b"a")},
+            format="multipart",
+        )
+        self.assertEqual(r.status_code, 400)
@@ -1,11 +1,13 @@
 import { useCallback, useEffect, useState } from 'react';
 import { schoolStudentsService } from '../services/schoolStudentsService';
-import type { SchoolStudentDetail } from '../types';
+import type { SchoolStudentDetail, StudentHistoryName } from '../types';
 
 interface UseSchoolStudentDetailResult {
   loading: boolean;
   error: string | null;
   student: SchoolStudentDetail | null;
+  hasMore: (name: StudentHistoryName) => boolean;
+  loadMore: (name: StudentHistoryName) => Promise<void>;
   refresh: () => Promise<void>;
 }
 
@@ -16,6 +18,9 @@ export const useSchoolStudentDetail = (
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [student, setStudent] = useState<SchoolStudentDetail | null>(null);
+  // The detail embeds only the newest rows; once a history page is loaded its
+  // next_cursor (null at the end) decides whether more remain.
+  const [cursors, setCursors] = useState<Partial<Record<StudentHistoryName, string | null>>>({});
 
   const fetchStudent = useCallback(async () => {
     if (!studentId || !enabled) {
@@ -27,6 +32,7 @@ export const useSchoolStudentDetail = (
       setError(null);
       const detail = await schoolStudentsService.getStudentDetail(studentId);
       setStudent(detail);
+      setCursors({});
     } catch (err) {
       console.error('Failed to fetch school student detail', err);
       setError('Unable to load student details. Please try again.');
@@ -40,10 +46,36 @@ export const useSchoolStudentDetail = (
     fetchStudent();
   }, [fetchStudent]);
 
+  const loadMore = useCallback(async (name: StudentHistoryName) => {
+    if (!studentId) {
+      return;
+    }
+    try {
+      const cursor = cursors[name];
+      const page = await schoolStudentsService.getHistoryPage(studentId, name, cursor ?? undefined);
+      setStudent((prev) => prev && {
+        ...prev,
+        [name]: cursor ? [...prev[name], ...page.results] : page.results,
+      });
+      setCursors((prev) => ({ ...prev, [name]: page.nextCursor }));
+    } catch (err) {
+      console.error(`Failed to fetch ${name} history`, err);
+    }
+  }, [studentId, cursors]);
+
+  const hasMore = useCallback((name: StudentHistoryName) => {
+    if (!student) {
+      return false;
+    }
+    return name in cursors ? Boolean(cursors[name]) : student[name].length < student.totals[name];
+  }, [student, cursors]);
+
   return {
     loading,
     error,
     student,
+    hasMore,
+    loadMore,
     refresh: fetchStudent,
   };
 };
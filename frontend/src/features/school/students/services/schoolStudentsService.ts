@@ -1,5 +1,10 @@
 import { schoolApi } from '@/lib/api';
-import type { SchoolStudentDetail, StudentArtifactMedia, StudentArtifactSummary } from '../types';
+import type {
+  SchoolStudentDetail,
+  StudentArtifactMedia,
+  StudentArtifactSummary,
+  StudentHistoryName,
+} from '../types';
 
 type RawProgress = Record<string, unknown>;
 type RawBadge = Record<string, unknown>;
@@ -18,6 +23,7 @@ type RawStudentDetail = Record<string, unknown> & {
   artifacts?: RawArtifact[];
   attendance?: RawAttendance[];
   pathways?: RawPathway[];
+  totals?: { badges?: number; artifacts?: number; attendance?: number };
   user?: { username?: string };
 };
 
@@ -109,11 +115,35 @@ const mapStudentDetail = (data: RawStudentDetail): SchoolStudentDetail => ({
   badges: mapBadges(data.badges),
   artifacts: mapArtifacts(data.artifacts),
   attendance: mapAttendance(data.attendance),
+  totals: {
+    badges: Number(data.totals?.badges ?? data.badges?.length ?? 0),
+    artifacts: Number(data.totals?.artifacts ?? data.artifacts?.length ?? 0),
+    attendance: Number(data.totals?.attendance ?? data.attendance?.length ?? 0),
+  },
 });
 
+const historyEndpoints = {
+  badges: { fetch: schoolApi.students.getBadges, map: mapBadges },
+  artifacts: { fetch: schoolApi.students.getArtifacts, map: mapArtifacts },
+  attendance: { fetch: schoolApi.students.getAttendance, map: mapAttendance },
+};
+
 export const schoolStudentsService = {
   async getStudentDetail(studentId: string): Promise<SchoolStudentDetail> {
     const response = await schoolApi.students.getById(studentId);
     return mapStudentDetail(response.data);
   },
+
+  async getHistoryPage<K extends StudentHistoryName>(
+    studentId: string,
+    name: K,
+    cursor?: string,
+  ): Promise<{ results: SchoolStudentDetail[K]; nextCursor: string | null }> {
+    const { fetch, map } = historyEndpoints[name];
+    const response = await fetch(studentId, cursor ? { cursor } : undefined);
+    return {
+      results: map(response.data?.results ?? []) as SchoolStudentDetail[K],
+      nextCursor: response.data?.next_cursor ?? null,
+    };
+  },
 };
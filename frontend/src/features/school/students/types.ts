@@ -76,4 +76,8 @@ export interface SchoolStudentDetail {
   badges: StudentBadgeSummary[];
   artifacts: StudentArtifactSummary[];
   attendance: StudentAttendanceRecord[];
+  // Full counts; the lists above hold only the most recent rows.
+  totals: { badges: number; artifacts: number; attendance: number };
 }
+
+export type StudentHistoryName = 'badges' | 'artifacts' | 'attendance';
@@ -17,7 +17,20 @@ import type { TeacherEnrollment } from './types';
 const StudentDetail = () => {
   const { id } = useParams<{ id: string }>();
   const navigate = useNavigate();
-  const { loading, error, student, badges, credentials, enrollments, artifacts, refresh } = useTeacherStudentDetail(id);
+  const {
+    loading,
+    error,
+    student,
+    badges,
+    credentials,
+    enrollments,
+    artifacts,
+    hasMoreBadges,
+    hasMoreArtifacts,
+    loadMoreBadges,
+    loadMoreArtifacts,
+    refresh,
+  } = useTeacherStudentDetail(id);
   const {
     isOpen,
     loading: progressLoading,
@@ -106,11 +119,16 @@ const StudentDetail = () => {
         <EnrollmentList enrollments={enrollments} onOpenProgress={handleOpenProgress} />
 
         <div className="grid gap-4 md:grid-cols-2">
-          <BadgeGrid badges={badges} />
+          <BadgeGrid badges={badges} onLoadMore={hasMoreBadges ? loadMoreBadges : undefined} />
           <CredentialList credentials={credentials} />
         </div>
 
         <ArtifactGallery artifacts={artifacts} />
+        {hasMoreArtifacts && (
+          <Button variant="outline" className="w-full" onClick={loadMoreArtifacts}>
+            Load more artifacts
+          </Button>
+        )}
       </div>
 
       <ProgressDialog
@@ -1,13 +1,15 @@
 import { motion } from 'framer-motion';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
+import { Button } from '@/components/ui/button';
 import { Award, Calendar, Medal } from 'lucide-react';
 import type { TeacherBadgeItem } from '../types';
 
 interface BadgeGridProps {
   badges: TeacherBadgeItem[];
+  onLoadMore?: () => void;
 }
 
-export const BadgeGrid = ({ badges }: BadgeGridProps) => (
+export const BadgeGrid = ({ badges, onLoadMore }: BadgeGridProps) => (
   <Card>
     <CardHeader>
       <CardTitle className="flex items-center gap-2">
@@ -57,6 +59,11 @@ export const BadgeGrid = ({ badges }: BadgeGridProps) => (
           <p>No badges earned yet</p>
         </div>
       )}
+      {onLoadMore && (
+        <Button variant="outline" className="w-full mt-4" onClick={onLoadMore}>
+          Load more
+        </Button>
+      )}
     </CardContent>
   </Card>
 );
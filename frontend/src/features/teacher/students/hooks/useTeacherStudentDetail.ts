@@ -16,9 +16,15 @@ interface UseTeacherStudentDetailResult {
   credentials: TeacherCredentialItem[];
   enrollments: TeacherEnrollment[];
   artifacts: TeacherArtifactItem[];
+  hasMoreBadges: boolean;
+  hasMoreArtifacts: boolean;
+  loadMoreBadges: () => Promise<void>;
+  loadMoreArtifacts: () => Promise<void>;
   refresh: () => Promise<void>;
 }
 
+type HistoryName = 'badges' | 'artifacts';
+
 export const useTeacherStudentDetail = (studentId?: string): UseTeacherStudentDetailResult => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -27,6 +33,10 @@ export const useTeacherStudentDetail = (studentId?: string): UseTeacherStudentDe
   const [credentials, setCredentials] = useState<TeacherCredentialItem[]>([]);
   const [enrollments, setEnrollments] = useState<TeacherEnrollment[]>([]);
   const [artifacts, setArtifacts] = useState<TeacherArtifactItem[]>([]);
+  const [totals, setTotals] = useState<Record<HistoryName, number>>({ badges: 0, artifacts: 0 });
+  // The detail embeds only the newest rows; once a history page is loaded its
+  // next_cursor (null at the end) decides whether more remain.
+  const [cursors, setCursors] = useState<Partial<Record<HistoryName, string | null>>>({});
 
   const fetchStudent = useCallback(async () => {
     if (!studentId) {
@@ -41,6 +51,11 @@ export const useTeacherStudentDetail = (studentId?: string): UseTeacherStudentDe
       setCredentials(response.credentials ?? []);
       setEnrollments(response.enrollments ?? []);
       setArtifacts(response.artifacts ?? []);
+      setTotals({
+        badges: response.totals?.badges ?? response.badges?.length ?? 0,
+        artifacts: response.totals?.artifacts ?? response.artifacts?.length ?? 0,
+      });
+      setCursors({});
       setError(null);
     } catch (err) {
       console.error('Failed to fetch student data', err);
@@ -59,6 +74,37 @@ export const useTeacherStudentDetail = (studentId?: string): UseTeacherStudentDe
     fetchStudent();
   }, [fetchStudent]);
 
+  const loadMoreBadges = useCallback(async () => {
+    if (!studentId) {
+      return;
+    }
+    try {
+      const cursor = cursors.badges;
+      const page = await teacherStudentsService.getBadgesPage(studentId, cursor ?? undefined);
+      setBadges((prev) => (cursor ? [...prev, ...page.results] : page.results));
+      setCursors((prev) => ({ ...prev, badges: page.nextCursor }));
+    } catch (err) {
+      console.error('Failed to fetch badge history', err);
+    }
+  }, [studentId, cursors.badges]);
+
+  const loadMoreArtifacts = useCallback(async () => {
+    if (!studentId) {
+      return;
+    }
+    try {
+      const cursor = cursors.artifacts;
+      const page = await teacherStudentsService.getArtifactsPage(studentId, cursor ?? undefined);
+      setArtifacts((prev) => (cursor ? [...prev, ...page.results] : page.results));
+      setCursors((prev) => ({ ...prev, artifacts: page.nextCursor }));
+    } catch (err) {
+      console.error('Failed to fetch artifact history', err);
+    }
+  }, [studentId, cursors.artifacts]);
+
+  const hasMore = (name: HistoryName, loaded: number) =>
+    name in cursors ? Boolean(cursors[name]) : loaded < totals[name];
+
   return {
     loading,
     error,
@@ -67,6 +113,10 @@ export const useTeacherStudentDetail = (studentId?: string): UseTeacherStudentDe
     credentials,
     enrollments,
     artifacts,
+    hasMoreBadges: hasMore('badges', badges.length),
+    hasMoreArtifacts: hasMore('artifacts', artifacts.length),
+    loadMoreBadges,
+    loadMoreArtifacts,
     refresh: fetchStudent,
   };
 };
@@ -1,5 +1,8 @@
 import { courseApi, enrollmentApi, progressApi, teacherApi } from '@/lib/api';
 import type {
+  TeacherArtifactItem,
+  TeacherBadgeItem,
+  TeacherHistoryPage,
   TeacherModuleOption,
   TeacherProgressData,
   TeacherStudentDetailResponse,
@@ -11,6 +14,16 @@ export const teacherStudentsService = {
     return response.data as TeacherStudentDetailResponse;
   },
 
+  async getBadgesPage(learnerId: string, cursor?: string): Promise<TeacherHistoryPage<TeacherBadgeItem>> {
+    const response = await teacherApi.students.getBadges(learnerId, cursor ? { cursor } : undefined);
+    return { results: response.data?.results ?? [], nextCursor: response.data?.next_cursor ?? null };
+  },
+
+  async getArtifactsPage(learnerId: string, cursor?: string): Promise<TeacherHistoryPage<TeacherArtifactItem>> {
+    const response = await teacherApi.students.getArtifacts(learnerId, cursor ? { cursor } : undefined);
+    return { results: response.data?.results ?? [], nextCursor: response.data?.next_cursor ?? null };
+  },
+
   async getEnrollmentProgress(enrollmentId: string): Promise<TeacherProgressData[]> {
     const response = await enrollmentApi.getProgress(enrollmentId);
     return Array.isArray(response.data) ? (response.data as TeacherProgressData[]) : [];
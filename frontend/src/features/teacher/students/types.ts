@@ -101,4 +101,12 @@ export interface TeacherStudentDetailResponse {
   credentials?: TeacherCredentialItem[];
   enrollments?: TeacherEnrollment[];
   artifacts?: TeacherArtifactItem[];
+  // Full counts; badges/artifacts above hold only the most recent rows.
+  totals?: { badges: number; artifacts: number };
+}
+
+// One page of a cursor-paginated history sub-resource.
+export interface TeacherHistoryPage<T> {
+  results: T[];
+  nextCursor: string | null;
 }
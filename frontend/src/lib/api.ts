@@ -291,6 +291,11 @@ export const teacherApi = {
     getAll: (params?: { search?: string; course_id?: string }) =>
       api.get('/api/teacher/students/', { params: withSelectedSchool(params || {}) }),
     getById: (id: string) => api.get(`/api/teacher/students/${id}/`, { params: withSelectedSchool({}) }),
+    // Cursor-paginated history ({ results, next_cursor, has_more })
+    getBadges: (id: string, params?: { cursor?: string; page_size?: number }) =>
+      api.get(`/api/teacher/students/${id}/badges/`, { params: withSelectedSchool(params || {}) }),
+    getArtifacts: (id: string, params?: { cursor?: string; page_size?: number }) =>
+      api.get(`/api/teacher/students/${id}/artifacts/`, { params: withSelectedSchool(params || {}) }),
     create: (data: any) => api.post('/api/teacher/students/', withSelectedSchool(data)),
     getSchools: () => api.get('/api/teacher/students/schools/', { params: withSelectedSchool({}) }),
     enroll: (data: {
@@ -461,6 +466,16 @@ export const progressApi = {
     assessment_score?: number;
     teacher_confirmed?: boolean;
   }) => api.post(`/api/progress/${id}/update_progress/`, data),
+
+  // Update progress for a whole class; all-or-nothing
+  bulkUpdate: (updates: Array<{
+    id: string;
+    modules_completed?: number;
+    completed_module_ids?: string[];
+    artifacts_submitted?: number;
+    assessment_score?: number;
+    teacher_confirmed?: boolean;
+  }>) => api.post('/api/progress/bulk-update/', { updates }),
   
   // Teacher confirms level completion
   confirmCompletion: (id: string) => api.post(`/api/progress/${id}/confirm_completion/`),
@@ -475,6 +490,45 @@ export const achievementApi = {
   getForLearner: (learnerId: string) => api.get(`/api/achievements/for-learner/${learnerId}/`),
 };
 
+// Quiz API
+export interface QuizQuestion {
+  question: string;
+  options: string[];
+  correct_answer?: number; // teacher views only
+}
+
+export const quizApi = {
+  // Teacher authoring
+  getAll: () => api.get('/api/teacher/quizzes/', { params: withSelectedSchool({}) }),
+  create: (data: {
+    title: string;
+    description?: string;
+    module?: string | null;
+    questions: QuizQuestion[];
+    passing_score?: number;
+    time_limit_minutes?: number | null;
+    is_active?: boolean;
+  }) => api.post('/api/teacher/quizzes/', withSelectedSchool(data)),
+  update: (id: string, data: Partial<{
+    title: string;
+    questions: QuizQuestion[];
+    passing_score: number;
+    time_limit_minutes: number | null;
+    is_active: boolean;
+  }>) => api.patch(`/api/teacher/quizzes/${id}/`, withSelectedSchool(data)),
+  delete: (id: string) => api.delete(`/api/teacher/quizzes/${id}/`, { params: withSelectedSchool({}) }),
+  getAttempts: (id: string) => api.get(`/api/teacher/quizzes/${id}/attempts/`, { params: withSelectedSchool({}) }),
+  regrade: (id: string) => api.post(`/api/teacher/quizzes/${id}/regrade/`, withSelectedSchool({})),
+  getItemStats: (id: string) => api.get(`/api/teacher/quizzes/${id}/item-stats/`, { params: withSelectedSchool({}) }),
+
+  // Student taking
+  getAvailable: () => api.get('/api/student/quizzes/'),
+  getMyAttempts: () => api.get('/api/student/quizzes/attempts/'),
+  start: (id: string) => api.post(`/api/student/quizzes/${id}/start/`),
+  submit: (id: string, answers: number[]) =>
+    api.post(`/api/student/quizzes/${id}/submit/`, { answers }),
+};
+
 // Activity API
 export const activityApi = {
   // Get all activities
@@ -593,20 +647,24 @@ export const schoolApi = {
   },
 
   badges: {
-      getAll: () => api.get('/api/school/dashboard/badges/'),
+      getAll: (params?: any) => api.get('/api/school/dashboard/badges/', { params }),
   },
 
   artifacts: {
-      getAll: () => api.get('/api/school/dashboard/artifacts/'),
+      getAll: (params?: any) => api.get('/api/school/dashboard/artifacts/', { params }),
   },
 
   progress: {
-      getAll: () => api.get('/api/school/dashboard/progress/'),
+      getAll: (params?: any) => api.get('/api/school/dashboard/progress/', { params }),
   },
 
   students: {
     getAll: (params?: any) => api.get('/api/school/students/', { params }),
     getById: (id: string) => api.get(`/api/school/students/${id}/`),
+    // Cursor-paginated history ({ results, next_cursor, has_more })
+    getBadges: (id: string, params?: any) => api.get(`/api/school/students/${id}/badges/`, { params }),
+    getArtifacts: (id: string, params?: any) => api.get(`/api/school/students/${id}/artifacts/`, { params }),
+    getAttendance: (id: string, params?: any) => api.get(`/api/school/students/${id}/attendance/`, { params }),
     create: (data: any) => api.post('/api/school/students/', data),
     update: (id: string, data: any) => api.put(`/api/school/students/${id}/`, data),
     delete: (id: string) => api.delete(`/api/school/students/${id}/`),
@@ -630,6 +688,6 @@ export const schoolApi = {
   },
 
   sessions: {
-    getAll: () => api.get('/api/school/dashboard/sessions/'),
+    getAll: (params?: any) => api.get('/api/school/dashboard/sessions/', { params }),
   },
 };
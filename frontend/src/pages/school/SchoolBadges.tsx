@@ -39,10 +39,14 @@ export default function SchoolBadges() {
     const [loading, setLoading] = useState(true);
     const [searchTerm, setSearchTerm] = useState("");
 
+    const [badgesCursor, setBadgesCursor] = useState<string | null>(null);
+    const [artifactsCursor, setArtifactsCursor] = useState<string | null>(null);
+
     useEffect(() => {
         fetchData();
     }, []);
 
+    // Both lists are cursor-paginated; "Load more" appends the next page.
     const fetchData = async () => {
         try {
             setLoading(true);
@@ -51,8 +55,10 @@ export default function SchoolBadges() {
                 schoolApi.artifacts.getAll()
             ]);
 
-            setBadges(badgesRes.data || []);
-            setArtifacts(artifactsRes.data || []);
+            setBadges(badgesRes.data?.results || []);
+            setBadgesCursor(badgesRes.data?.next_cursor || null);
+            setArtifacts(artifactsRes.data?.results || []);
+            setArtifactsCursor(artifactsRes.data?.next_cursor || null);
             setLoading(false);
         } catch (error) {
             console.error("Failed to fetch data:", error);
@@ -60,6 +66,26 @@ export default function SchoolBadges() {
         }
     };
 
+    const loadMoreBadges = async (cursor: string) => {
+        try {
+            const response = await schoolApi.badges.getAll({ cursor });
+            setBadges(prev => [...prev, ...(response.data?.results || [])]);
+            setBadgesCursor(response.data?.next_cursor || null);
+        } catch (error) {
+            console.error("Failed to fetch badges:", error);
+        }
+    };
+
+    const loadMoreArtifacts = async (cursor: string) => {
+        try {
+            const response = await schoolApi.artifacts.getAll({ cursor });
+            setArtifacts(prev => [...prev, ...(response.data?.results || [])]);
+            setArtifactsCursor(response.data?.next_cursor || null);
+        } catch (error) {
+            console.error("Failed to fetch artifacts:", error);
+        }
+    };
+
     const filteredBadges = badges.filter(badge =>
         badge.student_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
         badge.badge_name.toLowerCase().includes(searchTerm.toLowerCase())
@@ -119,11 +145,11 @@ export default function SchoolBadges() {
                     <TabsList className="grid w-full grid-cols-2">
                         <TabsTrigger value="badges">
                             <Award className="h-4 w-4 mr-2" />
-                            Badges ({filteredBadges.length})
+                            Badges ({filteredBadges.length}{badgesCursor && " loaded"})
                         </TabsTrigger>
                         <TabsTrigger value="artifacts">
                             <FileText className="h-4 w-4 mr-2" />
-                            Artifacts ({filteredArtifacts.length})
+                            Artifacts ({filteredArtifacts.length}{artifactsCursor && " loaded"})
                         </TabsTrigger>
                     </TabsList>
 
@@ -186,6 +212,15 @@ export default function SchoolBadges() {
                                         ))}
                                     </div>
                                 )}
+                                {badgesCursor && (
+                                    <Button
+                                        variant="outline"
+                                        className="w-full mt-4"
+                                        onClick={() => loadMoreBadges(badgesCursor)}
+                                    >
+                                        Load more
+                                    </Button>
+                                )}
                             </CardContent>
                         </Card>
                     </TabsContent>
@@ -261,6 +296,15 @@ export default function SchoolBadges() {
                                         ))}
                                     </div>
                                 )}
+                                {artifactsCursor && (
+                                    <Button
+                                        variant="outline"
+                                        className="w-full mt-4"
+                                        onClick={() => loadMoreArtifacts(artifactsCursor)}
+                                    >
+                                        Load more
+                                    </Button>
+                                )}
                             </CardContent>
                         </Card>
                     </TabsContent>
@@ -85,8 +85,18 @@ export default function SchoolDashboard() {
 
                 // Fetch Sessions
                 try {
-                    const sessionsResponse = await schoolApi.sessions.getAll();
-                    setSessions(Array.isArray(sessionsResponse.data) ? sessionsResponse.data : []);
+                    // The feed is cursor-paginated; walk every page of the window
+                    const allSessions: SchoolSession[] = [];
+                    let cursor: string | null = null;
+                    do {
+                        const sessionsResponse: any = await schoolApi.sessions.getAll({
+                            page_size: 200,
+                            ...(cursor ? { cursor } : {}),
+                        });
+                        allSessions.push(...(sessionsResponse.data?.results || []));
+                        cursor = sessionsResponse.data?.next_cursor || null;
+                    } while (cursor);
+                    setSessions(allSessions);
                 } catch {
                     setSessions([]);
                 }
@@ -275,7 +285,7 @@ export default function SchoolDashboard() {
                             <CalendarClock className="h-5 w-5" style={{ color: "var(--fundi-orange)" }} />
                             Teacher Sessions
                         </CardTitle>
-                        <CardDescription>All teaching sessions at your school — past, present, and upcoming</CardDescription>
+                        <CardDescription>Teaching sessions from the past week and the coming month</CardDescription>
                     </CardHeader>
                     <CardContent>
                         {sessions.length === 0 ? (
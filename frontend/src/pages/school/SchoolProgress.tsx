@@ -11,6 +11,7 @@ import { motion } from "framer-motion";
 
 interface StudentProgress {
     id: string;
+    enrollment_id: string;
     student_name: string;
     student_email: string;
     course_name: string;
@@ -31,20 +32,29 @@ export default function SchoolProgress() {
     const [loading, setLoading] = useState(true);
     const [searchTerm, setSearchTerm] = useState("");
     const [filterStatus, setFilterStatus] = useState<string>("all");
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
 
-    const fetchProgressData = useCallback(async () => {
+    // Filtering and paging happen server-side; "Load more" appends the next page.
+    const fetchProgressData = useCallback(async (cursor?: string) => {
         try {
-            const response = await schoolApi.progress.getAll();
-            setProgressData(response.data || []);
+            const params: Record<string, string> = {};
+            if (searchTerm) params.search = searchTerm;
+            if (filterStatus !== "all") params.status = filterStatus;
+            if (cursor) params.cursor = cursor;
+            const response = await schoolApi.progress.getAll(params);
+            const results: StudentProgress[] = response.data?.results || [];
+            setProgressData(prev => (cursor ? [...prev, ...results] : results));
+            setNextCursor(response.data?.next_cursor || null);
             setLoading(false);
         } catch (error) {
             console.error("Failed to fetch progress data:", error);
             setLoading(false);
         }
-    }, []);
+    }, [searchTerm, filterStatus]);
 
     useEffect(() => {
-        fetchProgressData();
+        const timer = setTimeout(() => fetchProgressData(), 300);
+        return () => clearTimeout(timer);
     }, [fetchProgressData]);
 
     const getStatusColor = (status: string) => {
@@ -73,13 +83,6 @@ export default function SchoolProgress() {
         }
     };
 
-    const filteredProgress = progressData.filter(item => {
-        const matchesSearch = item.student_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-            item.course_name.toLowerCase().includes(searchTerm.toLowerCase());
-        const matchesFilter = filterStatus === "all" || item.status === filterStatus;
-        return matchesSearch && matchesFilter;
-    });
-
     if (loading) {
         return (
             <div className="flex items-center justify-center min-h-screen">
@@ -141,12 +144,12 @@ export default function SchoolProgress() {
                     <CardHeader>
                         <CardTitle className="flex items-center gap-2">
                             <TrendingUp className="h-5 w-5" style={{ color: "var(--fundi-pink)" }} />
-                            Student Progress ({filteredProgress.length})
+                            Student Progress ({progressData.length})
                         </CardTitle>
                         <CardDescription>Track student performance and completion</CardDescription>
                     </CardHeader>
                     <CardContent>
-                        {filteredProgress.length === 0 ? (
+                        {progressData.length === 0 ? (
                             <div className="text-center py-12">
                                 <TrendingUp className="h-16 w-16 mx-auto mb-4 text-gray-400" />
                                 <p className="text-gray-600 text-lg font-semibold mb-2">No Progress Data Found</p>
@@ -156,11 +159,11 @@ export default function SchoolProgress() {
                             </div>
                         ) : (
                             <div className="space-y-4">
-                                {filteredProgress.map((item, index) => {
+                                {progressData.map((item, index) => {
                                     const statusColors = getStatusColor(item.status);
                                     return (
                                         <motion.div
-                                            key={item.id}
+                                            key={item.enrollment_id}
                                             initial={{ opacity: 0, y: 20 }}
                                             animate={{ opacity: 1, y: 0 }}
                                             transition={{ duration: 0.3, delay: index * 0.05 }}
@@ -249,6 +252,15 @@ export default function SchoolProgress() {
                                         </motion.div>
                                     );
                                 })}
+                                {nextCursor && (
+                                    <Button
+                                        variant="outline"
+                                        className="w-full"
+                                        onClick={() => fetchProgressData(nextCursor)}
+                                    >
+                                        Load more
+                                    </Button>
+                                )}
                             </div>
                         )}
                     </CardContent>
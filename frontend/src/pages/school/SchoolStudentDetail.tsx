@@ -30,6 +30,12 @@ const EmptyState = ({ message }: { message: string }) => (
   </div>
 );
 
+const LoadMoreButton = ({ onClick }: { onClick: () => void }) => (
+  <Button variant="outline" className="w-full" onClick={onClick}>
+    Load more
+  </Button>
+);
+
 const PathwayPills = ({ student }: { student: SchoolStudentDetail }) => (
   <div className="flex flex-wrap gap-2">
     {student.pathways.length === 0 && <Badge variant="secondary">No pathways</Badge>}
@@ -143,7 +149,7 @@ const Header = ({ student, onBack }: { student: SchoolStudentDetail; onBack: ()
 const SchoolStudentDetailPage = () => {
   const { id } = useParams<{ id: string }>();
   const navigate = useNavigate();
-  const { loading, error, student, refresh } = useSchoolStudentDetail(id);
+  const { loading, error, student, hasMore, loadMore, refresh } = useSchoolStudentDetail(id);
 
   const handleBack = useCallback(() => {
     navigate('/school/students');
@@ -231,9 +237,10 @@ const SchoolStudentDetailPage = () => {
           <CardContent className="space-y-4 p-6">
             <div className="flex items-center gap-2 text-lg font-semibold" style={{ color: 'var(--fundi-black)' }}>
               <Award className="h-5 w-5 text-[var(--fundi-orange)]" />
-              Badges
+              Badges ({student.totals.badges})
             </div>
             <BadgeGrid student={student} />
+            {hasMore('badges') && <LoadMoreButton onClick={() => loadMore('badges')} />}
           </CardContent>
         </Card>
 
@@ -241,9 +248,10 @@ const SchoolStudentDetailPage = () => {
           <CardContent className="space-y-4 p-6">
             <div className="flex items-center gap-2 text-lg font-semibold" style={{ color: 'var(--fundi-black)' }}>
               <Archive className="h-5 w-5 text-[var(--fundi-cyan)]" />
-              Artifacts
+              Artifacts ({student.totals.artifacts})
             </div>
             <ArtifactGallery artifacts={artifactCards} />
+            {hasMore('artifacts') && <LoadMoreButton onClick={() => loadMore('artifacts')} />}
           </CardContent>
         </Card>
 
@@ -251,9 +259,10 @@ const SchoolStudentDetailPage = () => {
           <CardContent className="space-y-4 p-6">
             <div className="flex items-center gap-2 text-lg font-semibold" style={{ color: 'var(--fundi-black)' }}>
               <Clock className="h-5 w-5 text-[var(--fundi-lime)]" />
-              Attendance History
+              Attendance History ({student.totals.attendance})
             </div>
             <AttendanceList student={student} />
+            {hasMore('attendance') && <LoadMoreButton onClick={() => loadMore('attendance')} />}
           </CardContent>
         </Card>
       </div>